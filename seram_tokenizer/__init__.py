@@ -1,4 +1,50 @@
-from .tokenizer import SeramTokenizer
-from .find_words import find_unmatched_words, DICTIONARY_WORDS
-from .paragog_normaliser import GeserParagogNormalizer
-from .suffix_analayser import SuffixAnalyser
\ No newline at end of file
+import importlib
+from typing import Any, List
+
+# Public names and the submodule that defines each of them. Submodules are
+# imported on first access, so ``import seram_tokenizer`` is cheap and does no
+# file I/O; the lexicon itself is only read once it is actually needed.
+_EXPORTS = {
+    'SeramTokenizer': 'tokenizer',
+    'Tokenizer': 'tokenizer',
+    'MultilingualTokenizer': 'tokenizer',
+    'find_unmatched_words': 'find_words',
+    'DICTIONARY_WORDS': 'find_words',
+    'OOVAnalyzer': 'oov',
+    'FuzzyIndex': 'fuzzy',
+    'GeserParagogNormalizer': 'paragog_normaliser',
+    'SuffixAnalyser': 'suffix_analayser',
+    'ParallelTokenizer': 'parallel',
+    'CachedTokenizer': 'cache',
+    'TokenCache': 'cache',
+    'TokenizationServer': 'server',
+    'TokenizationClient': 'server',
+    'SubwordModel': 'subword',
+    'PhraseMatcher': 'phrases',
+    'AffixEngine': 'affixes',
+    'AffixRule': 'affixes',
+    'Lexicon': 'lexicon',
+    'get_lexicon': 'lexicon',
+    'LanguageProfile': 'languages',
+    'get_language': 'languages',
+    'register_language': 'languages',
+    'TokenSpans': 'spans',
+    'TokenizationSession': 'incremental',
+    'build_snapshot': 'snapshot',
+    'open_snapshot': 'snapshot',
+    'Vocabulary': 'vocab',
+    'TokenizedDataset': 'dataset',
+    'export_dataset': 'dataset',
+    'PipelineProfiler': 'profiling',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f'.{module_name}', __name__), name)
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
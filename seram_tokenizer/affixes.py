@@ -0,0 +1,165 @@
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from .lexicon import Lexicon, get_lexicon
+
+PREFIX = 'prefix'
+SUFFIX = 'suffix'
+
+class AffixRule(NamedTuple):
+    """
+    A declarative affix-splitting rule.
+
+    A word is split by a rule when it carries the affix, is not itself a
+    single-word lemma of the lexicon and, if ``context`` is set, the letter
+    next to the affix (the one before a suffix, after a prefix) belongs to
+    that letter set of the lexicon.
+
+    Attributes:
+        affix (str): The affix as written in the word, e.g. 'ra'.
+        kind (str): PREFIX or SUFFIX.
+        context (Optional[str]): Name of a Lexicon letter set, 'vowels' or
+            'consonants', the neighbouring letter must belong to. None means
+            no phonological condition.
+    """
+    affix: str
+    kind: str
+    context: Optional[str] = None
+
+    @property
+    def marker(self) -> str:
+        """The token emitted for the affix, e.g. '_ra' or 'na_'."""
+        return f'{self.affix}_' if self.kind == PREFIX else f'_{self.affix}'
+
+    def claims(self, word: str) -> bool:
+        """Whether the word carries the affix at the rule's end of the word."""
+        return word.startswith(self.affix) if self.kind == PREFIX else word.endswith(self.affix)
+
+    def split(self, word: str, lexicon: Lexicon) -> Optional[Tuple[str, str]]:
+        """
+        Applies the rule to a word that carries the affix.
+
+        Args:
+            word (str): A lower-case alphabetic word claimed by this rule.
+            lexicon (Lexicon): Lexicon providing lemmas and letter sets.
+
+        Returns:
+            Optional[Tuple[str, str]]: The base and the marker in text order,
+            or None if the rule's conditions do not hold.
+        """
+        if word in lexicon.single_words:
+            return None
+
+        size = len(self.affix)
+        if self.kind == PREFIX:
+            if self.context is not None:
+                if len(word) <= size or word[size] not in getattr(lexicon, self.context):
+                    return None
+            return (self.marker, word[size:])
+
+        if self.context is not None:
+            if len(word) <= size or word[-size - 1] not in getattr(lexicon, self.context):
+                return None
+        return (word[:-size], self.marker)
+
+# Suffixes are tried before prefixes. Within each kind the first rule claiming a
+# word (by affix shape) decides whether it is split, so longer affixes that end
+# (or start) with a shorter one must come first, e.g. 'ra' before 'a'.
+DEFAULT_AFFIX_RULES: Tuple[AffixRule, ...] = (
+    AffixRule('ra', SUFFIX, context='vowels'),
+    AffixRule('a', SUFFIX, context='consonants'),
+    AffixRule('na', PREFIX),
+    AffixRule('da', PREFIX),
+)
+
+class AffixEngine:
+    """
+    Splits affixes off words according to a table of AffixRule.
+
+    Every word needs at most one rule lookup per affix kind plus constant-time
+    set lookups, and a token list is processed in a single pass, so adding a
+    rule does not add another pass over the text.
+
+    Attributes:
+        rules (Tuple[AffixRule, ...]): The active rules, in priority order.
+    """
+
+    def __init__(self, rules: Iterable[AffixRule] = DEFAULT_AFFIX_RULES,
+                 lexicon: Optional[Lexicon] = None):
+        """
+        Initializes the AffixEngine.
+
+        Args:
+            rules (Iterable[AffixRule]): The rules to apply. Defaults to the
+                '_ra', '_a', 'na_' and 'da_' rules.
+            lexicon (Optional[Lexicon]): Lexicon providing lemmas and letter
+                sets. Defaults to the shared Geser lexicon.
+
+        Raises:
+            ValueError: If a rule has an unknown kind, an empty affix or an
+                unknown context.
+        """
+        self.rules = tuple(rules)
+        for rule in self.rules:
+            if rule.kind not in (PREFIX, SUFFIX):
+                raise ValueError(f"Unknown affix kind: '{rule.kind}'")
+            if not rule.affix:
+                raise ValueError("Affix rules need a non-empty affix.")
+            if rule.context not in (None, 'vowels', 'consonants'):
+                raise ValueError(f"Unknown affix context: '{rule.context}'")
+
+        # Group by kind, keeping the order in which kinds first appear; suffix
+        # rules come first when both kinds are present, as in DEFAULT_AFFIX_RULES.
+        self._groups: List[Tuple[AffixRule, ...]] = []
+        for kind in (SUFFIX, PREFIX):
+            group = tuple(rule for rule in self.rules if rule.kind == kind)
+            if group:
+                self._groups.append(group)
+        self._lexicon = lexicon
+
+    @property
+    def lexicon(self) -> Lexicon:
+        """The lexicon used to recognise lemmas."""
+        if self._lexicon is None:
+            self._lexicon = get_lexicon()
+        return self._lexicon
+
+    def split(self, word: str) -> Tuple[str, ...]:
+        """
+        Splits the affix off a single word, if a rule applies.
+
+        Only alphabetic, lower-case words are candidates.
+
+        Args:
+            word (str): The word to analyse.
+
+        Returns:
+            Tuple[str, ...]: The word itself, or its base and affix marker.
+        """
+        if not word.isalpha() or word.lower() != word:
+            return (word,)
+
+        lexicon = self.lexicon
+        for group in self._groups:
+            for rule in group:
+                if rule.claims(word):
+                    pieces = rule.split(word, lexicon)
+                    if pieces is not None:
+                        return pieces
+                    break
+        return (word,)
+
+    def apply(self, tokens: Iterable[str]) -> List[str]:
+        """
+        Splits affixes off every token of a token list in one pass.
+
+        Args:
+            tokens (Iterable[str]): Tokens, e.g. as produced by a Tokenizer.
+
+        Returns:
+            List[str]: The tokens with affix markers split off.
+        """
+        split = self.split
+        result: List[str] = []
+        extend = result.extend
+        for token in tokens:
+            extend(split(token))
+        return result
@@ -0,0 +1,396 @@
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from .lexicon import get_lexicon
+from .parallel import batched
+from .tokenizer import Tokenizer
+
+# Tokenizer options of every benchmarked mode.
+MODES: Dict[str, Dict[str, bool]] = {
+    'plain': {},
+    'suffix': {'use_suffix': True},
+    'prefix': {'use_prefix': True},
+    'both': {'use_suffix': True, 'use_prefix': True},
+    'normalize': {'use_suffix': True, 'normalize_paragog': True},
+}
+
+VARIANTS = ('mixed', 'reduplication', 'affix')
+
+DEFAULT_SIZES = (1 << 10, 100 << 10, 10 << 20)
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_DATASET = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               'dataset_seram_geser.csv')
+
+# Tracked metrics and whether a higher value is better.
+METRICS: Dict[str, bool] = {
+    'import_seconds': False,
+    'first_tokenize_seconds': False,
+    'mb_per_second': True,
+    'tokens_per_second': True,
+    'latency_p50_us': False,
+    'latency_p95_us': False,
+    'latency_p99_us': False,
+    'peak_memory_kb': False,
+}
+
+_BATCH_SIZE = 1000
+_LATENCY_SAMPLES = 2000
+_PUNCTUATION = ('.', ',', '?', '!')
+
+_IMPORT_PROBE = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "from seram_tokenizer import Tokenizer\n"
+    "imported = time.perf_counter()\n"
+    "Tokenizer(use_suffix=True, use_prefix=True).tokenize('aku fas nugu')\n"
+    "print(imported - start, time.perf_counter() - imported)\n"
+)
+
+def synthetic_corpus(size: int, variant: str = 'mixed', seed: int = 0) -> List[str]:
+    """
+    Generates a corpus of Geser-like sentences, one per line.
+
+    Words are drawn from the shared lexicon, so affix rules see real lemmas.
+    The 'reduplication' variant makes most words reduplicated ('lari-lari'),
+    the 'affix' variant attaches '_ra' / '_a' suffixes, 'na_' / 'da_' prefixes
+    and detached paragog particles to most words.
+
+    Args:
+        size (int): Approximate corpus size in bytes of UTF-8 text.
+        variant (str): One of VARIANTS.
+        seed (int): Seed of the random generator; equal seeds give equal corpora.
+
+    Returns:
+        List[str]: The sentences.
+
+    Raises:
+        ValueError: If variant is unknown.
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"Unknown corpus variant: '{variant}'")
+
+    rng = random.Random(seed)
+    lexicon = get_lexicon()
+    words = sorted(word for word in lexicon.single_words if word.isalpha())
+    vowels = lexicon.vowels
+
+    def make_word() -> str:
+        word = rng.choice(words)
+        roll = rng.random()
+        if variant == 'reduplication' and roll < 0.7:
+            return f'{word}-{word}'
+        if variant == 'affix' and roll < 0.8:
+            if roll < 0.3:
+                return word + ('ra' if word[-1] in vowels else 'a')
+            if roll < 0.5:
+                return rng.choice(('na', 'da')) + word
+            return f"{word} {rng.choice(('a', 'ra'))}"
+        if variant == 'mixed' and roll < 0.1:
+            return f'{word}-{word}'
+        return word
+
+    sentences: List[str] = []
+    total = 0
+    while total < size:
+        sentence = ' '.join(make_word() for _ in range(rng.randint(3, 12)))
+        if rng.random() < 0.5:
+            sentence += rng.choice(_PUNCTUATION)
+        sentences.append(sentence)
+        total += len(sentence.encode('utf-8')) + 1
+    return sentences
+
+def load_dataset(path: str = DEFAULT_DATASET) -> List[str]:
+    """
+    Reads the Geser sentences of the bundled parallel dataset.
+
+    Args:
+        path (str): Path to ``dataset_seram_geser.csv``.
+
+    Returns:
+        List[str]: The Geser column, one sentence per row.
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='') as file:
+        return [row[1] for row in csv.reader(file) if len(row) > 1]
+
+def measure_import(runs: int = 3) -> Dict[str, float]:
+    """
+    Measures cold import time and the first tokenization (which loads the lexicon).
+
+    Each run uses a fresh interpreter; the median of the runs is reported.
+
+    Args:
+        runs (int): Number of interpreter launches.
+
+    Returns:
+        Dict[str, float]: 'import_seconds' and 'first_tokenize_seconds'.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [root, env.get('PYTHONPATH')]))
+    imports: List[float] = []
+    firsts: List[float] = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', _IMPORT_PROBE], env=env, check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True).stdout
+        imported, first = output.split()
+        imports.append(float(imported))
+        firsts.append(float(first))
+    return {'import_seconds': sorted(imports)[runs // 2],
+            'first_tokenize_seconds': sorted(firsts)[runs // 2]}
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending sequence."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def measure_tokenizer(tokenizer: Tokenizer, texts: Sequence[str], repeat: int = 3,
+                      memory: bool = True) -> Dict[str, float]:
+    """
+    Measures throughput, per-call latency and peak memory of a tokenizer on a corpus.
+
+    Throughput is the best of ``repeat`` batched passes over the corpus.
+    Latency is timed per ``tokenize`` call over a sample of the texts. Peak
+    memory is the largest traced allocation during one extra pass, with a cold
+    affix cache.
+
+    Args:
+        tokenizer (Tokenizer): The tokenizer to measure.
+        texts (Sequence[str]): The corpus.
+        repeat (int): Number of timed throughput passes.
+        memory (bool): Whether to measure peak memory (slows the run down).
+
+    Returns:
+        Dict[str, float]: The measured metrics.
+    """
+    size = sum(len(text.encode('utf-8')) + 1 for text in texts)
+    tokens = 0
+    best = float('inf')
+    for _ in range(repeat):
+        tokens = 0
+        start = time.perf_counter()
+        for batch in batched(texts, _BATCH_SIZE):
+            for row in tokenizer.tokenize_batch(batch):
+                tokens += len(row)
+        best = min(best, time.perf_counter() - start)
+    best = max(best, 1e-9)
+
+    step = max(1, len(texts) // _LATENCY_SAMPLES)
+    latencies: List[float] = []
+    clock = time.perf_counter
+    tokenize = tokenizer.tokenize
+    for text in texts[::step]:
+        start = clock()
+        tokenize(text)
+        latencies.append((clock() - start) * 1e6)
+    latencies.sort()
+
+    result = {
+        'bytes': size,
+        'texts': len(texts),
+        'tokens': tokens,
+        'seconds': best,
+        'mb_per_second': size / best / 1e6,
+        'tokens_per_second': tokens / best,
+        'latency_p50_us': _percentile(latencies, 0.50),
+        'latency_p95_us': _percentile(latencies, 0.95),
+        'latency_p99_us': _percentile(latencies, 0.99),
+    }
+
+    if memory:
+        tokenizer.clear_cache()
+        tracemalloc.start()
+        try:
+            for batch in batched(texts, _BATCH_SIZE):
+                tokenizer.tokenize_batch(batch)
+            result['peak_memory_kb'] = tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+    return result
+
+def _size_label(size: int) -> str:
+    for unit, shift in (('MB', 20), ('KB', 10)):
+        if size >= 1 << shift and size % (1 << shift) == 0:
+            return f'{size >> shift}{unit}'
+    return f'{size}B'
+
+def run_benchmarks(sizes: Iterable[int] = DEFAULT_SIZES, variants: Iterable[str] = VARIANTS,
+                   modes: Iterable[str] = tuple(MODES), dataset: Optional[str] = DEFAULT_DATASET,
+                   repeat: int = 3, memory: bool = True, import_time: bool = True,
+                   log=None) -> Dict[str, object]:
+    """
+    Runs the benchmark suite.
+
+    Every corpus (the bundled dataset plus one synthetic corpus per size and
+    variant) is tokenized in every mode.
+
+    Args:
+        sizes (Iterable[int]): Synthetic corpus sizes in bytes.
+        variants (Iterable[str]): Synthetic corpus variants.
+        modes (Iterable[str]): Names of MODES to run.
+        dataset (Optional[str]): Path to the CSV dataset, or None to skip it.
+            A missing file is skipped as well.
+        repeat (int): Number of timed throughput passes per measurement.
+        memory (bool): Whether to measure peak memory.
+        import_time (bool): Whether to measure import time.
+        log (Optional[Callable[[str], None]]): Called with a line per finished case.
+
+    Returns:
+        Dict[str, object]: A JSON-serialisable report with 'metadata' and
+        'results', keyed by '<corpus>/<mode>' (plus 'import').
+
+    Raises:
+        ValueError: If a mode or variant is unknown.
+    """
+    modes = list(modes)
+    for mode in modes:
+        if mode not in MODES:
+            raise ValueError(f"Unknown benchmark mode: '{mode}'")
+
+    corpora: List[Tuple[str, List[str]]] = []
+    if dataset is not None and os.path.exists(dataset):
+        corpora.append(('dataset', load_dataset(dataset)))
+    for variant in variants:
+        for size in sizes:
+            corpora.append((f'{variant}-{_size_label(size)}', synthetic_corpus(size, variant)))
+
+    results: Dict[str, Dict[str, float]] = {}
+    if import_time:
+        results['import'] = measure_import()
+        if log is not None:
+            log(f"import: {results['import']}")
+
+    for name, texts in corpora:
+        for mode in modes:
+            tokenizer = Tokenizer(**MODES[mode])
+            key = f'{name}/{mode}'
+            results[key] = measure_tokenizer(tokenizer, texts, repeat=repeat, memory=memory)
+            if log is not None:
+                log(f"{key}: {results[key]['mb_per_second']:.2f} MB/s, "
+                    f"p99 {results[key]['latency_p99_us']:.1f} us")
+
+    return {
+        'metadata': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+def compare(baseline: Dict[str, object], current: Dict[str, object],
+            threshold: float = DEFAULT_THRESHOLD,
+            thresholds: Optional[Dict[str, float]] = None) -> List[str]:
+    """
+    Lists the tracked metrics of a report that regressed against a baseline.
+
+    A metric regresses when it is worse than the baseline by more than its
+    threshold, as a fraction of the baseline value (0.25 allows a 25% slowdown).
+    Cases or metrics missing from either report are ignored.
+
+    Args:
+        baseline (Dict[str, object]): A report from ``run_benchmarks``.
+        current (Dict[str, object]): The report to check.
+        threshold (float): Default allowed relative regression.
+        thresholds (Optional[Dict[str, float]]): Per-metric overrides.
+
+    Returns:
+        List[str]: One description per regression; empty when none regressed.
+    """
+    thresholds = thresholds or {}
+    regressions: List[str] = []
+    for key, metrics in current['results'].items():
+        reference = baseline['results'].get(key)
+        if reference is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if metric not in metrics or metric not in reference or not reference[metric]:
+                continue
+            allowed = thresholds.get(metric, threshold)
+            old, new = reference[metric], metrics[metric]
+            change = (old - new) / old if higher_is_better else (new - old) / old
+            if change > allowed:
+                regressions.append(f"{key} {metric}: {old:.4g} -> {new:.4g} "
+                                   f"({change:+.0%} worse, allowed {allowed:.0%})")
+    return regressions
+
+def _parse_size(value: str) -> int:
+    units = {'KB': 1 << 10, 'MB': 1 << 20, 'B': 1}
+    text = value.strip().upper()
+    for unit, factor in units.items():
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * factor)
+    return int(text)
+
+def _parse_threshold(value: str) -> Tuple[str, float]:
+    metric, _, fraction = value.partition('=')
+    if metric not in METRICS or not fraction:
+        raise argparse.ArgumentTypeError(f"expected METRIC=FRACTION with METRIC in {', '.join(METRICS)}")
+    return metric, float(fraction)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the benchmark suite from the command line.
+
+    Usage: ``python -m seram_tokenizer.benchmark [--save FILE] [--baseline FILE]``.
+    Exits with status 1 when a tracked metric regressed past its threshold.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, without the program name.
+
+    Returns:
+        int: The process exit status.
+    """
+    parser = argparse.ArgumentParser(prog='python -m seram_tokenizer.benchmark',
+                                     description='Benchmark the Seram tokenizer.')
+    parser.add_argument('--sizes', nargs='+', type=_parse_size, default=list(DEFAULT_SIZES),
+                        help='Synthetic corpus sizes, e.g. 1KB 1MB 100MB (default: 1KB 100KB 10MB).')
+    parser.add_argument('--variants', nargs='+', choices=VARIANTS, default=list(VARIANTS),
+                        help='Synthetic corpus variants (default: all).')
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES),
+                        help='Tokenizer modes (default: all).')
+    parser.add_argument('--dataset', default=DEFAULT_DATASET,
+                        help='CSV dataset to include (default: the bundled dataset, if present).')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Timed passes per measurement; the best is kept (default: 3).')
+    parser.add_argument('--no-memory', action='store_true', help='Skip peak memory measurement.')
+    parser.add_argument('--no-import', action='store_true', help='Skip import time measurement.')
+    parser.add_argument('--save', help='Write the results as JSON to this file.')
+    parser.add_argument('--baseline', help='JSON baseline to compare the results against.')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed relative regression of every metric (default: %(default)s).')
+    parser.add_argument('--metric-threshold', type=_parse_threshold, action='append', default=[],
+                        metavar='METRIC=FRACTION', help='Allowed relative regression of one metric.')
+    args = parser.parse_args(argv)
+    if args.repeat <= 0:
+        parser.error("--repeat must be a positive integer.")
+
+    report = run_benchmarks(sizes=args.sizes, variants=args.variants, modes=args.modes,
+                            dataset=args.dataset, repeat=args.repeat, memory=not args.no_memory,
+                            import_time=not args.no_import,
+                            log=lambda line: print(line, file=sys.stderr))
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = compare(baseline, report, args.threshold, dict(args.metric_threshold))
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,421 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from .lexicon import Lexicon
+from .parallel import batched
+from .tokenizer import PARAGOG_TOKEN_PATTERN, Tokenizer
+
+# Persistent tokenization cache (an SQLite file):
+#
+#   tokens(key, tokens, size, used)   one row per tokenized text. ``key`` is the
+#                                     SHA-256 of the tokenizer fingerprint and
+#                                     the text; ``tokens`` are joined by newlines
+#                                     (phrase tokens contain spaces, no token a
+#                                     newline) and stored as UTF-8 bytes, lone
+#                                     surrogates included ('surrogatepass');
+#                                     ``size`` is the row's payload in bytes;
+#                                     ``used`` orders rows by last use, for
+#                                     eviction
+#   totals(bytes)                     sum of ``size``, kept up to date by triggers
+#
+# Keys are content addresses: a text tokenized under a different configuration
+# or lexicon gets a different key, so stale rows are never returned and simply
+# age out under the size limit.
+FORMAT_VERSION = 3
+DEFAULT_MAX_BYTES = 256 << 20
+# Seconds a connection waits for another process's lock before failing.
+DEFAULT_TIMEOUT = 30.0
+
+# Rows are evicted down to this share of max_bytes, so eviction runs in bulk
+# rather than on every insert.
+_EVICTION_TARGET = 0.9
+# Keys per statement, below SQLite's limit on bound parameters.
+_QUERY_BATCH = 500
+# Pending recency updates kept in memory before they are written out anyway.
+_MAX_PENDING_TOUCHES = 100000
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS tokens (
+    key BLOB PRIMARY KEY,
+    tokens BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    used INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tokens_used ON tokens (used);
+CREATE TABLE IF NOT EXISTS totals (bytes INTEGER NOT NULL);
+INSERT INTO totals SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM totals);
+CREATE TRIGGER IF NOT EXISTS tokens_insert AFTER INSERT ON tokens
+    BEGIN UPDATE totals SET bytes = bytes + new.size; END;
+CREATE TRIGGER IF NOT EXISTS tokens_delete AFTER DELETE ON tokens
+    BEGIN UPDATE totals SET bytes = bytes - old.size; END;
+'''
+# Dropping the tables also drops their index and triggers.
+_DROP_SCHEMA = '''
+DROP TABLE IF EXISTS tokens;
+DROP TABLE IF EXISTS totals;
+'''
+
+# Lexicon -> (version, digest), so a lexicon is only hashed again after it changes.
+_LEXICON_DIGESTS: 'weakref.WeakKeyDictionary[Lexicon, Tuple[int, str]]' = weakref.WeakKeyDictionary()
+
+def lexicon_digest(lexicon: Lexicon) -> str:
+    """
+    Returns a SHA-256 digest of a lexicon's entries and letter sets.
+
+    Unlike ``Lexicon.version``, which only counts changes within one process,
+    the digest identifies the content, so it stays valid across runs and
+    changes whenever the lexicon file does.
+
+    Args:
+        lexicon (Lexicon): The lexicon.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    cached = _LEXICON_DIGESTS.get(lexicon)
+    if cached is not None and cached[0] == lexicon.version:
+        return cached[1]
+
+    digest = hashlib.sha256()
+    for name in ('words', 'vowels', 'consonants', 'pronouns'):
+        digest.update(name.encode('ascii') + b'\0')
+        for entry in sorted(getattr(lexicon, name)):
+            digest.update(entry.encode('utf-8') + b'\n')
+    _LEXICON_DIGESTS[lexicon] = (lexicon.version, digest.hexdigest())
+    return _LEXICON_DIGESTS[lexicon][1]
+
+def tokenizer_fingerprint(tokenizer: Tokenizer) -> str:
+    """
+    Returns a digest of everything that determines a tokenizer's output.
+
+    The scanning pattern and options are always included. The affix rules and
+    the lexicon only matter when affixes are split, so only then are they
+    included, and the lexicon loaded. With a subword model, its merges, affix
+    rules and lexicon are included instead. Phrase matching adds the lexicon
+    whose multi-word entries are matched.
+
+    Args:
+        tokenizer (Tokenizer): The tokenizer.
+
+    Returns:
+        str: The hexadecimal fingerprint.
+    """
+    pattern = PARAGOG_TOKEN_PATTERN if tokenizer.normalize_paragog else tokenizer.token_pattern
+    config: List[Any] = [FORMAT_VERSION, pattern.pattern, tokenizer.use_suffix, tokenizer.use_prefix]
+    subword = tokenizer.subword
+    if subword is not None:
+        config.append([list(pair) for pair in subword.merges])
+        config.append([list(rule) for rule in subword.affix_rules])
+        config.append(lexicon_digest(subword.lexicon))
+    elif tokenizer.use_suffix or tokenizer.use_prefix:
+        config.append([list(rule) for rule in tokenizer.affix_rules])
+        config.append(lexicon_digest(tokenizer.lexicon))
+    if tokenizer.phrases:
+        config.append(['phrases', lexicon_digest(tokenizer.lexicon)])
+    return hashlib.sha256(json.dumps(config).encode('utf-8')).hexdigest()
+
+class TokenCache:
+    """
+    An on-disk store of token lists, keyed by tokenizer fingerprint and text.
+
+    Lookups and inserts work on whole batches, a few statements per batch.
+    The store is bounded by ``max_bytes`` of token payload: when an insert
+    exceeds it, the least recently used rows are evicted. Several processes
+    may share one file; SQLite serialises their writes.
+
+    Lookups only read. The recency of the rows they hit is kept in memory
+    and written with the next ``put_many`` or on ``close``, so concurrent
+    readers never take the write lock. Recency only orders eviction, so
+    updates that cannot be written (e.g. the file stays locked) are dropped.
+
+    Attributes:
+        path (str): The SQLite file.
+        max_bytes (int): Payload size above which rows are evicted.
+        hits (int): Texts found by ``get_many`` since the cache was opened.
+        misses (int): Texts not found by ``get_many`` since the cache was opened.
+        evictions (int): Rows evicted since the cache was opened.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES, timeout: float = DEFAULT_TIMEOUT):
+        """
+        Opens (or creates) a cache file.
+
+        Args:
+            path (str): Path to the SQLite file.
+            max_bytes (int): Payload size above which rows are evicted.
+                Defaults to 256 MiB.
+            timeout (float): Seconds to wait for another process's lock on
+                the file. Defaults to 30.
+
+        Raises:
+            ValueError: If max_bytes is not positive, or the file is a cache of
+                a newer format version. A cache of an older version is emptied
+                and upgraded instead.
+        """
+        if max_bytes <= 0:
+            raise ValueError("'max_bytes' must be a positive integer.")
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # Key -> clock of its latest hit, not yet written to the file.
+        self._touched: Dict[bytes, int] = {}
+        self._connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        try:
+            version = self._connection.execute('PRAGMA user_version').fetchone()[0]
+            if version > FORMAT_VERSION:
+                raise ValueError(f"Unsupported tokenization cache version {version}: {path}")
+            # Rows of an older format cannot be read, and are only a cache: start over.
+            drop = _DROP_SCHEMA if 0 < version < FORMAT_VERSION else ''
+            self._connection.executescript(
+                f'BEGIN IMMEDIATE; {drop}{_SCHEMA} PRAGMA user_version = {FORMAT_VERSION}; COMMIT;')
+        except Exception:
+            self._connection.close()
+            raise
+        self._clock = self._connection.execute('SELECT COALESCE(MAX(used), 0) FROM tokens').fetchone()[0]
+
+    @staticmethod
+    def key(fingerprint: str, text: str) -> bytes:
+        """Returns the content address of a text under a tokenizer fingerprint."""
+        return hashlib.sha256(f'{fingerprint}\0{text}'.encode('utf-8', 'surrogatepass')).digest()
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def get_many(self, fingerprint: str, texts: Sequence[str]) -> List[Optional[List[str]]]:
+        """
+        Looks up the tokens of many texts at once.
+
+        Args:
+            fingerprint (str): The tokenizer fingerprint (``tokenizer_fingerprint``).
+            texts (Sequence[str]): The texts.
+
+        Returns:
+            List[Optional[List[str]]]: The cached tokens of each text, or None
+            for texts not in the cache, in input order.
+        """
+        keys = [self.key(fingerprint, text) for text in texts]
+        found: Dict[bytes, bytes] = {}
+        with self._lock:
+            for chunk in batched(set(keys), _QUERY_BATCH):
+                marks = ','.join('?' * len(chunk))
+                found.update(self._connection.execute(
+                    f'SELECT key, tokens FROM tokens WHERE key IN ({marks})', chunk))
+            self._touched.update(dict.fromkeys(found, self._tick()))
+            if len(self._touched) > _MAX_PENDING_TOUCHES:
+                self._flush_touches()
+
+        results: List[Optional[List[str]]] = []
+        for key in keys:
+            joined = found.get(key)
+            if joined is None:
+                results.append(None)
+            else:
+                joined = joined.decode('utf-8', 'surrogatepass')
+                results.append(joined.split('\n') if joined else [])
+        hits = sum(1 for tokens in results if tokens is not None)
+        self.hits += hits
+        self.misses += len(results) - hits
+        return results
+
+    def put_many(self, fingerprint: str, texts: Sequence[str], token_lists: Sequence[List[str]]) -> None:
+        """
+        Stores the tokens of many texts at once, then evicts if over the size limit.
+
+        Args:
+            fingerprint (str): The tokenizer fingerprint the tokens were produced with.
+            texts (Sequence[str]): The texts.
+            token_lists (Sequence[List[str]]): The tokens of each text.
+
+        Raises:
+            ValueError: If texts and token_lists differ in length.
+        """
+        if len(texts) != len(token_lists):
+            raise ValueError("Pass one token list per text.")
+        rows = []
+        for text, tokens in zip(texts, token_lists):
+            key = self.key(fingerprint, text)
+            joined = '\n'.join(tokens).encode('utf-8', 'surrogatepass')
+            rows.append((key, joined, len(key) + len(joined)))
+
+        with self._lock:
+            used = self._tick()
+            with self._connection:
+                # A key addresses its content, so an existing row already holds these tokens.
+                self._connection.executemany(
+                    'INSERT OR IGNORE INTO tokens (key, tokens, size, used) VALUES (?, ?, ?, ?)',
+                    [(key, joined, size, used) for key, joined, size in rows])
+                self._write_touches()
+                self._evict()
+
+    def _write_touches(self) -> None:
+        """Writes the pending recency updates inside the caller's transaction."""
+        if self._touched:
+            self._connection.executemany('UPDATE tokens SET used = ? WHERE key = ?',
+                                         [(used, key) for key, used in self._touched.items()])
+            self._touched.clear()
+
+    def _flush_touches(self) -> None:
+        """Writes the pending recency updates in their own transaction, or drops them."""
+        if not self._touched:
+            return
+        try:
+            with self._connection:
+                self._write_touches()
+        except sqlite3.OperationalError:
+            # Locked for longer than the timeout: recency is only an eviction hint.
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        """Deletes least recently used rows until the payload is back under the target size."""
+        total = self.size
+        if total <= self.max_bytes:
+            return
+        target = self.max_bytes * _EVICTION_TARGET
+        while total > target:
+            count = self._connection.execute('SELECT COUNT(*) FROM tokens').fetchone()[0]
+            if not count:
+                return
+            # Estimate the rows to drop from the average row size; repeat if short.
+            excess = int((total - target) * count / total) + 1
+            deleted = self._connection.execute(
+                'DELETE FROM tokens WHERE key IN (SELECT key FROM tokens ORDER BY used LIMIT ?)',
+                (excess,)).rowcount
+            self.evictions += deleted
+            total = self.size
+
+    @property
+    def size(self) -> int:
+        """Total payload of the stored rows, in bytes."""
+        return self._connection.execute('SELECT bytes FROM totals').fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM tokens').fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """Returns entries, bytes, max_bytes, hits, misses and evictions."""
+        with self._lock:
+            size = self.size
+        return {'entries': len(self), 'bytes': size, 'max_bytes': self.max_bytes,
+                'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def clear(self) -> None:
+        """Deletes every row."""
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM tokens')
+            self._touched.clear()
+
+    def close(self) -> None:
+        """Writes the pending recency updates and closes the file."""
+        with self._lock:
+            self._flush_touches()
+            self._connection.close()
+
+    def __enter__(self) -> 'TokenCache':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+class CachedTokenizer:
+    """
+    A Tokenizer whose results persist in a TokenCache across runs.
+
+    Each batch is looked up in one pass; only the texts missing from the cache
+    (each distinct one once) are tokenized, and their tokens are stored for
+    the next run. The fingerprint covers the tokenizer's options, affix rules
+    and lexicon content, so changing any of them invalidates earlier entries.
+
+    Attributes:
+        tokenizer (Tokenizer): The tokenizer used for cache misses.
+        cache (TokenCache): The persistent store.
+    """
+
+    def __init__(self, cache: Union[TokenCache, str], tokenizer: Optional[Tokenizer] = None,
+                 **tokenizer_options: Any):
+        """
+        Initializes the CachedTokenizer.
+
+        Args:
+            cache (Union[TokenCache, str]): The cache, or the path of its file.
+            tokenizer (Optional[Tokenizer]): The tokenizer. Defaults to
+                ``Tokenizer(**tokenizer_options)``.
+            **tokenizer_options: Keyword arguments for ``Tokenizer`` (e.g.
+                use_suffix=True), used when no tokenizer is given.
+
+        Raises:
+            ValueError: If both a tokenizer and tokenizer options are given.
+        """
+        if tokenizer is not None and tokenizer_options:
+            raise ValueError("Pass either a tokenizer or tokenizer options, not both.")
+        self.tokenizer = Tokenizer(**tokenizer_options) if tokenizer is None else tokenizer
+        self.cache = TokenCache(cache) if isinstance(cache, str) else cache
+
+    @property
+    def fingerprint(self) -> str:
+        """The tokenizer's current fingerprint."""
+        return tokenizer_fingerprint(self.tokenizer)
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Tokenizes a text, reading the tokens from the cache when present.
+
+        Args:
+            text (str): The input text.
+
+        Returns:
+            List[str]: The tokens, as ``Tokenizer.tokenize`` returns them.
+
+        Raises:
+            TypeError: If the input is not a string.
+        """
+        if not isinstance(text, str):
+            raise TypeError("Input 'text' must be a string.")
+        return self.tokenize_batch([text])[0]
+
+    def tokenize_batch(self, texts: Iterable[str]) -> List[List[str]]:
+        """
+        Tokenizes many texts, tokenizing only those missing from the cache.
+
+        Args:
+            texts (Iterable[str]): The texts to be tokenized.
+
+        Returns:
+            List[List[str]]: One token list per input text, in input order.
+
+        Raises:
+            TypeError: If any element is not a string.
+        """
+        if isinstance(texts, str):
+            raise TypeError("Input 'texts' must be an iterable of strings, not a string.")
+        texts = list(texts)
+        if not all(isinstance(text, str) for text in texts):
+            raise TypeError("All elements in 'texts' must be strings.")
+
+        fingerprint = self.fingerprint
+        results = self.cache.get_many(fingerprint, texts)
+        missing = list(dict.fromkeys(text for text, tokens in zip(texts, results) if tokens is None))
+        if missing:
+            tokenized = dict(zip(missing, self.tokenizer.tokenize_batch(missing)))
+            self.cache.put_many(fingerprint, missing, list(tokenized.values()))
+            results = [list(tokenized[text]) if tokens is None else tokens
+                       for text, tokens in zip(texts, results)]
+        return results
+
+    def close(self) -> None:
+        """Closes the cache."""
+        self.cache.close()
+
+    def __enter__(self) -> 'CachedTokenizer':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,144 @@
+import argparse
+import io
+import sys
+from contextlib import ExitStack
+from typing import Iterable, List, Optional, TextIO
+from .languages import DEFAULT_LANGUAGE, available_languages
+from .parallel import CorpusStats, ParallelTokenizer
+from .subword import SubwordModel
+
+DEFAULT_BATCH_SIZE = 1000
+
+def tokenize_lines_parallel(parallel: ParallelTokenizer, lines: Iterable[str],
+                            output: TextIO) -> CorpusStats:
+    """
+    Tokenizes one sentence per line on a process pool, preserving line order.
+
+    With a single worker the lines are tokenized in-process.
+
+    Args:
+        parallel (ParallelTokenizer): The configured parallel tokenizer.
+        lines (Iterable[str]): Input lines, one sentence per line.
+        output (TextIO): Where the tokenized lines are written.
+
+    Returns:
+        CorpusStats: Throughput of the run.
+    """
+    for tokens in parallel.tokenize_corpus(line.rstrip('\r\n') for line in lines):
+        output.write(' '.join(tokens))
+        output.write('\n')
+    return parallel.stats
+
+def _open_text(stack: ExitStack, path: str, mode: str, encoding: str) -> TextIO:
+    """
+    Opens a text file, or the standard input or output for '-', in an encoding.
+
+    The standard streams are re-wrapped so that the encoding applies to them
+    too; the wrapper is detached (not closed) when the stack unwinds.
+
+    Args:
+        stack (ExitStack): Owns the opened stream.
+        path (str): The file path, or '-'.
+        mode (str): 'r' or 'w'.
+        encoding (str): The text encoding.
+
+    Returns:
+        TextIO: The stream.
+
+    Raises:
+        OSError: If the file cannot be opened.
+    """
+    if path != '-':
+        return stack.enter_context(open(path, mode, encoding=encoding))
+    standard = sys.stdin if mode == 'r' else sys.stdout
+    buffer = getattr(standard, 'buffer', None)
+    if buffer is None:
+        # Already a plain text stream (e.g. replaced in tests); use it as is.
+        return standard
+    if mode == 'w':
+        standard.flush()
+    stream = io.TextIOWrapper(buffer, encoding=encoding)
+    stack.callback(stream.detach)
+    return stream
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser of the ``seram-tokenize`` command."""
+    parser = argparse.ArgumentParser(
+        prog='seram-tokenize',
+        description='Tokenize Seram text, one sentence per line.',
+    )
+    parser.add_argument('input', nargs='?', default='-',
+                        help="Input file (default: '-', read from stdin).")
+    parser.add_argument('-o', '--output', default='-',
+                        help="Output file (default: '-', write to stdout).")
+    parser.add_argument('--use-suffix', action='store_true',
+                        help="Split '_ra' / '_a' suffixes.")
+    parser.add_argument('--use-prefix', action='store_true',
+                        help="Split 'na_' / 'da_' prefixes.")
+    parser.add_argument('--subword', metavar='MODEL',
+                        help='Split words with a trained subword model (see python -m '
+                             'seram_tokenizer.subword) instead of the affix rules.')
+    parser.add_argument('--normalize', action='store_true',
+                        help="Merge detached paragog particles ('a', 'ra') into the preceding word.")
+    parser.add_argument('--language', default=DEFAULT_LANGUAGE,
+                        help='Language code of the lexicon and affix rules (default: %(default)s).')
+    parser.add_argument('--encoding', default='utf-8',
+                        help="Encoding of the input and output, files or standard streams (default: utf-8).")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='Number of lines tokenized together (default: %(default)s).')
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help='Number of worker processes; 0 uses every CPU (default: 1).')
+    parser.add_argument('--stats', action='store_true',
+                        help='Report throughput (sentences/s, tokens/s) on stderr.')
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the ``seram-tokenize`` command.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, without the program
+            name. Defaults to ``sys.argv[1:]``.
+
+    Returns:
+        int: The process exit status.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.batch_size <= 0:
+        parser.error("--batch-size must be a positive integer.")
+
+    if args.workers < 0:
+        parser.error("--workers must not be negative.")
+    if args.language not in available_languages():
+        parser.error(f"unknown --language '{args.language}' "
+                     f"(available: {', '.join(available_languages())}).")
+
+    if args.subword and (args.use_suffix or args.use_prefix):
+        parser.error("--subword replaces --use-suffix and --use-prefix.")
+    subword = None
+    if args.subword:
+        try:
+            subword = SubwordModel.load(args.subword)
+        except (OSError, ValueError) as error:
+            parser.error(f"can't load subword model '{args.subword}': {error}")
+
+    parallel = ParallelTokenizer(workers=args.workers or None, chunk_size=args.batch_size,
+                                 use_suffix=args.use_suffix, use_prefix=args.use_prefix,
+                                 normalize_paragog=args.normalize, language=args.language,
+                                 subword=subword)
+
+    with ExitStack() as stack:
+        try:
+            source = _open_text(stack, args.input, 'r', args.encoding)
+            target = _open_text(stack, args.output, 'w', args.encoding)
+        except OSError as error:
+            parser.error(f"can't open '{error.filename}': {error.strerror}")
+        stats = tokenize_lines_parallel(parallel, source, target)
+
+    if args.stats:
+        print(f"seram-tokenize: {stats}", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,289 @@
+import argparse
+import csv
+import json
+import mmap
+import os
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from .languages import available_languages
+from .parallel import batched
+from .tokenizer import Tokenizer
+from .vocab import DEFAULT_SPECIAL_TOKENS, Vocabulary
+
+# Tokenized dataset layout (a directory):
+#
+#   manifest.json           format version, row count, column names, tokenizer options
+#   <column>.ids.bin        int32 token ids of every row, concatenated
+#   <column>.offsets.bin    int64 row boundaries, rows + 1 entries: row i is
+#                           ids[offsets[i]:offsets[i + 1]]
+#   <column>.vocab.json     the column's Vocabulary (see Vocabulary.save)
+#
+# Integers are stored little-endian. Ids are assigned in order of first
+# appearance, so the export needs a single pass and holds only the vocabulary.
+FORMAT_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+DEFAULT_COLUMNS = ('indonesian', 'geser')
+
+_ID_TYPE = 'i'
+_OFFSET_TYPE = 'q'
+_BATCH_SIZE = 1000
+
+def _little_endian(values: array) -> array:
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+def export_dataset(csv_path: str, output_dir: str, tokenizers: Sequence[Tokenizer],
+                   columns: Sequence[str] = DEFAULT_COLUMNS, encoding: str = 'utf-8-sig') -> int:
+    """
+    Tokenizes every column of a CSV corpus once and writes it in columnar form.
+
+    Rows with fewer fields than ``columns`` get empty texts for the missing ones.
+
+    Args:
+        csv_path (str): The CSV file, without a header row.
+        output_dir (str): Directory to write; created if missing.
+        tokenizers (Sequence[Tokenizer]): One tokenizer per column, e.g. a plain
+            one for Indonesian and one splitting affixes for Geser.
+        columns (Sequence[str]): Column names, in CSV order. Defaults to
+            ('indonesian', 'geser').
+        encoding (str): CSV encoding. Defaults to 'utf-8-sig'.
+
+    Returns:
+        int: The number of rows written.
+
+    Raises:
+        ValueError: If tokenizers and columns differ in length.
+    """
+    if len(tokenizers) != len(columns):
+        raise ValueError("Pass one tokenizer per column.")
+    os.makedirs(output_dir, exist_ok=True)
+
+    indexes: List[Dict[str, int]] = [{token: index for index, token in enumerate(DEFAULT_SPECIAL_TOKENS)}
+                                     for _ in columns]
+    offsets = [0] * len(columns)
+    id_files = [open(os.path.join(output_dir, f'{column}.ids.bin'), 'wb') for column in columns]
+    offset_files = [open(os.path.join(output_dir, f'{column}.offsets.bin'), 'wb') for column in columns]
+    rows = 0
+    try:
+        for offset_file in offset_files:
+            _little_endian(array(_OFFSET_TYPE, [0])).tofile(offset_file)
+
+        with open(csv_path, 'r', encoding=encoding, newline='') as file:
+            for batch in batched(csv.reader(file), _BATCH_SIZE):
+                rows += len(batch)
+                for position, tokenizer in enumerate(tokenizers):
+                    texts = [row[position] if position < len(row) else '' for row in batch]
+                    index = indexes[position]
+                    ids = array(_ID_TYPE)
+                    ends = array(_OFFSET_TYPE)
+                    for tokens in tokenizer.tokenize_batch(texts):
+                        for token in tokens:
+                            token_id = index.get(token)
+                            if token_id is None:
+                                token_id = index[token] = len(index)
+                            ids.append(token_id)
+                        offsets[position] += len(tokens)
+                        ends.append(offsets[position])
+                    _little_endian(ids).tofile(id_files[position])
+                    _little_endian(ends).tofile(offset_files[position])
+    finally:
+        for handle in id_files + offset_files:
+            handle.close()
+
+    for column, index in zip(columns, indexes):
+        Vocabulary(list(index)).save(os.path.join(output_dir, f'{column}.vocab.json'))
+
+    manifest = {
+        'format': FORMAT_VERSION,
+        'rows': rows,
+        'columns': list(columns),
+        'tokenizers': {column: {'use_suffix': tokenizer.use_suffix, 'use_prefix': tokenizer.use_prefix,
+                                'normalize_paragog': tokenizer.normalize_paragog,
+                                'language': tokenizer.language}
+                       for column, tokenizer in zip(columns, tokenizers)},
+    }
+    with open(os.path.join(output_dir, MANIFEST_FILE), 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=2)
+    return rows
+
+class _MappedArray:
+    """A read-only integer array backed by a memory-mapped little-endian file."""
+
+    def __init__(self, path: str, typecode: str):
+        self.typecode = typecode
+        self._map = None
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map is not None and sys.byteorder == 'little':
+            self.values = memoryview(self._map).cast(typecode)
+        else:
+            # Empty files cannot be mapped; big-endian hosts need a swapped copy.
+            self.values = array(typecode, self._map[:] if self._map is not None else b'')
+            if sys.byteorder != 'little':
+                self.values.byteswap()
+
+    def close(self) -> None:
+        if isinstance(self.values, memoryview):
+            self.values.release()
+        if self._map is not None:
+            self._map.close()
+
+class TokenizedDataset:
+    """
+    Random access to a dataset written by ``export_dataset``.
+
+    Ids and offsets are memory-mapped, not read: opening takes constant time,
+    a row costs two offset reads and one slice, and the operating system
+    pages data in on demand and shares it between processes.
+
+    Attributes:
+        path (str): The dataset directory.
+        columns (List[str]): Column names.
+        manifest (Dict[str, Any]): The dataset's manifest.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens a tokenized dataset.
+
+        Args:
+            path (str): The directory written by ``export_dataset``.
+
+        Raises:
+            ValueError: If the manifest has an unsupported format version.
+        """
+        self.path = path
+        with open(os.path.join(path, MANIFEST_FILE), 'r', encoding='utf-8') as file:
+            self.manifest: Dict[str, Any] = json.load(file)
+        if self.manifest.get('format') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported tokenized dataset format: {path}")
+        self.columns: List[str] = self.manifest['columns']
+        self._ids = {column: _MappedArray(os.path.join(path, f'{column}.ids.bin'), _ID_TYPE)
+                     for column in self.columns}
+        self._offsets = {column: _MappedArray(os.path.join(path, f'{column}.offsets.bin'), _OFFSET_TYPE)
+                         for column in self.columns}
+        self._vocabularies: Dict[str, Vocabulary] = {}
+
+    def __len__(self) -> int:
+        return self.manifest['rows']
+
+    def _column(self, column: str) -> None:
+        if column not in self._ids:
+            raise KeyError(f"Unknown column: '{column}'")
+
+    def ids(self, column: str, row: int):
+        """
+        Returns the token ids of one row of a column, without copying.
+
+        Args:
+            column (str): Column name.
+            row (int): Row index; negative indexes count from the end.
+
+        Returns:
+            Sequence[int]: The ids, as a slice of the mapped file.
+
+        Raises:
+            KeyError: If the column does not exist.
+            IndexError: If the row does not exist.
+        """
+        self._column(column)
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("Row index out of range.")
+        offsets = self._offsets[column].values
+        return self._ids[column].values[offsets[row]:offsets[row + 1]]
+
+    def vocabulary(self, column: str) -> Vocabulary:
+        """Returns the vocabulary of a column, loading it on first use."""
+        self._column(column)
+        vocabulary = self._vocabularies.get(column)
+        if vocabulary is None:
+            vocabulary = self._vocabularies[column] = Vocabulary.load(
+                os.path.join(self.path, f'{column}.vocab.json'))
+        return vocabulary
+
+    def tokens(self, column: str, row: int) -> List[str]:
+        """Returns the tokens of one row of a column."""
+        tokens = self.vocabulary(column).tokens
+        return [tokens[token_id] for token_id in self.ids(column, row)]
+
+    def __getitem__(self, row: int) -> Dict[str, List[str]]:
+        """Returns the tokens of every column of one row."""
+        return {column: self.tokens(column, row) for column in self.columns}
+
+    def __iter__(self) -> Iterable[Dict[str, List[str]]]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def to_numpy(self, column: str):
+        """
+        Returns the ids and offsets of a column as NumPy arrays, without copying.
+
+        Args:
+            column (str): Column name.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: int32 ids and int64 offsets.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            KeyError: If the column does not exist.
+        """
+        import numpy as np
+        self._column(column)
+        return (np.frombuffer(self._ids[column].values, dtype='<i4'),
+                np.frombuffer(self._offsets[column].values, dtype='<i8'))
+
+    def close(self) -> None:
+        """Unmaps the files. Slices returned by ``ids`` must have been released."""
+        for mapped in list(self._ids.values()) + list(self._offsets.values()):
+            mapped.close()
+
+    def __enter__(self) -> 'TokenizedDataset':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Tokenizes a parallel CSV corpus into a columnar dataset from the command line.
+
+    Usage: ``python -m seram_tokenizer.dataset INPUT OUTPUT_DIR [options]``.
+    The first column (Indonesian) is tokenized plainly; the affix and
+    normalization options apply to the second (Geser) column.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, without the program name.
+
+    Returns:
+        int: The process exit status.
+    """
+    parser = argparse.ArgumentParser(prog='python -m seram_tokenizer.dataset',
+                                     description='Tokenize a parallel CSV corpus into a columnar dataset.')
+    parser.add_argument('input', help='CSV file: Indonesian text, Geser text (no header).')
+    parser.add_argument('output', help='Directory to write the dataset to.')
+    parser.add_argument('--use-suffix', action='store_true', help="Split '_ra' / '_a' suffixes.")
+    parser.add_argument('--use-prefix', action='store_true', help="Split 'na_' / 'da_' prefixes.")
+    parser.add_argument('--normalize', action='store_true',
+                        help="Merge detached paragog particles ('a', 'ra') into the preceding word.")
+    parser.add_argument('--language', default='geser',
+                        help='Language code of the second column (default: %(default)s).')
+    parser.add_argument('--encoding', default='utf-8-sig', help='CSV encoding (default: %(default)s).')
+    args = parser.parse_args(argv)
+    if args.language not in available_languages():
+        parser.error(f"unknown --language '{args.language}'.")
+
+    target = Tokenizer(use_suffix=args.use_suffix, use_prefix=args.use_prefix,
+                       normalize_paragog=args.normalize, language=args.language)
+    rows = export_dataset(args.input, args.output, [Tokenizer(), target], encoding=args.encoding)
+    print(f"{rows} rows written to {args.output}", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,32 +1,20 @@
 # Part of this code inspired by https://github.com/OpenNMT/Tokenizer/blob/master/bindings/python/README.md
-import os
-from typing import List, Set
-import pkg_resources
+from typing import Any, List
+from .lexicon import DICTIONARY_FILE, LexiconWords, get_data_file_path, get_lexicon
 
-# Load the dictionary words into a set for efficient O(1) average time complexity lookups.
-# This ensures that checking if a word exists in the dictionary is very fast.
-DICTIONARY_FILE_PATH = pkg_resources.resource_filename(__name__, 'data/geser_word.txt')
-DICTIONARY_WORDS: Set[str] = set()
+DICTIONARY_FILE_PATH = get_data_file_path(DICTIONARY_FILE)
 
-try:
-    if not os.path.exists(DICTIONARY_FILE_PATH):
-        raise FileNotFoundError(f"Dictionary file not found at: {DICTIONARY_FILE_PATH}")
-
-    with open(DICTIONARY_FILE_PATH, 'r', encoding='utf-8') as file:
-        # Assuming one word per line in the dictionary file.
-        # .strip() removes leading/trailing whitespace, including newline characters.
-        # Ensure only non-empty lines are added.
-        DICTIONARY_WORDS = {line.strip() for line in file if line.strip()}
-except FileNotFoundError as e:
-    print(f"Error: {e}. Please ensure the dictionary file exists and is accessible.")
-    # The DICTIONARY_WORDS set will remain empty, preventing further errors.
-except Exception as e:
-    print(f"An unexpected error occurred while loading the dictionary: {e}")
-    # The DICTIONARY_WORDS set will remain empty.
+def __getattr__(name: str) -> Any:
+    # DICTIONARY_WORDS is a live view of the shared lexicon's entries, loaded on
+    # first access rather than at import time. Changes made through it go
+    # through add_words / remove_words, so caches notice them.
+    if name == 'DICTIONARY_WORDS':
+        return LexiconWords(get_lexicon())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def find_unmatched_words(words: List[str]) -> List[str]:
     """
-    Identifies words from a list that are not present in the globally loaded dictionary.
+    Identifies words from a list that are not present in the shared dictionary.
 
     Args:
         words (List[str]): A list of tokenized words to check against the dictionary.
@@ -44,12 +32,13 @@ def find_unmatched_words(words: List[str]) -> List[str]:
     if not words:
         raise ValueError("Input 'words' cannot be an empty list.")
     
+    dictionary_words = get_lexicon().words
     unmatched_words: List[str] = []
     for word in words:
         # Convert word to lowercase for case-insensitive matching if desired,
         # or keep as is for case-sensitive matching.
         # For now, assuming case-sensitive as per original code.
-        if word not in DICTIONARY_WORDS:
+        if word not in dictionary_words:
             unmatched_words.append(word)
             
     return unmatched_words
\ No newline at end of file
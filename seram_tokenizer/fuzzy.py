@@ -0,0 +1,240 @@
+import argparse
+import json
+import sys
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+from .lexicon import Lexicon, get_lexicon
+
+FORMAT_VERSION = 1
+DEFAULT_MAX_DISTANCE = 2
+
+class Match(NamedTuple):
+    """
+    A lexicon entry close to a queried word.
+
+    Attributes:
+        word (str): The lexicon entry.
+        distance (int): Edit distance between the query and the entry.
+    """
+    word: str
+    distance: int
+
+def edit_distance(source: str, target: str, max_distance: Optional[int] = None) -> int:
+    """
+    Computes the edit distance between two strings, counting insertions,
+    deletions, substitutions and transpositions of adjacent characters
+    (optimal string alignment).
+
+    Args:
+        source (str): The first string.
+        target (str): The second string.
+        max_distance (Optional[int]): Stop as soon as the distance is known to
+            exceed this bound. Defaults to no bound.
+
+    Returns:
+        int: The distance, or ``max_distance + 1`` if it exceeds max_distance.
+    """
+    if source == target:
+        return 0
+    if max_distance is not None and abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+
+    before: List[int] = []
+    previous = list(range(len(target) + 1))
+    for i, char in enumerate(source, 1):
+        current = [i] + [0] * len(target)
+        for j, other in enumerate(target, 1):
+            distance = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != other))
+            if i > 1 and j > 1 and char == target[j - 2] and source[i - 2] == other:
+                distance = min(distance, before[j - 2] + 1)
+            current[j] = distance
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        before, previous = previous, current
+    distance = previous[-1]
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """Returns the word and every string obtained by deleting up to max_distance characters."""
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {variant[:index] + variant[index + 1:]
+                    for variant in frontier for index in range(len(variant))}
+        variants |= frontier
+    return variants
+
+class FuzzyIndex:
+    """
+    A symmetric-delete index for approximate lexicon lookup.
+
+    Every entry is indexed under all the strings obtained by deleting up to
+    ``max_distance`` of its characters. A query generates its own deletes and
+    only the entries sharing one are checked with ``edit_distance``, so a lookup
+    costs a few dozen dictionary probes however large the lexicon is.
+
+    Attributes:
+        words (List[str]): The indexed entries; entry ids are positions here.
+        max_distance (int): Largest distance a lookup may ask for.
+    """
+
+    def __init__(self, words: Iterable[str], max_distance: int = DEFAULT_MAX_DISTANCE,
+                 deletes: Optional[Dict[str, List[int]]] = None):
+        """
+        Builds (or restores) the index.
+
+        Args:
+            words (Iterable[str]): The entries to index.
+            max_distance (int): Largest supported lookup distance. Defaults to 2.
+            deletes (Optional[Dict[str, List[int]]]): A precomputed delete table
+                for ``words``, as stored by ``save``.
+
+        Raises:
+            ValueError: If max_distance is negative.
+        """
+        if max_distance < 0:
+            raise ValueError("'max_distance' must not be negative.")
+        self.words = sorted(set(words)) if deletes is None else list(words)
+        self.max_distance = max_distance
+
+        if deletes is None:
+            deletes = {}
+            for word_id, word in enumerate(self.words):
+                for variant in _deletes(word, max_distance):
+                    deletes.setdefault(variant, []).append(word_id)
+        self._deletes = deletes
+
+    @classmethod
+    def from_lexicon(cls, lexicon: Optional[Lexicon] = None,
+                     max_distance: int = DEFAULT_MAX_DISTANCE) -> 'FuzzyIndex':
+        """
+        Indexes every entry of a lexicon.
+
+        Args:
+            lexicon (Optional[Lexicon]): The lexicon. Defaults to the shared Geser lexicon.
+            max_distance (int): Largest supported lookup distance. Defaults to 2.
+
+        Returns:
+            FuzzyIndex: The index.
+        """
+        lexicon = get_lexicon() if lexicon is None else lexicon
+        return cls(lexicon.words, max_distance)
+
+    def lookup(self, word: str, max_distance: Optional[int] = None,
+               limit: Optional[int] = None) -> List[Match]:
+        """
+        Finds the entries within an edit distance of a word.
+
+        Args:
+            word (str): The (usually out-of-vocabulary) word.
+            max_distance (Optional[int]): Largest distance returned. Defaults
+                to the index's max_distance.
+            limit (Optional[int]): Maximum number of matches. Defaults to all.
+
+        Returns:
+            List[Match]: Matches ranked by distance, then alphabetically. An
+            entry equal to the word comes first, at distance 0.
+
+        Raises:
+            ValueError: If max_distance exceeds the index's max_distance.
+        """
+        if max_distance is None:
+            max_distance = self.max_distance
+        elif max_distance > self.max_distance:
+            raise ValueError(f"This index supports distances up to {self.max_distance}.")
+
+        candidates: Set[int] = set()
+        deletes = self._deletes
+        for variant in _deletes(word, max_distance):
+            ids = deletes.get(variant)
+            if ids:
+                candidates.update(ids)
+
+        matches = []
+        for word_id in candidates:
+            entry = self.words[word_id]
+            distance = edit_distance(word, entry, max_distance)
+            if distance <= max_distance:
+                matches.append(Match(entry, distance))
+        matches.sort(key=lambda match: (match.distance, match.word))
+        return matches if limit is None else matches[:limit]
+
+    def lookup_batch(self, words: Iterable[str], max_distance: Optional[int] = None,
+                     limit: Optional[int] = None) -> List[List[Match]]:
+        """
+        Looks up many words, querying each distinct word once.
+
+        Args:
+            words (Iterable[str]): The words.
+            max_distance (Optional[int]): As for ``lookup``.
+            limit (Optional[int]): As for ``lookup``.
+
+        Returns:
+            List[List[Match]]: The matches of each word, in input order.
+        """
+        results: Dict[str, List[Match]] = {}
+        batch = []
+        for word in words:
+            matches = results.get(word)
+            if matches is None:
+                matches = results[word] = self.lookup(word, max_distance, limit)
+            batch.append(matches)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def save(self, path: str) -> None:
+        """Writes the index, including its delete table, to a JSON file."""
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'format': FORMAT_VERSION, 'max_distance': self.max_distance,
+                       'words': self.words, 'deletes': self._deletes}, file, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> 'FuzzyIndex':
+        """
+        Reads an index written by ``save`` without rebuilding it.
+
+        Args:
+            path (str): Path to the index file.
+
+        Returns:
+            FuzzyIndex: The index.
+
+        Raises:
+            ValueError: If the file is not an index of a supported version.
+        """
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        if not isinstance(data, dict) or data.get('format') != FORMAT_VERSION:
+            raise ValueError(f"Not a fuzzy index of version {FORMAT_VERSION}: {path}")
+        return cls(data['words'], data['max_distance'], data['deletes'])
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Builds the approximate-match index of a registered lexicon from the command line.
+
+    Usage: ``python -m seram_tokenizer.fuzzy OUTPUT [--lexicon NAME] [--max-distance K]``.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, without the program name.
+
+    Returns:
+        int: The process exit status.
+    """
+    parser = argparse.ArgumentParser(prog='python -m seram_tokenizer.fuzzy',
+                                     description='Build an approximate-match index of a lexicon.')
+    parser.add_argument('output', help='Path of the index file to write.')
+    parser.add_argument('--lexicon', default='geser', help='Registered lexicon name (default: geser).')
+    parser.add_argument('--max-distance', type=int, default=DEFAULT_MAX_DISTANCE,
+                        help='Largest supported edit distance (default: %(default)s).')
+    args = parser.parse_args(argv)
+    if args.max_distance < 0:
+        parser.error("--max-distance must not be negative.")
+
+    FuzzyIndex.from_lexicon(get_lexicon(args.lexicon), args.max_distance).save(args.output)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
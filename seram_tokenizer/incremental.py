@@ -0,0 +1,216 @@
+from array import array
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+from .spans import TokenSpans
+from .tokenizer import _PARTICLE_START, Tokenizer
+
+class TokenDiff(NamedTuple):
+    """
+    The change an edit made to a document's token list.
+
+    ``tokens[start:start + len(removed)]`` before the edit equals ``removed``;
+    after the edit, ``tokens[start:start + len(inserted)]`` equals ``inserted``.
+    Tokens outside that range are unchanged.
+
+    Attributes:
+        start (int): Index of the first changed token.
+        removed (List[str]): Tokens removed at ``start``.
+        inserted (List[str]): Tokens inserted at ``start``.
+    """
+    start: int
+    removed: List[str]
+    inserted: List[str]
+
+class TokenizationSession:
+    """
+    Keeps the tokens of one document up to date as the document is edited.
+
+    An edit only re-tokenizes a window around the changed text. The window is
+    widened to the nearest cut positions, right after whitespace, where no
+    token (reduplication, affix split or paragog merge) can cross the cut in
+    either the old or the new text. The tokens outside the window are kept.
+    The result is always that of tokenizing the whole edited text. Phrase
+    matching is not supported: one edit can change which phrases match
+    arbitrarily far away.
+
+    Token offsets before a movable gap are stored as absolute positions;
+    offsets after it are stored relative to the end of the text. An edit
+    therefore never shifts the offsets of the rest of the document. Only the
+    entries between the previous and the current edit are converted, so
+    nearby edits such as typing are cheap whatever the size of the document.
+
+    Attributes:
+        tokenizer (Tokenizer): The tokenizer whose output is maintained.
+        tokens (List[str]): The document's tokens; treat as read-only.
+    """
+
+    def __init__(self, text: str = '', tokenizer: Optional[Tokenizer] = None, **tokenizer_options: Any):
+        """
+        Tokenizes a document and opens a session on it.
+
+        Args:
+            text (str): The initial document. Defaults to an empty document.
+            tokenizer (Optional[Tokenizer]): The tokenizer. Defaults to
+                ``Tokenizer(**tokenizer_options)``.
+            **tokenizer_options: Keyword arguments for ``Tokenizer`` (e.g.
+                use_suffix=True), used when no tokenizer is given.
+
+        Raises:
+            TypeError: If text is not a string.
+            ValueError: If both a tokenizer and tokenizer options are given, or
+                the tokenizer matches phrases.
+        """
+        if tokenizer is not None and tokenizer_options:
+            raise ValueError("Pass either a tokenizer or tokenizer options, not both.")
+        self.tokenizer = Tokenizer(**tokenizer_options) if tokenizer is None else tokenizer
+        if self.tokenizer.phrases:
+            raise ValueError("Incremental sessions do not support phrase matching.")
+        self.reset(text)
+
+    def reset(self, text: str) -> None:
+        """
+        Replaces the document and tokenizes it from scratch.
+
+        Args:
+            text (str): The new document.
+
+        Raises:
+            TypeError: If text is not a string.
+        """
+        if not isinstance(text, str):
+            raise TypeError("Input 'text' must be a string.")
+        spans = self.tokenizer.tokenize_spans(text)
+        self._text = text
+        self.tokens: List[str] = spans.tokens()
+        self._starts = spans.starts
+        self._ends = spans.ends
+        self._kinds = spans.kinds
+        self._gap = len(self.tokens)
+
+    @property
+    def text(self) -> str:
+        """The current document."""
+        return self._text
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def spans(self) -> TokenSpans:
+        """Returns the current token offsets as TokenSpans of the document."""
+        self._move_gap(len(self.tokens))
+        return TokenSpans(self._text, array('i', self._starts), array('i', self._ends), array('i', self._kinds))
+
+    def edit(self, offset: int, deleted: int = 0, inserted: str = '') -> TokenDiff:
+        """
+        Applies one edit to the document and updates its tokens.
+
+        Args:
+            offset (int): Character offset of the edit.
+            deleted (int): Number of characters removed at ``offset``.
+            inserted (str): Text inserted at ``offset`` after the removal.
+
+        Returns:
+            TokenDiff: The changed tokens, with common leading and trailing
+            tokens trimmed off.
+
+        Raises:
+            TypeError: If inserted is not a string.
+            ValueError: If the edit does not fit inside the document.
+        """
+        if not isinstance(inserted, str):
+            raise TypeError("Input 'inserted' must be a string.")
+        old = self._text
+        if offset < 0 or deleted < 0 or offset + deleted > len(old):
+            raise ValueError(f"Edit ({offset}, {deleted}) is outside the document of length {len(old)}.")
+        if not deleted and not inserted:
+            return TokenDiff(self._bisect(self._starts, offset), [], [])
+
+        new = old[:offset] + inserted + old[offset + deleted:]
+        delta = len(new) - len(old)
+
+        # Widen the edit to cut positions that are safe in both texts. The text
+        # before ``left`` and after ``right`` is the same in both.
+        left = offset
+        while not (self._is_cut(old, left) and self._is_cut(new, left)):
+            left -= 1
+        right = offset + len(inserted)
+        while not (self._is_cut(new, right) and self._is_cut(old, right - delta)):
+            right += 1
+
+        first = self._bisect(self._starts, left)
+        last = self._bisect(self._starts, right - delta, first)
+        self._move_gap(first)
+        removed = self.tokens[first:last]
+
+        window = self.tokenizer.tokenize_spans(new[left:right])
+        added = window.tokens()
+        self.tokens[first:last] = added
+        # Window tokens are stored after the gap, relative to the new end of the text.
+        shift = left - len(new)
+        self._starts[first:last] = array('i', [start + shift for start in window.starts])
+        self._ends[first:last] = array('i', [end + shift for end in window.ends])
+        self._kinds[first:last] = window.kinds
+        self._text = new
+
+        head = 0
+        while head < min(len(removed), len(added)) and removed[head] == added[head]:
+            head += 1
+        tail = 0
+        while (tail < min(len(removed), len(added)) - head
+               and removed[-1 - tail] == added[-1 - tail]):
+            tail += 1
+        return TokenDiff(first + head, removed[head:len(removed) - tail], added[head:len(added) - tail])
+
+    def apply(self, edits: Iterable[Tuple[int, int, str]]) -> List[TokenDiff]:
+        """
+        Applies edits in order, each with offsets into the text left by the previous one.
+
+        Args:
+            edits (Iterable[Tuple[int, int, str]]): (offset, deleted, inserted) operations.
+
+        Returns:
+            List[TokenDiff]: The diff of each edit.
+        """
+        return [self.edit(offset, deleted, inserted) for offset, deleted, inserted in edits]
+
+    def _is_cut(self, text: str, position: int) -> bool:
+        """
+        Whether the tokens of ``text`` are those of the text before and after
+        ``position`` tokenized separately.
+        """
+        if position <= 0 or position >= len(text):
+            return True
+        if not text[position - 1].isspace() or text[position].isspace():
+            return False
+        # Only a paragog merge spans whitespace, always up to a particle right after it.
+        return not (self.tokenizer.normalize_paragog and _PARTICLE_START.match(text, position))
+
+    def _bisect(self, offsets: array, position: int, low: int = 0) -> int:
+        """Returns the index of the first token whose offset is at least ``position``."""
+        high = len(offsets)
+        gap = self._gap
+        end = len(self._text)
+        while low < high:
+            middle = (low + high) // 2
+            value = offsets[middle] + end if middle >= gap else offsets[middle]
+            if value < position:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _move_gap(self, index: int) -> None:
+        """Makes offsets before ``index`` absolute and those from ``index`` on end-relative."""
+        gap = self._gap
+        if index == gap:
+            return
+        end = len(self._text)
+        starts, ends = self._starts, self._ends
+        if index < gap:
+            for position in range(index, gap):
+                starts[position] -= end
+                ends[position] -= end
+        else:
+            for position in range(gap, index):
+                starts[position] += end
+                ends[position] += end
+        self._gap = index
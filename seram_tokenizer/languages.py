@@ -0,0 +1,110 @@
+import threading
+from functools import partial
+from typing import Callable, Dict, List, Sequence, Union
+from .affixes import DEFAULT_AFFIX_RULES, AffixRule
+from .lexicon import Lexicon, get_lexicon
+
+DEFAULT_LANGUAGE = 'geser'
+
+class LanguageProfile:
+    """
+    Everything language-specific the tokenizer needs: the lexicon (with its
+    vowel and consonant sets) and the affix rule table.
+
+    The lexicon may be given as a zero-argument loader, which is called on
+    first use only; the loaded lexicon is then kept by the profile, so
+    switching between languages never re-reads files or rebuilds sets.
+
+    Attributes:
+        code (str): Language code used to select the profile, e.g. 'geser'.
+        name (str): Human-readable language name.
+        affix_rules (Tuple[AffixRule, ...]): The language's affix rules.
+    """
+
+    def __init__(self, code: str, name: str, lexicon: Union[Lexicon, Callable[[], Lexicon]],
+                 affix_rules: Sequence[AffixRule] = DEFAULT_AFFIX_RULES):
+        """
+        Initializes the LanguageProfile.
+
+        Args:
+            code (str): Language code, e.g. 'geser'.
+            name (str): Human-readable language name, e.g. 'Geser'.
+            lexicon (Union[Lexicon, Callable[[], Lexicon]]): The lexicon, or a
+                function returning it.
+            affix_rules (Sequence[AffixRule]): The affix rules. Defaults to the
+                '_ra', '_a', 'na_' and 'da_' rules.
+
+        Raises:
+            TypeError: If lexicon is neither a Lexicon nor callable.
+        """
+        if not isinstance(lexicon, Lexicon) and not callable(lexicon):
+            raise TypeError("Input 'lexicon' must be a Lexicon or a function returning one.")
+
+        self.code = code
+        self.name = name
+        self.affix_rules = tuple(affix_rules)
+        self._lexicon = lexicon if isinstance(lexicon, Lexicon) else None
+        self._loader = None if isinstance(lexicon, Lexicon) else lexicon
+        self._lock = threading.Lock()
+
+    @property
+    def lexicon(self) -> Lexicon:
+        """The language's lexicon, loaded on first access."""
+        if self._lexicon is None:
+            with self._lock:
+                if self._lexicon is None:
+                    lexicon = self._loader()
+                    if not isinstance(lexicon, Lexicon):
+                        raise TypeError(f"The lexicon loader of '{self.code}' did not return a Lexicon.")
+                    self._lexicon = lexicon
+        return self._lexicon
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the lexicon has been loaded."""
+        return self._lexicon is not None
+
+    def __repr__(self) -> str:
+        return f"LanguageProfile({self.code!r}, {self.name!r})"
+
+_PROFILES: Dict[str, LanguageProfile] = {
+    'geser': LanguageProfile('geser', 'Geser', partial(get_lexicon, 'geser')),
+}
+_LOCK = threading.Lock()
+
+def get_language(code: str = DEFAULT_LANGUAGE) -> LanguageProfile:
+    """
+    Returns the profile registered under a language code.
+
+    Args:
+        code (str): Language code. Defaults to 'geser'.
+
+    Returns:
+        LanguageProfile: The shared profile.
+
+    Raises:
+        KeyError: If no profile is registered under ``code``.
+    """
+    profile = _PROFILES.get(code)
+    if profile is None:
+        raise KeyError(f"Unknown language: '{code}'. Available: {', '.join(available_languages())}")
+    return profile
+
+def register_language(profile: LanguageProfile) -> None:
+    """
+    Registers a profile so that ``get_language(profile.code)`` returns it.
+
+    Args:
+        profile (LanguageProfile): The profile to share.
+
+    Raises:
+        TypeError: If profile is not a LanguageProfile.
+    """
+    if not isinstance(profile, LanguageProfile):
+        raise TypeError("Input 'profile' must be a LanguageProfile.")
+    with _LOCK:
+        _PROFILES[profile.code] = profile
+
+def available_languages() -> List[str]:
+    """Returns the registered language codes, sorted."""
+    return sorted(_PROFILES)
@@ -0,0 +1,225 @@
+import os
+import threading
+from collections.abc import MutableSet
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Optional, Set
+
+DATA_DIR = Path(__file__).parent / 'data'
+
+DICTIONARY_FILE = 'geser_word.txt'
+VOCAL_FILE = 'vocal.txt'
+CONSONANT_FILE = 'consonant.txt'
+PRONOUN_FILE = 'pronounce.txt'
+
+def get_data_file_path(filename: str) -> str:
+    """Get path to a file bundled in the package's data directory."""
+    return str(DATA_DIR / filename)
+
+# INSPIRED BY The implementation of https://github.com/AbdullahAlabbas/Wordle/blob/main/play_wordle.py
+def load_word_set(file_path: str) -> Set[str]:
+    """
+    Load words from a file into a set for O(1) lookup performance.
+
+    Args:
+        file_path (str): Path to the file containing words
+
+    Returns:
+        Set[str]: Set of words from the file
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found at: {file_path}")
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return {line.strip() for line in f if line.strip()}
+
+_DATA_FILES: Dict[str, FrozenSet[str]] = {}
+_LEXICONS: Dict[str, 'Lexicon'] = {}
+_LOCK = threading.RLock()
+
+def load_data_file(filename: str) -> FrozenSet[str]:
+    """
+    Loads a bundled data file, reading it from disk at most once per process.
+
+    Args:
+        filename (str): Name of the file in the package's data directory.
+
+    Returns:
+        FrozenSet[str]: The non-empty, stripped lines of the file.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    entries = _DATA_FILES.get(filename)
+    if entries is None:
+        with _LOCK:
+            entries = _DATA_FILES.get(filename)
+            if entries is None:
+                entries = _DATA_FILES[filename] = frozenset(load_word_set(get_data_file_path(filename)))
+    return entries
+
+class Lexicon:
+    """
+    A dictionary of lemmas together with the subsets the affix analysers need.
+
+    The subsets are derived once from ``words``. Use ``add_words`` and
+    ``remove_words`` to change the lexicon: they re-derive the subsets and bump
+    ``version`` so that caches built on top of the lexicon can notice the change.
+
+    Attributes:
+        words (Set[str]): All dictionary entries, including multi-word ones.
+        single_words (Set[str]): Entries without a space.
+        multi_words (Set[str]): Entries made of several words.
+        lemma_with_ra (Set[str]): Single-word lemmas ending with 'ra'.
+        lemma_with_a (Set[str]): Single-word lemmas ending with 'a'.
+        lemma_with_na (Set[str]): Single-word lemmas starting with 'na'.
+        lemma_with_da (Set[str]): Single-word lemmas starting with 'da'.
+        vowels (FrozenSet[str]): Vowel letters.
+        consonants (FrozenSet[str]): Consonant letters.
+        pronouns (FrozenSet[str]): Pronouns.
+        version (int): Incremented every time the entries change.
+    """
+
+    def __init__(self, words: Iterable[str], vowels: Optional[Iterable[str]] = None,
+                 consonants: Optional[Iterable[str]] = None,
+                 pronouns: Optional[Iterable[str]] = None):
+        """
+        Initializes the Lexicon.
+
+        Args:
+            words (Iterable[str]): Dictionary entries.
+            vowels (Optional[Iterable[str]]): Vowel letters. Defaults to the bundled list.
+            consonants (Optional[Iterable[str]]): Consonant letters. Defaults to the bundled list.
+            pronouns (Optional[Iterable[str]]): Pronouns. Defaults to the bundled list.
+        """
+        self.words: Set[str] = set(words)
+        self.vowels = frozenset(load_data_file(VOCAL_FILE) if vowels is None else vowels)
+        self.consonants = frozenset(load_data_file(CONSONANT_FILE) if consonants is None else consonants)
+        self.pronouns = frozenset(load_data_file(PRONOUN_FILE) if pronouns is None else pronouns)
+        self.version = 0
+        self._derive()
+
+    def _derive(self) -> None:
+        """Rebuilds the derived subsets from ``words``."""
+        self.single_words = {word for word in self.words if ' ' not in word}
+        self.multi_words = self.words - self.single_words
+        self.lemma_with_ra = {word for word in self.single_words if word.endswith('ra')}
+        self.lemma_with_a = {word for word in self.single_words if word.endswith('a')}
+        self.lemma_with_na = {word for word in self.single_words if word.startswith('na')}
+        self.lemma_with_da = {word for word in self.single_words if word.startswith('da')}
+
+    def add_words(self, words: Iterable[str]) -> None:
+        """Adds entries to the lexicon and refreshes the derived subsets."""
+        self.words.update(words)
+        self._derive()
+        self.version += 1
+
+    def remove_words(self, words: Iterable[str]) -> None:
+        """Removes entries from the lexicon and refreshes the derived subsets."""
+        self.words.difference_update(words)
+        self._derive()
+        self.version += 1
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.words
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+class LexiconWords(MutableSet):
+    """
+    A live, set-like view of a lexicon's entries.
+
+    Reads see the current entries. Every mutation goes through
+    ``Lexicon.add_words`` / ``Lexicon.remove_words``, so the derived subsets
+    and ``version`` stay consistent. Bulk methods (``update``, ``clear``, ...)
+    change the lexicon once, not once per entry.
+    """
+
+    def __init__(self, lexicon: Lexicon):
+        self.lexicon = lexicon
+
+    def __contains__(self, word: Any) -> bool:
+        return word in self.lexicon.words
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.lexicon.words)
+
+    def __len__(self) -> int:
+        return len(self.lexicon.words)
+
+    def add(self, word: str) -> None:
+        if word not in self.lexicon.words:
+            self.lexicon.add_words((word,))
+
+    def discard(self, word: str) -> None:
+        if word in self.lexicon.words:
+            self.lexicon.remove_words((word,))
+
+    def update(self, *others: Iterable[str]) -> None:
+        self.lexicon.add_words(word for other in others for word in other)
+
+    def difference_update(self, *others: Iterable[str]) -> None:
+        self.lexicon.remove_words(word for other in others for word in other)
+
+    def clear(self) -> None:
+        self.lexicon.remove_words(list(self.lexicon.words))
+
+    def __ior__(self, other: Iterable[str]) -> 'LexiconWords':
+        self.update(other)
+        return self
+
+    def __isub__(self, other: Iterable[str]) -> 'LexiconWords':
+        self.difference_update(other)
+        return self
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} entries)"
+
+_LEXICON_FILES: Dict[str, str] = {
+    'geser': DICTIONARY_FILE,
+}
+
+def get_lexicon(name: str = 'geser') -> Lexicon:
+    """
+    Returns the shared lexicon registered under ``name``.
+
+    Bundled lexicons are read from disk on first use only; every later call,
+    from any module, returns the same object.
+
+    Args:
+        name (str): Name of the lexicon. Defaults to 'geser'.
+
+    Returns:
+        Lexicon: The shared lexicon.
+
+    Raises:
+        KeyError: If no lexicon is registered under ``name``.
+    """
+    lexicon = _LEXICONS.get(name)
+    if lexicon is None:
+        with _LOCK:
+            lexicon = _LEXICONS.get(name)
+            if lexicon is None:
+                if name not in _LEXICON_FILES:
+                    raise KeyError(f"Unknown lexicon: '{name}'")
+                lexicon = _LEXICONS[name] = Lexicon(load_data_file(_LEXICON_FILES[name]))
+    return lexicon
+
+def register_lexicon(name: str, lexicon: Lexicon) -> None:
+    """
+    Registers a lexicon so that ``get_lexicon(name)`` returns it.
+
+    Args:
+        name (str): Name of the lexicon.
+        lexicon (Lexicon): The lexicon to share.
+
+    Raises:
+        TypeError: If lexicon is not a Lexicon.
+    """
+    if not isinstance(lexicon, Lexicon):
+        raise TypeError("Input 'lexicon' must be a Lexicon.")
+    with _LOCK:
+        _LEXICONS[name] = lexicon
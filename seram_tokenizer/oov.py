@@ -0,0 +1,333 @@
+import heapq
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from .lexicon import Lexicon
+from .parallel import batched
+from .tokenizer import Tokenizer
+
+_BATCH_SIZE = 1000
+
+class FrequencySketch:
+    """
+    Approximate counts of the most frequent items in a stream, in bounded memory.
+
+    A Misra-Gries summary: every item occurring more than
+    ``total / (capacity + 1)`` times is kept, and each kept count
+    underestimates the true one by at most ``error_bound``. Counts are buffered
+    in at most ``2 * capacity`` counters and pruned back to ``capacity`` in one
+    step, so an update costs amortised constant time. Two sketches of the same capacity
+    merge into a sketch of the combined stream with the same guarantee.
+
+    Attributes:
+        capacity (int): Number of counters kept after pruning.
+        total (int): Total weight of all items added.
+        error_bound (int): Largest possible underestimate of any count.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initializes the FrequencySketch.
+
+        Args:
+            capacity (int): Number of counters kept after pruning.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("'capacity' must be a positive integer.")
+        self.capacity = capacity
+        self.total = 0
+        self.error_bound = 0
+        self._counts: Dict[str, int] = {}
+
+    def add(self, item: str, count: int = 1) -> None:
+        """Adds ``count`` occurrences of an item."""
+        counts = self._counts
+        counts[item] = counts.get(item, 0) + count
+        self.total += count
+        if len(counts) > 2 * self.capacity:
+            self._prune()
+
+    def update(self, counts: Dict[str, int]) -> None:
+        """Adds the occurrences of every item of a count mapping."""
+        for item, count in counts.items():
+            self.add(item, count)
+
+    def _prune(self) -> None:
+        """Subtracts the (capacity + 1)-th largest count from every counter."""
+        counts = self._counts
+        if len(counts) <= self.capacity:
+            return
+        threshold = heapq.nlargest(self.capacity + 1, counts.values())[-1]
+        self._counts = {item: count - threshold for item, count in counts.items() if count > threshold}
+        self.error_bound += threshold
+
+    def merge(self, other: 'FrequencySketch') -> 'FrequencySketch':
+        """
+        Adds another sketch of the same capacity into this one.
+
+        Args:
+            other (FrequencySketch): The sketch to merge.
+
+        Returns:
+            FrequencySketch: This sketch.
+
+        Raises:
+            ValueError: If the capacities differ.
+        """
+        if other.capacity != self.capacity:
+            raise ValueError("Only sketches of the same capacity can be merged.")
+        counts = self._counts
+        for item, count in other._counts.items():
+            counts[item] = counts.get(item, 0) + count
+        self.total += other.total
+        self.error_bound += other.error_bound
+        self._prune()
+        return self
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Returns the most frequent items with their (under-estimated) counts.
+
+        Args:
+            n (Optional[int]): Number of items. Defaults to every kept item.
+
+        Returns:
+            List[Tuple[str, int]]: Items and counts, most frequent first.
+        """
+        ranked = sorted(self._counts.items(), key=lambda pair: (-pair[1], pair[0]))
+        return ranked if n is None else ranked[:n]
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+class DocumentCoverage(NamedTuple):
+    """
+    Lexicon coverage of one document.
+
+    Attributes:
+        tokens (int): Word tokens checked against the lexicon.
+        unknown (int): Word tokens missing from the lexicon.
+    """
+    tokens: int
+    unknown: int
+
+    @property
+    def coverage(self) -> float:
+        """Share of word tokens found in the lexicon (1.0 for a document without words)."""
+        return 1.0 - self.unknown / self.tokens if self.tokens else 1.0
+
+class OOVStats:
+    """
+    Mergeable out-of-vocabulary statistics of a corpus.
+
+    Unknown word types are counted exactly, or, when ``max_types`` is set,
+    approximately with a FrequencySketch that keeps memory bounded however
+    many distinct unknown words the corpus holds. Statistics of corpus parts
+    (e.g. computed by parallel workers) combine with ``merge``.
+
+    Attributes:
+        documents (int): Number of documents analysed.
+        tokens (int): Number of word tokens checked.
+        unknown (int): Number of word tokens missing from the lexicon.
+        max_types (Optional[int]): Sketch capacity, or None for exact counts.
+    """
+
+    def __init__(self, max_types: Optional[int] = None):
+        """
+        Initializes empty OOVStats.
+
+        Args:
+            max_types (Optional[int]): Number of unknown types tracked. None
+                counts every unknown type exactly.
+        """
+        self.documents = 0
+        self.tokens = 0
+        self.unknown = 0
+        self.max_types = max_types
+        self.counts: Union[Counter, FrequencySketch] = (
+            Counter() if max_types is None else FrequencySketch(max_types))
+
+    @property
+    def coverage(self) -> float:
+        """Share of word tokens of the corpus found in the lexicon."""
+        return 1.0 - self.unknown / self.tokens if self.tokens else 1.0
+
+    @property
+    def exact(self) -> bool:
+        """Whether unknown types are counted exactly."""
+        return self.max_types is None
+
+    def add(self, unknown_counts: Dict[str, int], tokens: int) -> DocumentCoverage:
+        """
+        Records one document.
+
+        Args:
+            unknown_counts (Dict[str, int]): Occurrences of each unknown word.
+            tokens (int): Number of word tokens of the document.
+
+        Returns:
+            DocumentCoverage: Coverage of the document.
+        """
+        unknown = sum(unknown_counts.values())
+        self.documents += 1
+        self.tokens += tokens
+        self.unknown += unknown
+        self.counts.update(unknown_counts)
+        return DocumentCoverage(tokens, unknown)
+
+    def merge(self, other: 'OOVStats') -> 'OOVStats':
+        """
+        Adds the statistics of another corpus part into these.
+
+        Args:
+            other (OOVStats): Statistics with the same ``max_types``.
+
+        Returns:
+            OOVStats: These statistics.
+
+        Raises:
+            ValueError: If max_types differs.
+        """
+        if other.max_types != self.max_types:
+            raise ValueError("Only statistics with the same 'max_types' can be merged.")
+        self.documents += other.documents
+        self.tokens += other.tokens
+        self.unknown += other.unknown
+        if self.exact:
+            self.counts.update(other.counts)
+        else:
+            self.counts.merge(other.counts)
+        return self
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Returns the most frequent unknown words.
+
+        Args:
+            n (Optional[int]): Number of words. Defaults to all tracked words.
+
+        Returns:
+            List[Tuple[str, int]]: Words and counts, most frequent first (ties
+            alphabetically). With a sketch, counts may be underestimated by up
+            to ``counts.error_bound``.
+        """
+        if self.exact:
+            ranked = sorted(self.counts.items(), key=lambda pair: (-pair[1], pair[0]))
+            return ranked if n is None else ranked[:n]
+        return self.counts.most_common(n)
+
+    def as_dict(self, top: int = 20) -> Dict[str, object]:
+        """Returns a plain dictionary summary with the ``top`` unknown words."""
+        return {
+            'documents': self.documents,
+            'tokens': self.tokens,
+            'unknown': self.unknown,
+            'coverage': self.coverage,
+            'unknown_types': len(self.counts),
+            'exact': self.exact,
+            'most_common': self.most_common(top),
+        }
+
+class OOVAnalyzer:
+    """
+    Streams token sequences or texts against a lexicon and collects OOV statistics.
+
+    Only word tokens are checked: punctuation, numbers and affix markers
+    ('_ra', 'na_') are skipped. Unlike ``find_unmatched_words``, which returns
+    every unmatched occurrence of one in-memory list, the analyzer keeps one
+    count per unknown type (or a bounded sketch of them) and never holds more
+    than one batch of documents.
+
+    Attributes:
+        lexicon (Lexicon): The lexicon checked against.
+        lowercase (bool): Whether tokens are lower-cased before lookup.
+        stats (OOVStats): Statistics accumulated so far.
+    """
+
+    def __init__(self, lexicon: Optional[Lexicon] = None, max_types: Optional[int] = None,
+                 lowercase: bool = True, tokenizer: Optional[Tokenizer] = None):
+        """
+        Initializes the OOVAnalyzer.
+
+        Args:
+            lexicon (Optional[Lexicon]): Lexicon to check against. Defaults to
+                the lexicon of ``tokenizer``.
+            max_types (Optional[int]): Track only about this many of the most
+                frequent unknown types, in bounded memory. None counts all of them.
+            lowercase (bool): Lower-case tokens before lookup, so sentence-initial
+                words are not reported. Defaults to True.
+            tokenizer (Optional[Tokenizer]): Tokenizer for raw texts. Defaults
+                to ``Tokenizer()``.
+        """
+        self.tokenizer = Tokenizer() if tokenizer is None else tokenizer
+        self.lexicon = self.tokenizer.lexicon if lexicon is None else lexicon
+        self.lowercase = lowercase
+        self.stats = OOVStats(max_types)
+
+    def _is_word(self, token: str) -> bool:
+        return (not token.startswith('_') and not token.endswith('_')
+                and any(char.isalpha() for char in token))
+
+    def add_document(self, tokens: Iterable[str]) -> DocumentCoverage:
+        """
+        Checks the tokens of one document.
+
+        Args:
+            tokens (Iterable[str]): The document's tokens.
+
+        Returns:
+            DocumentCoverage: Coverage of the document.
+        """
+        words = [token for token in tokens if self._is_word(token)]
+        if self.lowercase:
+            words = [word.lower() for word in words]
+        entries = self.lexicon.words
+        unknown = Counter(word for word in words if word not in entries)
+        return self.stats.add(unknown, len(words))
+
+    def analyze(self, documents: Iterable[Iterable[str]]) -> Iterator[DocumentCoverage]:
+        """
+        Lazily checks tokenized documents, one at a time.
+
+        Args:
+            documents (Iterable[Iterable[str]]): Token sequences, one per document.
+
+        Yields:
+            DocumentCoverage: Coverage of each document, in input order.
+        """
+        for tokens in documents:
+            yield self.add_document(tokens)
+
+    def analyze_texts(self, texts: Iterable[str]) -> Iterator[DocumentCoverage]:
+        """
+        Lazily tokenizes and checks raw texts, one document per text.
+
+        Args:
+            texts (Iterable[str]): The texts.
+
+        Yields:
+            DocumentCoverage: Coverage of each text, in input order.
+        """
+        for batch in batched(texts, _BATCH_SIZE):
+            yield from self.analyze(self.tokenizer.tokenize_batch(batch))
+
+    def analyze_file(self, path: str, encoding: str = 'utf-8') -> Iterator[DocumentCoverage]:
+        """
+        Lazily tokenizes and checks a text file, one document per line.
+
+        Args:
+            path (str): Path to the text file.
+            encoding (str): File encoding. Defaults to 'utf-8'.
+
+        Yields:
+            DocumentCoverage: Coverage of each line, in file order.
+        """
+        with open(path, 'r', encoding=encoding) as file:
+            yield from self.analyze_texts(line.rstrip('\r\n') for line in file)
+
+    def merge(self, other: 'OOVAnalyzer') -> 'OOVAnalyzer':
+        """Adds the statistics of another analyzer into this one and returns it."""
+        self.stats.merge(other.stats)
+        return self
@@ -1,4 +1,23 @@
 import re
+from typing import Iterable, Iterator, List
+
+# A word followed by a detached paragog particle ('a' or 'ra') that stands on its own.
+PARAGOG_PATTERN = re.compile(r'(\w+)\s+(a|ra)(?=\s|$)')
+
+def normalize_paragogs(text: str) -> str:
+    """
+    Merges every word + detached 'a'/'ra' pair of a text in a single pass.
+
+    Only the matched occurrences are merged; other occurrences of the same
+    characters (e.g. inside longer words) are left untouched.
+
+    Args:
+        text (str): The text to normalize.
+
+    Returns:
+        str: The normalized text.
+    """
+    return PARAGOG_PATTERN.sub(r'\1\2', text)
 
 class GeserParagogNormalizer:
     """
@@ -6,42 +25,47 @@ class GeserParagogNormalizer:
     A paragog is defined as a word ending with 'a' or 'ra'.
     """
 
-    def __init__(self, text_list: list):
+    def __init__(self, text_list: Iterable[str]):
         """
-        Initializes the ParagogNormalizer with a list of sentences.
+        Initializes the ParagogNormalizer with sentences.
 
         Args:
-            text_list (list): A list of sentences (strings) to be normalized.
+            text_list (Iterable[str]): Sentences (strings) to be normalized. Any
+                iterable is accepted, including generators, which are consumed
+                lazily by ``iter_normalize``.
+
+        Raises:
+            TypeError: If the input is a single string or not iterable.
         """
-        if not isinstance(text_list, list):
-            raise TypeError("Input must be a list of strings.")
-        
-        for sentence in text_list:
+        if isinstance(text_list, str) or not isinstance(text_list, Iterable):
+            raise TypeError("Input must be an iterable of strings.")
+
+        self.text_list = text_list
+        self.paragog_pattern = PARAGOG_PATTERN
+
+    def iter_normalize(self) -> Iterator[str]:
+        """
+        Lazily normalizes the sentences, one at a time.
+
+        Sentences too short to hold a paragog (fewer than two words) are passed
+        through unchanged.
+
+        Yields:
+            str: The normalized sentences, in input order.
+
+        Raises:
+            TypeError: If an element is not a string.
+        """
+        substitute = self.paragog_pattern.sub
+        for sentence in self.text_list:
             if not isinstance(sentence, str):
                 raise TypeError("All elements in the list must be strings.")
-            if len(sentence.strip().split()) < 2:
-                raise ValueError(f"Each sentence must contain at least two words: '{sentence}'")
-        
-        self.text_list = text_list
-        self.paragog_pattern = re.compile(r'(\w+)\s+(a|ra)(?=\s|$)')
+            yield substitute(r'\1\2', sentence)
 
-    def normalize(self) -> list:
+    def normalize(self) -> List[str]:
         """
         Normalizes paragogs by merging word + 'a'/'ra' into a single token.
         Returns:
             list: A list of normalized sentences.
         """
-        normalized_text = []      
-        for text in self.text_list:
-            new_text = text
-            matches = self.paragog_pattern.findall(text)
-
-            for word, suffix in matches:
-                original = f"{word} {suffix}"
-                merged = f"{word}{suffix}"
-                new_text = new_text.replace(original, merged)
-            normalized_text.append(new_text)
-
-        return normalized_text
-            
-    
\ No newline at end of file
+        return list(self.iter_normalize())
@@ -0,0 +1,162 @@
+import multiprocessing
+import os
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from .tokenizer import Tokenizer
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Tokenizer of the current worker process, built once by _init_worker.
+_WORKER_TOKENIZER: Optional[Tokenizer] = None
+
+def _init_worker(options: Dict[str, Any]) -> None:
+    """Builds the tokenizer of a worker process once, when the worker starts."""
+    global _WORKER_TOKENIZER
+    _WORKER_TOKENIZER = Tokenizer(**options)
+
+def _tokenize_chunk(texts: List[str]) -> List[List[str]]:
+    """Tokenizes one chunk of texts inside a worker process."""
+    return _WORKER_TOKENIZER.tokenize_batch(texts)
+
+def batched(items: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """
+    Groups an iterable into lists of at most ``batch_size`` items.
+
+    Args:
+        items (Iterable[Any]): The items to group.
+        batch_size (int): Maximum number of items per group.
+
+    Yields:
+        List[Any]: Consecutive groups of items, in input order.
+    """
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+class CorpusStats:
+    """
+    Throughput of a corpus tokenization run.
+
+    Attributes:
+        sentences (int): Number of texts tokenized so far.
+        tokens (int): Number of tokens produced so far.
+        seconds (float): Wall-clock time spent so far.
+    """
+
+    def __init__(self):
+        self.sentences = 0
+        self.tokens = 0
+        self.seconds = 0.0
+
+    @property
+    def sentences_per_second(self) -> float:
+        """Texts tokenized per second of wall-clock time."""
+        return self.sentences / self.seconds if self.seconds else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Tokens produced per second of wall-clock time."""
+        return self.tokens / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        """Returns the statistics as a plain dictionary."""
+        return {
+            'sentences': self.sentences,
+            'tokens': self.tokens,
+            'seconds': self.seconds,
+            'sentences_per_second': self.sentences_per_second,
+            'tokens_per_second': self.tokens_per_second,
+        }
+
+    def __str__(self) -> str:
+        return (f"{self.sentences} sentences, {self.tokens} tokens in {self.seconds:.2f}s "
+                f"({self.sentences_per_second:.1f} sentences/s, {self.tokens_per_second:.1f} tokens/s)")
+
+class ParallelTokenizer:
+    """
+    Tokenizes a corpus on several CPU cores with a process pool.
+
+    Texts are sent to the workers in chunks to amortise inter-process
+    communication, and results are yielded in the original order. Each worker
+    builds its tokenizer (and loads the lexicon) once, at start-up.
+
+    Attributes:
+        workers (int): Number of worker processes.
+        chunk_size (int): Number of texts sent to a worker per task.
+        stats (CorpusStats): Throughput of the latest run.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 **tokenizer_options: Any):
+        """
+        Initializes the ParallelTokenizer.
+
+        Args:
+            workers (Optional[int]): Number of worker processes. Defaults to the
+                number of CPUs. With 1 worker, texts are tokenized in-process.
+            chunk_size (int): Number of texts per task. Defaults to 1000.
+            **tokenizer_options: Keyword arguments passed to ``Tokenizer``
+                (e.g. use_suffix=True).
+
+        Raises:
+            ValueError: If workers or chunk_size is not positive.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+            raise ValueError("'workers' must be a positive integer.")
+        if chunk_size <= 0:
+            raise ValueError("'chunk_size' must be a positive integer.")
+
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.tokenizer_options = tokenizer_options
+        self.stats = CorpusStats()
+
+    def tokenize_corpus(self, texts: Iterable[str]) -> Iterator[List[str]]:
+        """
+        Lazily tokenizes a corpus, yielding one token list per text in input order.
+
+        Only a bounded number of chunks is in flight at any time, so the corpus
+        can be an arbitrarily large iterator (e.g. the lines of a file).
+
+        Args:
+            texts (Iterable[str]): The texts to be tokenized.
+
+        Yields:
+            List[str]: The tokens of each text, in input order.
+        """
+        self.stats = CorpusStats()
+        started = time.perf_counter()
+        try:
+            for tokens in self._run(texts):
+                self.stats.sentences += 1
+                self.stats.tokens += len(tokens)
+                yield tokens
+        finally:
+            self.stats.seconds = time.perf_counter() - started
+
+    def _run(self, texts: Iterable[str]) -> Iterator[List[str]]:
+        chunks = batched(texts, self.chunk_size)
+
+        if self.workers == 1:
+            tokenizer = Tokenizer(**self.tokenizer_options)
+            for chunk in chunks:
+                yield from tokenizer.tokenize_batch(chunk)
+            return
+
+        max_pending = self.workers * 2
+        with multiprocessing.Pool(self.workers, initializer=_init_worker,
+                                  initargs=(self.tokenizer_options,)) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.apply_async(_tokenize_chunk, (chunk,)))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().get()
+            while pending:
+                yield from pending.popleft().get()
@@ -0,0 +1,167 @@
+import re
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+from .lexicon import Lexicon, get_lexicon
+
+# A single word or reduplication token, as the tokenizer scans it.
+_WORD_PATTERN = re.compile(r'\w+-\w+|\w+')
+
+class PhraseMatch(NamedTuple):
+    """
+    A run of tokens forming a multi-word lexicon entry.
+
+    Attributes:
+        start (int): Index of the first token of the run.
+        end (int): Index after the last token of the run.
+        phrase (str): The lexicon entry.
+    """
+    start: int
+    end: int
+    phrase: str
+
+class PhraseMatcher:
+    """
+    Finds multi-word lexicon entries in token sequences.
+
+    The entries are compiled into an Aho–Corasick automaton over tokens: a trie
+    of the entries' words plus failure links. A token sequence is matched in a
+    single pass with one transition per token (failure links amortised), so the
+    cost does not depend on the number or length of the entries. Overlapping
+    matches are resolved leftmost-longest.
+
+    Only entries of two or more whitespace-separated words are compiled, and
+    each word must be one token (a reduplication such as 'far-farara' is one
+    word), so entries containing punctuation are skipped. Matching is
+    case-sensitive, like lexicon lookups.
+
+    Attributes:
+        phrases (List[str]): The compiled entries.
+        max_length (int): Number of words of the longest entry (0 if none).
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        """
+        Compiles the automaton.
+
+        Args:
+            phrases (Iterable[str]): Multi-word entries, e.g. ``Lexicon.multi_words``.
+        """
+        self.phrases: List[str] = []
+        self.max_length = 0
+        self._goto: List[Dict[str, int]] = [{}]
+        # For each state: the entry ending there and its length in words, if any.
+        self._entry: List[Optional[str]] = [None]
+        self._length: List[int] = [0]
+
+        for phrase in sorted(set(phrases)):
+            words = phrase.split()
+            if len(words) < 2 or not all(_WORD_PATTERN.fullmatch(word) for word in words):
+                continue
+            state = 0
+            for word in words:
+                following = self._goto[state].get(word)
+                if following is None:
+                    following = self._goto[state][word] = len(self._goto)
+                    self._goto.append({})
+                    self._entry.append(None)
+                    self._length.append(0)
+                state = following
+            self._entry[state] = ' '.join(words)
+            self._length[state] = len(words)
+            self.phrases.append(phrase)
+            self.max_length = max(self.max_length, len(words))
+
+        # Breadth-first failure links, and for each state the nearest state on
+        # its failure chain that ends an entry (so every match is reported).
+        self._fail = [0] * len(self._goto)
+        self._output = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, following in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(word, 0)
+                self._fail[following] = target if target != following else 0
+                link = self._fail[following]
+                self._output[following] = link if self._length[link] else self._output[link]
+                queue.append(following)
+
+    @classmethod
+    def from_lexicon(cls, lexicon: Optional[Lexicon] = None) -> 'PhraseMatcher':
+        """
+        Compiles the multi-word entries of a lexicon.
+
+        Args:
+            lexicon (Optional[Lexicon]): The lexicon. Defaults to the shared Geser lexicon.
+
+        Returns:
+            PhraseMatcher: The matcher.
+        """
+        lexicon = get_lexicon() if lexicon is None else lexicon
+        return cls(lexicon.multi_words)
+
+    def find(self, tokens: Sequence[Optional[str]]) -> List[PhraseMatch]:
+        """
+        Finds the entries in a token sequence, leftmost-longest and without overlaps.
+
+        Args:
+            tokens (Sequence[Optional[str]]): The tokens. A None never matches,
+                e.g. to keep a token out of every phrase.
+
+        Returns:
+            List[PhraseMatch]: The matches, in token order.
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        entry, length = self._entry, self._length
+
+        # Single pass: the state of the longest entry starting at each token.
+        longest: Dict[int, int] = {}
+        state = 0
+        for index, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            found = state if length[state] else output[state]
+            while found:
+                start = index + 1 - length[found]
+                if length[found] > length[longest.get(start, 0)]:
+                    longest[start] = found
+                found = output[found]
+
+        matches = []
+        end = 0
+        for start in sorted(longest):
+            if start >= end:
+                found = longest[start]
+                end = start + length[found]
+                matches.append(PhraseMatch(start, end, entry[found]))
+        return matches
+
+    def merge(self, tokens: List[str], keys: Optional[Sequence[Optional[str]]] = None) -> List[str]:
+        """
+        Replaces every matched run of tokens by one token, the entry itself.
+
+        Args:
+            tokens (List[str]): The tokens.
+            keys (Optional[Sequence[Optional[str]]]): What to match instead of
+                the tokens, one per token. Defaults to the tokens.
+
+        Returns:
+            List[str]: The tokens with phrases merged (the input list if none matched).
+        """
+        matches = self.find(tokens if keys is None else keys)
+        if not matches:
+            return tokens
+        merged: List[str] = []
+        position = 0
+        for start, end, phrase in matches:
+            merged.extend(tokens[position:start])
+            merged.append(phrase)
+            position = end
+        merged.extend(tokens[position:])
+        return merged
+
+    def __len__(self) -> int:
+        return len(self.phrases)
@@ -1,70 +1,25 @@
-import os
-from typing import List, Set
-from pathlib import Path
-from importlib.resources import files
+from typing import Any, List, Optional
+from .lexicon import DICTIONARY_FILE, Lexicon, LexiconWords, get_data_file_path, get_lexicon, load_word_set
 
-def get_resource_path(package: str, resource: str) -> str:
-    return str(files(package) / resource)
+DICTIONARY_FILE_PATH = get_data_file_path(DICTIONARY_FILE)
 
-def get_data_file_path(filename: str) -> str:
-    """Get path to data file, trying multiple methods for compatibility."""
-    try:
-        return get_resource_path(__name__, f'data/{filename}')
-    except Exception:
-        # Fallback to relative path from current file
-        current_dir = Path(__file__).parent
-        data_path = current_dir / 'data' / filename
-        return str(data_path)
-
-# INSPIRED BY The implementation of https://github.com/AbdullahAlabbas/Wordle/blob/main/play_wordle.py
-def load_word_set(file_path: str) -> Set[str]:
-    """
-    Load words from a file into a set for O(1) lookup performance.
-    
-    Args:
-        file_path (str): Path to the file containing words
-        
-    Returns:
-        Set[str]: Set of words from the file
-        
-    Raises:
-        FileNotFoundError: If the file doesn't exist
-    """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found at: {file_path}")
-    
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return {line.strip() for line in f if line.strip()}
-
-# Define file paths using modern resource management
-DICTIONARY_FILE_PATH = get_data_file_path('geser_word.txt')
-
-# INITIALIZE SETS
-DICTIONARY_WORDS: Set[str] = set()
-
-# Load Dictionary, Vocal, and Consonant letters from files
-try:
-    DICTIONARY_WORDS = load_word_set(DICTIONARY_FILE_PATH)
-except FileNotFoundError as e:
-    print(f"Error: {e}. Please ensure all necessary files exist.")
-except Exception as e:
-    print(f"An unexpected error occurred: {e}")
-
-# Pre-filter dictionary words for efficiency
-SINGLE_WORD_DICTIONARY_ENTRIES: Set[str] = {
-    word for word in DICTIONARY_WORDS 
-    if ' ' not in word  
+# Module-level sets kept for backwards compatibility, loaded on first access
+# rather than at import time. DICTIONARY_WORDS is a live view of the shared
+# lexicon whose changes go through add_words / remove_words; the derived
+# subsets are read-only snapshots, since changing them alone would leave the
+# lexicon inconsistent.
+_LEXICON_ATTRIBUTES = {
+    'SINGLE_WORD_DICTIONARY_ENTRIES': 'single_words',
+    'LEMMA_WITH_NA': 'lemma_with_na',
+    'LEMMA_WITH_DA': 'lemma_with_da',
 }
 
-LEMMA_WITH_NA: Set[str] = {
-    word for word in SINGLE_WORD_DICTIONARY_ENTRIES 
-    if word.startswith('na')
-}
-
-LEMMA_WITH_DA: Set[str] = {
-    word for word in SINGLE_WORD_DICTIONARY_ENTRIES 
-    if word.startswith('da')
-}
+def __getattr__(name: str) -> Any:
+    if name == 'DICTIONARY_WORDS':
+        return LexiconWords(get_lexicon())
+    if name in _LEXICON_ATTRIBUTES:
+        return frozenset(getattr(get_lexicon(), _LEXICON_ATTRIBUTES[name]))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class PrefixAnalyser:
     """
@@ -74,6 +29,7 @@ class PrefixAnalyser:
     that are not present in the predefined dictionary, indicating potential suffixed forms.
     
     Attributes:
+        lexicon (Lexicon): The lexicon lemmas are checked against.
         words (str): The original input string of space-separated words.
         split_words (List[str]): List of individual words from the input.
         da_words (List[str]): Words start with 'da' suffix.
@@ -82,12 +38,14 @@ class PrefixAnalyser:
         checked_da (List[str]): 'na' words not found in dictionary lemmas.
     """
         
-    def __init__(self, words: str):
+    def __init__(self, words: str, lexicon: Optional[Lexicon] = None):
         """
         Initialize the SuffixAnalyser with input text.
         
         Args:
             words (str): A string of space-separated words to analyze.
+            lexicon (Optional[Lexicon]): Lexicon to check lemmas against.
+                Defaults to the shared Geser lexicon.
             
         Raises:
             TypeError: If input is not a string.
@@ -98,6 +56,7 @@ class PrefixAnalyser:
         if not words.strip():
             raise ValueError("Input 'words' cannot be an empty string.")
         
+        self.lexicon = get_lexicon() if lexicon is None else lexicon
         self.words = words.lower()
         self.split_words = self.words.split()
         self.na_words = []
@@ -108,11 +67,11 @@ class PrefixAnalyser:
         for word in self.split_words:
             if word.startswith('na'):
                 self.na_words.append(word)
-                if word not in LEMMA_WITH_NA:
+                if word not in self.lexicon.lemma_with_na:
                     self.checked_na.append(word)
             elif word.startswith('da'):
                 self.da_words.append(word)
-                if word not in LEMMA_WITH_DA:
+                if word not in self.lexicon.lemma_with_da:
                     self.checked_da.append(word)
     
     def get_na_words(self) -> List[str]:
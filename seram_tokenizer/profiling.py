@@ -0,0 +1,110 @@
+import threading
+from typing import Callable, Dict, Optional
+
+# Pipeline stages timed by a PipelineProfiler:
+#   scan   the regex sweep producing word, reduplication and punctuation tokens
+#          (paragog particles and multi-word phrases are merged during this stage)
+#   affix  the per-token affix split, answered from the affix cache when possible
+#   spans  a whole ``tokenize_spans`` call (scan, split and offset mapping)
+STAGES = ('scan', 'affix', 'spans')
+
+COUNTERS = ('texts', 'tokens', 'reduplications', 'paragog_merges', 'phrase_merges', 'suffix_splits',
+            'prefix_splits', 'subword_splits')
+
+_CACHE_COUNTERS = ('hits', 'misses', 'evictions', 'invalidations')
+
+# Called with (stage, seconds, tokens) every time a stage finishes.
+StageCallback = Callable[[str, float, int], None]
+
+class PipelineProfiler:
+    """
+    Cumulative per-stage timings and counters of a Tokenizer.
+
+    Attach one with ``Tokenizer.enable_profiling``. A tokenizer without a
+    profiler pays a single attribute check per text; with one, every text is
+    timed stage by stage with ``time.perf_counter``.
+
+    Attributes:
+        callback (Optional[StageCallback]): Called with (stage, seconds, tokens)
+            after every stage, e.g. to export to a metrics system.
+    """
+
+    def __init__(self, callback: Optional[StageCallback] = None,
+                 cache_info: Optional[Callable[[], Dict[str, Optional[int]]]] = None):
+        """
+        Initializes the PipelineProfiler.
+
+        Args:
+            callback (Optional[StageCallback]): Per-stage hook. Defaults to None.
+            cache_info (Optional[Callable[[], Dict[str, Optional[int]]]]): Returns
+                the affix cache counters of the profiled tokenizer.
+        """
+        self.callback = callback
+        self._cache_info = cache_info
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Zeroes every timing and counter, including the reported cache counters."""
+        with self._lock:
+            self._seconds = dict.fromkeys(STAGES, 0.0)
+            self._calls = dict.fromkeys(STAGES, 0)
+            self._tokens = dict.fromkeys(STAGES, 0)
+            self._counters = dict.fromkeys(COUNTERS, 0)
+        self.sync_cache()
+
+    def sync_cache(self) -> None:
+        """
+        Takes the current affix cache counters as the zero point of the
+        reported ones. Called when the tokenizer replaces its cache.
+        """
+        with self._lock:
+            self._cache_base = self._cache_info() if self._cache_info else None
+
+    def record(self, stage: str, seconds: float, tokens: int) -> None:
+        """
+        Adds one run of a stage.
+
+        Args:
+            stage (str): One of STAGES.
+            seconds (float): Wall time of the run.
+            tokens (int): Tokens produced by the run.
+        """
+        with self._lock:
+            self._seconds[stage] += seconds
+            self._calls[stage] += 1
+            self._tokens[stage] += tokens
+        if self.callback is not None:
+            self.callback(stage, seconds, tokens)
+
+    def count(self, **counts: int) -> None:
+        """Adds to the named counters, e.g. ``count(texts=1, tokens=12)``."""
+        with self._lock:
+            for name, value in counts.items():
+                self._counters[name] += value
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        """
+        Returns the timings and counters accumulated since the last reset.
+
+        Returns:
+            Dict[str, Dict[str, object]]: 'stages' maps every stage to its
+            calls, seconds and tokens; 'counters' holds the text, token,
+            reduplication, paragog-merge, phrase-merge, affix-split and
+            subword-split (words cut by a SubwordModel) counts; 'cache' holds
+            the affix (or subword) cache capacity, size, hits, misses,
+            evictions and invalidations (counters relative to the last reset).
+        """
+        with self._lock:
+            snapshot: Dict[str, Dict[str, object]] = {
+                'stages': {stage: {'calls': self._calls[stage], 'seconds': self._seconds[stage],
+                                   'tokens': self._tokens[stage]} for stage in STAGES},
+                'counters': dict(self._counters),
+            }
+            base = self._cache_base
+        if self._cache_info is not None:
+            cache = dict(self._cache_info())
+            for name in _CACHE_COUNTERS:
+                cache[name] -= base[name]
+            snapshot['cache'] = cache
+        return snapshot
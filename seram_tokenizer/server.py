@@ -0,0 +1,549 @@
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from .languages import available_languages
+from .tokenizer import MultilingualTokenizer
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_WAIT = 0.005
+DEFAULT_QUEUE_SIZE = 1024
+
+# Number of most recent text latencies kept for the percentile stats.
+_LATENCY_WINDOW = 10000
+_MAX_BODY = 16 << 20
+_MAX_HEADERS = 100
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 431: 'Request Header Fields Too Large',
+            500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+# Tokenizer of the current worker process, built once by _init_worker.
+_WORKER_TOKENIZER: Optional[MultilingualTokenizer] = None
+
+def _init_worker(options: Dict[str, Any]) -> None:
+    """Builds the tokenizer of a worker process once, when the worker starts."""
+    global _WORKER_TOKENIZER
+    _WORKER_TOKENIZER = MultilingualTokenizer(**options)
+
+def _tokenize_batch(texts: List[str], language: Optional[str]) -> List[List[str]]:
+    """Tokenizes one micro-batch inside a worker process."""
+    return _WORKER_TOKENIZER.tokenize_batch(texts, language)
+
+class HTTPError(Exception):
+    """An error answered with an HTTP status code and a JSON message."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+class ServerStats:
+    """
+    Counters of a TokenizationServer.
+
+    Attributes:
+        requests (int): HTTP tokenize requests answered with tokens.
+        texts (int): Texts tokenized, over all requests and direct calls.
+        rejected (int): Texts refused because the queue was full.
+        batches (int): Micro-batches sent to the worker pool.
+        max_queue_depth (int): Largest number of queued texts seen.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.texts = 0
+        self.rejected = 0
+        self.batches = 0
+        self.max_queue_depth = 0
+        self.latencies: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    def as_dict(self, queue_depth: int) -> Dict[str, Any]:
+        """Returns the counters, the current queue depth and latency percentiles in milliseconds."""
+        ordered = sorted(self.latencies)
+
+        def percentile(fraction: float) -> float:
+            if not ordered:
+                return 0.0
+            return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+        return {
+            'requests': self.requests,
+            'texts': self.texts,
+            'rejected': self.rejected,
+            'batches': self.batches,
+            'mean_batch_size': self.texts / self.batches if self.batches else 0.0,
+            'queue_depth': queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'latency_p50_ms': percentile(0.50),
+            'latency_p95_ms': percentile(0.95),
+            'latency_p99_ms': percentile(0.99),
+        }
+
+class TokenizationServer:
+    """
+    An asyncio HTTP tokenization service, using the standard library only.
+
+    Concurrent requests are queued and coalesced into micro-batches of at most
+    ``max_batch_size`` texts, waiting at most ``max_wait`` seconds for a batch
+    to fill. Batches run on a worker pool, so the event loop only parses
+    requests and never tokenizes. The queue is bounded: when it is full, new
+    texts are refused with 503 instead of piling up in memory.
+
+    Endpoints:
+        ``POST /tokenize`` with ``{"text": ..., "language": ...}`` returns
+        ``{"tokens": [...]}``; with ``{"texts": [...]}`` it returns one token
+        list per text. ``GET /stats`` returns ServerStats as JSON.
+
+    Use it as an async context manager, or call ``start`` and ``close``.
+
+    Attributes:
+        host (str): Interface the TCP server listens on.
+        port (int): TCP port; 0 picks a free port, readable once started.
+        unix_path (Optional[str]): Unix socket path, used instead of TCP when set.
+        stats (ServerStats): The server's counters.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, unix_path: Optional[str] = None,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait: float = DEFAULT_MAX_WAIT,
+                 queue_size: int = DEFAULT_QUEUE_SIZE, workers: Optional[int] = None,
+                 executor: str = 'process', **tokenizer_options: Any):
+        """
+        Initializes the TokenizationServer.
+
+        Args:
+            host (str): Interface to listen on. Defaults to localhost.
+            port (int): TCP port. Defaults to 0 (any free port).
+            unix_path (Optional[str]): Listen on this Unix socket instead of TCP.
+            max_batch_size (int): Most texts per micro-batch. Defaults to 64.
+            max_wait (float): Longest wait, in seconds, for a micro-batch to
+                fill once its first text arrived. Defaults to 0.005.
+            queue_size (int): Most texts waiting to be batched. Defaults to 1024.
+            workers (Optional[int]): Worker pool size. Defaults to the number of CPUs.
+            executor (str): 'process' (tokenize on other cores) or 'thread'
+                (cheaper to start; tokenization then shares the GIL).
+            **tokenizer_options: Keyword arguments passed to MultilingualTokenizer
+                (e.g. use_suffix=True, default_language='geser').
+
+        Raises:
+            ValueError: If a size is not positive, max_wait is negative or the
+                executor kind is unknown.
+        """
+        if max_batch_size <= 0 or queue_size <= 0:
+            raise ValueError("'max_batch_size' and 'queue_size' must be positive integers.")
+        if max_wait < 0:
+            raise ValueError("'max_wait' must not be negative.")
+        if executor not in ('process', 'thread'):
+            raise ValueError(f"Unknown executor: '{executor}'")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+            raise ValueError("'workers' must be a positive integer.")
+
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.queue_size = queue_size
+        self.workers = workers
+        self.executor_kind = executor
+        self.tokenizer_options = tokenizer_options
+        self.stats = ServerStats()
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._executor: Optional[Executor] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._running: set = set()
+
+    async def start(self) -> 'TokenizationServer':
+        """Starts the worker pool, the batcher and the listening socket."""
+        if self.executor_kind == 'process':
+            self._executor = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                                 initargs=(self.tokenizer_options,))
+            self._run_batch = _tokenize_batch
+        else:
+            self._executor = ThreadPoolExecutor(self.workers)
+            self._run_batch = MultilingualTokenizer(**self.tokenizer_options).tokenize_batch
+
+        self._queue = asyncio.Queue(self.queue_size)
+        self._slots = asyncio.Semaphore(self.workers)
+        self._batcher = asyncio.ensure_future(self._batch_loop())
+        if self.unix_path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_connection, self.unix_path)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self) -> None:
+        """Stops accepting connections, finishes running batches and shuts the pool down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, _, future, _ = self._queue.get_nowait()
+                if not future.done():
+                    future.set_exception(HTTPError(503, 'Server is shutting down.'))
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._server = self._batcher = self._executor = None
+
+    async def __aenter__(self) -> 'TokenizationServer':
+        return await self.start()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of texts waiting to be batched."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def tokenize(self, text: str, language: Optional[str] = None) -> List[str]:
+        """
+        Queues one text for the next micro-batch and waits for its tokens.
+
+        Args:
+            text (str): The text.
+            language (Optional[str]): Language code. Defaults to the default language.
+
+        Returns:
+            List[str]: The tokens.
+
+        Raises:
+            HTTPError: 503 if the queue is full.
+        """
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((text, language, future, time.perf_counter()))
+        except asyncio.QueueFull:
+            self.stats.rejected += 1
+            raise HTTPError(503, 'Tokenization queue is full, retry later.')
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, self._queue.qsize())
+        return await future
+
+    async def _batch_loop(self) -> None:
+        """Collects queued texts into micro-batches and hands them to the pool."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                if queue.empty():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(queue.get_nowait())
+
+            # At most one batch per worker is in flight; later ones wait in the queue.
+            await self._slots.acquire()
+            task = asyncio.ensure_future(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[str, Optional[str], asyncio.Future, float]]) -> None:
+        """Tokenizes one micro-batch on the pool, one pool call per language."""
+        loop = asyncio.get_running_loop()
+        try:
+            groups: Dict[Optional[str], List[Tuple[str, asyncio.Future, float]]] = {}
+            for text, language, future, queued in batch:
+                groups.setdefault(language, []).append((text, future, queued))
+            self.stats.batches += 1
+            for language, items in groups.items():
+                try:
+                    results = await loop.run_in_executor(
+                        self._executor, self._run_batch, [text for text, _, _ in items], language)
+                except Exception as e:
+                    for _, future, _ in items:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                now = time.perf_counter()
+                for (_, future, queued), tokens in zip(items, results):
+                    self.stats.texts += 1
+                    self.stats.latencies.append(now - queued)
+                    if not future.done():
+                        future.set_result(tokens)
+        finally:
+            self._slots.release()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serves HTTP/1.1 requests on one connection until it is closed."""
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HTTPError as e:
+                    # Where the next request starts is unknown: answer, then close.
+                    await self._respond(writer, e.status, {'error': str(e)}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                try:
+                    status, payload = 200, await self._dispatch(method, path, body)
+                except HTTPError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except Exception as e:
+                    status, payload = 500, {'error': f'{type(e).__name__}: {e}'}
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool) -> None:
+        """Writes one JSON response."""
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('ascii') + data)
+        await writer.drain()
+
+    @staticmethod
+    async def _read_line(reader: asyncio.StreamReader) -> bytes:
+        """Reads one line of the request head."""
+        try:
+            return await reader.readline()
+        except ValueError:
+            # The line is longer than the reader's limit (64 KiB by default).
+            raise HTTPError(400, 'Request line or header too long.')
+
+    async def _read_request(self, reader: asyncio.StreamReader
+                            ) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        """
+        Reads one request; returns None once the client closed the connection.
+
+        Raises:
+            HTTPError: 400 for a malformed request line, an overlong line or an
+                invalid Content-Length; 413 for a body over 16 MiB; 431 for more
+                than 100 header lines.
+        """
+        line = await self._read_line(reader)
+        if not line:
+            return None
+        parts = line.decode('latin-1').split()
+        if len(parts) != 3:
+            raise HTTPError(400, 'Malformed request line.')
+        method, path, _ = parts
+
+        headers: Dict[str, str] = {}
+        for count in itertools.count():
+            line = await self._read_line(reader)
+            if line in (b'\r\n', b'\n', b''):
+                break
+            if count == _MAX_HEADERS:
+                raise HTTPError(431, f'More than {_MAX_HEADERS} header lines.')
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        value = headers.get('content-length', '0')
+        if not (value.isascii() and value.isdigit()):
+            raise HTTPError(400, f"Invalid Content-Length: '{value}'")
+        length = int(value)
+        if length > _MAX_BODY:
+            raise HTTPError(413, f'Request body over {_MAX_BODY} bytes.')
+        body = await reader.readexactly(length) if length else b''
+        return method, path, headers, body
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Any:
+        """Routes a request and returns its JSON payload."""
+        if path == '/stats':
+            if method != 'GET':
+                raise HTTPError(405, 'Use GET /stats.')
+            return self.stats.as_dict(self.queue_depth)
+        if path != '/tokenize':
+            raise HTTPError(404, f'No such endpoint: {path}')
+        if method != 'POST':
+            raise HTTPError(405, 'Use POST /tokenize.')
+
+        try:
+            request = json.loads(body.decode('utf-8'))
+        except ValueError:
+            raise HTTPError(400, 'The request body must be JSON.')
+        if not isinstance(request, dict):
+            raise HTTPError(400, 'The request body must be a JSON object.')
+        language = request.get('language')
+        if language is not None and language not in available_languages():
+            raise HTTPError(400, f"Unknown language: '{language}'")
+
+        if 'texts' in request:
+            texts = request['texts']
+            if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                raise HTTPError(400, "'texts' must be a list of strings.")
+            if len(texts) > self.queue_size:
+                raise HTTPError(413, f"At most {self.queue_size} texts per request.")
+            tokens = await asyncio.gather(*(self.tokenize(text, language) for text in texts))
+        else:
+            text = request.get('text')
+            if not isinstance(text, str):
+                raise HTTPError(400, "Send 'text' (a string) or 'texts' (a list of strings).")
+            tokens = await self.tokenize(text, language)
+        self.stats.requests += 1
+        return {'tokens': tokens}
+
+class TokenizationClient:
+    """
+    A minimal asyncio client for TokenizationServer, e.g. for tests and scripts.
+
+    Every call opens its own connection, so calls can run concurrently.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, unix_path: Optional[str] = None):
+        """
+        Initializes the TokenizationClient.
+
+        Args:
+            host (str): Server host. Defaults to localhost.
+            port (int): Server TCP port.
+            unix_path (Optional[str]): Server Unix socket, used instead of TCP when set.
+        """
+        self.host = host
+        self.port = port
+        self.unix_path = unix_path
+
+    @classmethod
+    def for_server(cls, server: TokenizationServer) -> 'TokenizationClient':
+        """Returns a client connected to a started server."""
+        return cls(server.host, server.port, server.unix_path)
+
+    async def request(self, method: str, path: str, payload: Any = None) -> Tuple[int, Any]:
+        """
+        Sends one request.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Request path.
+            payload (Any): JSON body, if any.
+
+        Returns:
+            Tuple[int, Any]: The status code and the decoded JSON response.
+        """
+        if self.unix_path is not None:
+            reader, writer = await asyncio.open_unix_connection(self.unix_path)
+        else:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+            writer.write(f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                         f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                         f"Connection: close\r\n\r\n".encode('ascii') + body)
+            await writer.drain()
+            status = int((await reader.readline()).split()[1])
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.strip().lower() == 'content-length':
+                    length = int(value)
+            return status, json.loads((await reader.readexactly(length)).decode('utf-8'))
+        finally:
+            writer.close()
+
+    async def _checked(self, method: str, path: str, payload: Any = None) -> Any:
+        status, response = await self.request(method, path, payload)
+        if status != 200:
+            raise HTTPError(status, response.get('error', ''))
+        return response
+
+    async def tokenize(self, text: str, language: Optional[str] = None) -> List[str]:
+        """Tokenizes one text; raises HTTPError on an error response."""
+        response = await self._checked('POST', '/tokenize', {'text': text, 'language': language})
+        return response['tokens']
+
+    async def tokenize_batch(self, texts: List[str], language: Optional[str] = None) -> List[List[str]]:
+        """Tokenizes many texts in one request; raises HTTPError on an error response."""
+        response = await self._checked('POST', '/tokenize', {'texts': texts, 'language': language})
+        return response['tokens']
+
+    async def stats(self) -> Dict[str, Any]:
+        """Returns the server's stats."""
+        return await self._checked('GET', '/stats')
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs a tokenization server from the command line until interrupted.
+
+    Usage: ``python -m seram_tokenizer.server [--port PORT | --unix PATH] [options]``.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, without the program name.
+
+    Returns:
+        int: The process exit status.
+    """
+    parser = argparse.ArgumentParser(prog='python -m seram_tokenizer.server',
+                                     description='Serve Seram tokenization over HTTP.')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on (default: %(default)s).')
+    parser.add_argument('--port', type=int, default=8000, help='TCP port (default: %(default)s).')
+    parser.add_argument('--unix', help='Listen on this Unix socket instead of TCP.')
+    parser.add_argument('--use-suffix', action='store_true', help="Split '_ra' / '_a' suffixes.")
+    parser.add_argument('--use-prefix', action='store_true', help="Split 'na_' / 'da_' prefixes.")
+    parser.add_argument('--normalize', action='store_true',
+                        help="Merge detached paragog particles ('a', 'ra') into the preceding word.")
+    parser.add_argument('--language', default='geser', help='Default language code (default: %(default)s).')
+    parser.add_argument('--max-batch-size', type=int, default=DEFAULT_MAX_BATCH_SIZE,
+                        help='Most texts per micro-batch (default: %(default)s).')
+    parser.add_argument('--max-wait-ms', type=float, default=DEFAULT_MAX_WAIT * 1000,
+                        help='Longest wait for a micro-batch to fill, in ms (default: %(default)s).')
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE,
+                        help='Most queued texts before requests are refused (default: %(default)s).')
+    parser.add_argument('-j', '--workers', type=int, default=0,
+                        help='Worker processes; 0 uses every CPU (default: 0).')
+    args = parser.parse_args(argv)
+    if args.language not in available_languages():
+        parser.error(f"unknown --language '{args.language}'.")
+
+    try:
+        server = TokenizationServer(args.host, args.port, args.unix, args.max_batch_size,
+                                    args.max_wait_ms / 1000, args.queue_size, args.workers or None,
+                                    use_suffix=args.use_suffix, use_prefix=args.use_prefix,
+                                    normalize_paragog=args.normalize, default_language=args.language)
+    except ValueError as e:
+        parser.error(str(e))
+
+    async def serve() -> None:
+        async with server:
+            where = args.unix or f'http://{server.host}:{server.port}'
+            print(f"seram-tokenizer server listening on {where}", file=sys.stderr)
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,253 @@
+import argparse
+import mmap
+import struct
+import sys
+import zlib
+from collections.abc import Set as AbstractSet
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .lexicon import Lexicon, get_lexicon
+
+# Binary lexicon snapshot layout (all integers little-endian):
+#
+#   header     magic, format version, string count, section count
+#   strings    (string count + 1) uint64 offsets into the blob, then the blob
+#              of UTF-8 encoded strings, sorted
+#   sections   per section: 16-byte name, member count, table size, table offset
+#   tables     per section: open-addressing hash table of uint32 slots holding
+#              string id + 1 (0 marks an empty slot), indexed by crc32
+#
+# Membership tests hash the UTF-8 key with crc32 and compare it against the
+# mapped bytes directly, so no Python set is ever built for large sections.
+MAGIC = b'SERAMLEX'
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct('<8sIII')
+_SECTION = struct.Struct('<16sIIQ')
+_UINT32 = struct.Struct('<I')
+_UINT64 = struct.Struct('<Q')
+
+_MAPPED_SECTIONS = ('words', 'single_words', 'multi_words', 'lemma_with_ra',
+                    'lemma_with_a', 'lemma_with_na', 'lemma_with_da')
+_SMALL_SECTIONS = ('vowels', 'consonants', 'pronouns')
+
+def _table_size(count: int) -> int:
+    """Smallest power of two keeping the hash table at most half full."""
+    size = 8
+    while size < count * 2:
+        size *= 2
+    return size
+
+def build_snapshot(lexicon: Lexicon, path: str) -> None:
+    """
+    Compiles a lexicon into a binary snapshot that ``open_snapshot`` can map.
+
+    The snapshot stores every entry once, plus one hash table per derived
+    subset (lemmas with affixes, single- and multi-word entries, letters).
+
+    Args:
+        lexicon (Lexicon): The lexicon to compile.
+        path (str): Where the snapshot is written.
+
+    Raises:
+        TypeError: If lexicon is not a Lexicon.
+    """
+    if not isinstance(lexicon, Lexicon):
+        raise TypeError("Input 'lexicon' must be a Lexicon.")
+
+    sections: Dict[str, Iterable[str]] = {name: getattr(lexicon, name)
+                                          for name in _MAPPED_SECTIONS + _SMALL_SECTIONS}
+    strings = sorted(set().union(*sections.values()))
+    ids = {string: index for index, string in enumerate(strings)}
+    encoded = [string.encode('utf-8') for string in strings]
+
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    strings_start = _HEADER.size
+    blob_start = strings_start + (len(strings) + 1) * _UINT64.size
+    directory_start = blob_start + offsets[-1]
+    table_offset = directory_start + len(sections) * _SECTION.size
+
+    directory = []
+    tables = []
+    for name, members in sections.items():
+        members = list(members)
+        size = _table_size(len(members))
+        mask = size - 1
+        slots = [0] * size
+        for member in members:
+            index = zlib.crc32(encoded[ids[member]]) & mask
+            while slots[index]:
+                index = (index + 1) & mask
+            slots[index] = ids[member] + 1
+        directory.append(_SECTION.pack(name.encode('ascii'), len(members), size, table_offset))
+        tables.append(struct.pack(f'<{size}I', *slots))
+        table_offset += size * _UINT32.size
+
+    with open(path, 'wb') as file:
+        file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(strings), len(sections)))
+        file.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+        file.writelines(encoded)
+        file.writelines(directory)
+        file.writelines(tables)
+
+class MappedWordSet(AbstractSet):
+    """
+    A read-only set of words answered straight from a memory-mapped snapshot.
+
+    Supports membership tests, ``len`` and iteration, plus the usual set
+    operators (which return plain frozensets).
+    """
+
+    def __init__(self, buffer: mmap.mmap, blob_start: int, strings_start: int,
+                 count: int, table_size: int, table_offset: int):
+        self._buffer = buffer
+        self._blob_start = blob_start
+        self._strings_start = strings_start
+        self._count = count
+        self._mask = table_size - 1
+        self._table_offset = table_offset
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[str]) -> frozenset:
+        return frozenset(iterable)
+
+    def _string_bytes(self, string_id: int) -> bytes:
+        start, end = struct.unpack_from('<QQ', self._buffer,
+                                        self._strings_start + string_id * _UINT64.size)
+        return self._buffer[self._blob_start + start:self._blob_start + end]
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        key = word.encode('utf-8')
+        buffer = self._buffer
+        mask = self._mask
+        index = zlib.crc32(key) & mask
+        while True:
+            slot = _UINT32.unpack_from(buffer, self._table_offset + index * _UINT32.size)[0]
+            if not slot:
+                return False
+            if self._string_bytes(slot - 1) == key:
+                return True
+            index = (index + 1) & mask
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._mask + 1):
+            slot = _UINT32.unpack_from(self._buffer, self._table_offset + index * _UINT32.size)[0]
+            if slot:
+                yield self._string_bytes(slot - 1).decode('utf-8')
+
+    def __len__(self) -> int:
+        return self._count
+
+class MappedLexicon(Lexicon):
+    """
+    A read-only Lexicon backed by a memory-mapped binary snapshot.
+
+    Opening a snapshot takes near-constant time whatever the dictionary size,
+    and processes mapping the same file share its pages through the OS page
+    cache. Pickling a MappedLexicon (e.g. to send it to a worker process)
+    re-opens the snapshot on the other side instead of copying its contents.
+    """
+
+    def __init__(self, path: str):
+        """
+        Maps a snapshot written by ``build_snapshot``.
+
+        Args:
+            path (str): Path to the snapshot file.
+
+        Raises:
+            ValueError: If the file is not a lexicon snapshot of a supported
+                version, or is truncated.
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._buffer) < _HEADER.size:
+                raise ValueError(f"Not a lexicon snapshot: {path}")
+            magic, version, string_count, section_count = _HEADER.unpack_from(self._buffer, 0)
+            if magic != MAGIC:
+                raise ValueError(f"Not a lexicon snapshot: {path}")
+            if version != FORMAT_VERSION:
+                raise ValueError(f"Unsupported lexicon snapshot version {version}: {path}")
+
+            strings_start = _HEADER.size
+            blob_start = strings_start + (string_count + 1) * _UINT64.size
+            blob_size = _UINT64.unpack_from(self._buffer, strings_start + string_count * _UINT64.size)[0]
+            directory_start = blob_start + blob_size
+
+            sections: Dict[str, MappedWordSet] = {}
+            for index in range(section_count):
+                name, count, size, offset = _SECTION.unpack_from(
+                    self._buffer, directory_start + index * _SECTION.size)
+                if offset + size * _UINT32.size > len(self._buffer):
+                    raise ValueError(f"Truncated lexicon snapshot: {path}")
+                sections[name.rstrip(b'\0').decode('ascii')] = MappedWordSet(
+                    self._buffer, blob_start, strings_start, count, size, offset)
+        except struct.error:
+            self._buffer.close()
+            raise ValueError(f"Truncated lexicon snapshot: {path}") from None
+        except BaseException:
+            self._buffer.close()
+            raise
+
+        for name in _MAPPED_SECTIONS:
+            setattr(self, name, sections[name])
+        # Letter and pronoun lists are tiny and hit on every word: keep them as frozensets.
+        for name in _SMALL_SECTIONS:
+            setattr(self, name, frozenset(sections[name]))
+        self.version = 0
+
+    def add_words(self, words: Iterable[str]) -> None:
+        raise TypeError("A lexicon snapshot is read-only; rebuild it with build_snapshot().")
+
+    def remove_words(self, words: Iterable[str]) -> None:
+        raise TypeError("A lexicon snapshot is read-only; rebuild it with build_snapshot().")
+
+    def close(self) -> None:
+        """Unmaps the snapshot. The lexicon must not be used afterwards."""
+        self._buffer.close()
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        return (MappedLexicon, (self.path,))
+
+def open_snapshot(path: str) -> MappedLexicon:
+    """
+    Opens a binary lexicon snapshot written by ``build_snapshot``.
+
+    Args:
+        path (str): Path to the snapshot file.
+
+    Returns:
+        MappedLexicon: A read-only lexicon answered from the mapped file.
+    """
+    return MappedLexicon(path)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Builds a snapshot of a registered lexicon from the command line.
+
+    Usage: ``python -m seram_tokenizer.snapshot OUTPUT [--lexicon NAME]``.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, without the program name.
+
+    Returns:
+        int: The process exit status.
+    """
+    parser = argparse.ArgumentParser(prog='python -m seram_tokenizer.snapshot',
+                                     description='Compile a lexicon into a binary snapshot.')
+    parser.add_argument('output', help='Path of the snapshot file to write.')
+    parser.add_argument('--lexicon', default='geser', help='Registered lexicon name (default: geser).')
+    args = parser.parse_args(argv)
+
+    build_snapshot(get_lexicon(args.lexicon), args.output)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+from array import array
+from typing import Dict, Iterator, List, Tuple
+
+# Token kind codes stored in TokenSpans.kinds.
+TOKEN_WORD = 0
+TOKEN_PUNCTUATION = 1
+TOKEN_REDUPLICATION = 2
+TOKEN_PREFIX = 3
+TOKEN_SUFFIX = 4
+TOKEN_PHRASE = 5
+
+KIND_NAMES: Dict[int, str] = {
+    TOKEN_WORD: 'word',
+    TOKEN_PUNCTUATION: 'punctuation',
+    TOKEN_REDUPLICATION: 'reduplication',
+    TOKEN_PREFIX: 'prefix',
+    TOKEN_SUFFIX: 'suffix',
+    TOKEN_PHRASE: 'phrase',
+}
+
+class TokenSpans:
+    """
+    The tokens of one text as character offsets into that text.
+
+    Offsets and kinds are kept in three parallel ``array('i')`` buffers rather
+    than as one Python string per token; token strings are only built when
+    indexed. ``start``/``end`` follow slice conventions, so ``text[start:end]``
+    is the source of a token. Affix markers point at the affix letters
+    themselves (e.g. 'ra' for '_ra'), and a word merged with a detached paragog
+    particle spans the whitespace between them, as does a multi-word phrase.
+
+    Attributes:
+        text (str): The tokenized text.
+        starts (array): Start offset of each token.
+        ends (array): End offset (exclusive) of each token.
+        kinds (array): Kind code of each token (TOKEN_WORD, TOKEN_PUNCTUATION,
+            TOKEN_REDUPLICATION, TOKEN_PREFIX, TOKEN_SUFFIX or TOKEN_PHRASE).
+    """
+
+    def __init__(self, text: str, starts: array = None, ends: array = None, kinds: array = None):
+        self.text = text
+        self.starts = array('i') if starts is None else starts
+        self.ends = array('i') if ends is None else ends
+        self.kinds = array('i') if kinds is None else kinds
+
+    def append(self, start: int, end: int, kind: int) -> None:
+        """Adds one token span."""
+        self.starts.append(start)
+        self.ends.append(end)
+        self.kinds.append(kind)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> str:
+        """Returns the token string at ``index``, as ``Tokenizer.tokenize`` would."""
+        kind = self.kinds[index]
+        piece = self.text[self.starts[index]:self.ends[index]]
+        if kind == TOKEN_PUNCTUATION:
+            return piece
+        if kind == TOKEN_PHRASE:
+            return ' '.join(piece.split())
+        # Only paragog merges span whitespace; the token itself has none.
+        piece = ''.join(piece.split())
+        if kind == TOKEN_SUFFIX:
+            return '_' + piece
+        if kind == TOKEN_PREFIX:
+            return piece + '_'
+        return piece
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def tokens(self) -> List[str]:
+        """Returns all token strings."""
+        return list(self)
+
+    def spans(self) -> Iterator[Tuple[int, int, int]]:
+        """Yields (start, end, kind) for every token."""
+        return zip(self.starts, self.ends, self.kinds)
+
+    def to_numpy(self):
+        """
+        Returns the offsets and kinds as NumPy int32 arrays without copying.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: starts, ends, kinds.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        import numpy as np
+        return tuple(np.frombuffer(buffer, dtype=np.intc) if len(buffer) else np.zeros(0, dtype=np.intc)
+                     for buffer in (self.starts, self.ends, self.kinds))
+
+    def __repr__(self) -> str:
+        return f"TokenSpans({len(self)} tokens)"
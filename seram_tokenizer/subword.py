@@ -0,0 +1,413 @@
+import argparse
+import csv
+import heapq
+import json
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from .affixes import AffixEngine, AffixRule
+from .languages import DEFAULT_LANGUAGE, available_languages, get_language
+from .lexicon import Lexicon
+from .parallel import batched
+from .tokenizer import DEFAULT_CACHE_SIZE, Tokenizer
+
+FORMAT_VERSION = 1
+DEFAULT_VOCAB_SIZE = 2000
+DEFAULT_MIN_FREQUENCY = 2
+
+_BATCH_SIZE = 1000
+
+class SubwordModel:
+    """
+    A byte-pair-encoding (BPE) model splitting words into learned subword pieces.
+
+    The model is seeded with the language's lexicon and affix rules. A lexicon
+    lemma is never split. In every other word, an affix the rules would split
+    off ('ra', 'a', 'na', 'da') starts out as one unit rather than as letters,
+    so it is never broken up. Merges may still join it to the stem when the
+    whole word is frequent in the training corpus, which keeps names such as
+    'habiba' intact where ``use_suffix`` would split them.
+
+    Pieces follow the marker convention of the affix tokens: a piece glued to
+    the previous one starts with '_' (e.g. '_ra'), and a prefix kept as a unit
+    ends with '_' (e.g. 'na_'). Like the affix rules, only alphabetic
+    lower-case words are split.
+
+    Attributes:
+        merges (List[Tuple[str, str]]): Learned merges, in priority order.
+        language (str): Code of the LanguageProfile providing the lexicon and
+            affix rules.
+        affix_rules (Tuple[AffixRule, ...]): The affix rules used for seeding.
+        cache_size (Optional[int]): Capacity of the per-word split cache.
+    """
+
+    def __init__(self, merges: Iterable[Sequence[str]] = (), language: str = DEFAULT_LANGUAGE,
+                 lexicon: Optional[Lexicon] = None, affix_rules: Optional[Sequence[AffixRule]] = None,
+                 cache_size: Optional[int] = DEFAULT_CACHE_SIZE):
+        """
+        Initializes the SubwordModel.
+
+        Args:
+            merges (Iterable[Sequence[str]]): Merges as (left, right) pairs, in
+                the order they were learned.
+            language (str): Language code of a registered LanguageProfile.
+                Defaults to 'geser'.
+            lexicon (Optional[Lexicon]): Lexicon of protected lemmas. Defaults
+                to the lexicon of ``language``, loaded on first use.
+            affix_rules (Optional[Sequence[AffixRule]]): Affix rules used for
+                seeding. Defaults to the rules of ``language``.
+            cache_size (Optional[int]): Number of distinct words whose split is
+                cached. 0 disables the cache, None makes it unbounded.
+
+        Raises:
+            ValueError: If cache_size is negative.
+            KeyError: If no profile is registered for ``language``.
+        """
+        if cache_size is not None and cache_size < 0:
+            raise ValueError("'cache_size' must not be negative.")
+
+        self.merges: List[Tuple[str, str]] = [(left, right) for left, right in merges]
+        self._ranks = {pair: rank for rank, pair in enumerate(self.merges)}
+        self.language = language
+        profile = get_language(language)
+        self.affix_rules = profile.affix_rules if affix_rules is None else tuple(affix_rules)
+        self.cache_size = cache_size
+        self._lexicon = lexicon
+        self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        self._cached_split = lru_cache(maxsize=self.cache_size)(self._split)
+        self._cache_key: Optional[Tuple[Lexicon, int]] = None
+        self._cache_totals = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cache wraps a bound method and cannot be pickled; it is rebuilt empty.
+        state = self.__dict__.copy()
+        del state['_cached_split']
+        state.pop('_engine', None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._reset_cache()
+
+    @property
+    def lexicon(self) -> Lexicon:
+        """The lexicon of protected lemmas."""
+        if self._lexicon is None:
+            self._lexicon = get_language(self.language).lexicon
+        return self._lexicon
+
+    def splitter(self) -> Callable[[str], Tuple[str, ...]]:
+        """
+        Returns the cached per-word splitter, clearing the cache first if the
+        lexicon changed since it was filled.
+        """
+        lexicon = self.lexicon
+        key = (lexicon, lexicon.version)
+        if key != self._cache_key:
+            if self._cache_key is not None:
+                info = self._cached_split.cache_info()
+                self._cache_totals['hits'] += info.hits
+                self._cache_totals['misses'] += info.misses
+                self._cache_totals['evictions'] += _evictions(info)
+                self._cache_totals['invalidations'] += 1
+                self._cached_split.cache_clear()
+            self._engine = AffixEngine(self.affix_rules, lexicon)
+            self._cache_key = key
+        return self._cached_split
+
+    def split(self, word: str) -> Tuple[str, ...]:
+        """
+        Splits a word into subword pieces.
+
+        Args:
+            word (str): The word.
+
+        Returns:
+            Tuple[str, ...]: The pieces, with '_' markers; the word itself if it
+            is a lemma, not alphabetic lower-case, or has no applicable merge.
+        """
+        return self.splitter()(word)
+
+    def _seed(self, word: str) -> Tuple[List[str], Optional[str]]:
+        """
+        Returns the initial symbols of a word: its letters, with an affix the
+        rules split off kept as one symbol. Also returns that affix if it is a
+        prefix, or None.
+        """
+        pieces = self._engine.split(word)
+        if len(pieces) == 1 or not all(pieces):
+            return list(word), None
+        if pieces[0].endswith('_'):
+            affix = pieces[0][:-1]
+            return [affix] + list(pieces[1]), affix
+        return list(pieces[0]) + [pieces[1][1:]], None
+
+    def _split(self, word: str) -> Tuple[str, ...]:
+        if not word.isalpha() or word.lower() != word or word in self._engine.lexicon.single_words:
+            return (word,)
+        symbols, prefix = self._seed(word)
+        symbols = self._apply_merges(symbols)
+        if len(symbols) == 1:
+            return (symbols[0],)
+        if prefix is not None and symbols[0] == prefix:
+            return (prefix + '_', symbols[1]) + tuple('_' + symbol for symbol in symbols[2:])
+        return (symbols[0],) + tuple('_' + symbol for symbol in symbols[1:])
+
+    def _apply_merges(self, symbols: List[str]) -> List[str]:
+        """Applies the merges to a symbol sequence, lowest rank first."""
+        ranks = self._ranks
+        while len(symbols) > 1:
+            best = None
+            best_rank = len(ranks)
+            for pair in zip(symbols, symbols[1:]):
+                rank = ranks.get(pair, best_rank)
+                if rank < best_rank:
+                    best, best_rank = pair, rank
+            if best is None:
+                break
+            symbols = _merge(symbols, best)
+        return symbols
+
+    def cache_info(self) -> Dict[str, Optional[int]]:
+        """
+        Reports the counters of the per-word split cache since the model was
+        created or its cache last cleared.
+
+        Returns:
+            Dict[str, Optional[int]]: capacity, size, hits, misses, evictions and
+            invalidations (clears caused by a lexicon change), as
+            ``Tokenizer.cache_info`` reports them.
+        """
+        info = self._cached_split.cache_info()
+        return {
+            'capacity': info.maxsize,
+            'size': info.currsize,
+            'hits': self._cache_totals['hits'] + info.hits,
+            'misses': self._cache_totals['misses'] + info.misses,
+            'evictions': self._cache_totals['evictions'] + _evictions(info),
+            'invalidations': self._cache_totals['invalidations'],
+        }
+
+    def clear_cache(self) -> None:
+        """Empties the split cache and resets its counters."""
+        self._reset_cache()
+
+    @classmethod
+    def train(cls, texts: Iterable[str], vocab_size: int = DEFAULT_VOCAB_SIZE,
+              min_frequency: int = DEFAULT_MIN_FREQUENCY, language: str = DEFAULT_LANGUAGE,
+              lexicon: Optional[Lexicon] = None, affix_rules: Optional[Sequence[AffixRule]] = None,
+              include_lexicon: bool = True) -> 'SubwordModel':
+        """
+        Learns BPE merges from a corpus.
+
+        Words are counted once per distinct word. The counts of every adjacent
+        symbol pair, and the words each pair occurs in, are built once. A merge
+        then only updates the words containing the merged pair, and the next
+        merge comes from a priority queue whose outdated entries are skipped
+        when popped. The corpus is never recounted.
+
+        Args:
+            texts (Iterable[str]): Training sentences, e.g. the Geser column of
+                ``dataset_seram_geser.csv``.
+            vocab_size (int): Number of symbols to reach: the initial letters and
+                affixes plus one per merge. Defaults to 2000.
+            min_frequency (int): Stop when the most frequent pair occurs fewer
+                times. Defaults to 2.
+            language (str): Language code of a registered LanguageProfile.
+            lexicon (Optional[Lexicon]): Lexicon of protected lemmas. Defaults
+                to the lexicon of ``language``.
+            affix_rules (Optional[Sequence[AffixRule]]): Affix rules used for
+                seeding. Defaults to the rules of ``language``.
+            include_lexicon (bool): Count every lexicon lemma once, in addition
+                to the corpus, so that small corpora still learn the lemmas'
+                shapes. Lemmas in the corpus itself are never split and are not
+                counted. Defaults to True.
+
+        Returns:
+            SubwordModel: The trained model.
+
+        Raises:
+            ValueError: If vocab_size or min_frequency is not positive.
+        """
+        if vocab_size <= 0:
+            raise ValueError("'vocab_size' must be a positive integer.")
+        if min_frequency <= 0:
+            raise ValueError("'min_frequency' must be a positive integer.")
+
+        model = cls(language=language, lexicon=lexicon, affix_rules=affix_rules)
+        model.splitter()
+        lemmas = model.lexicon.single_words
+
+        counts: Counter = Counter()
+        tokenizer = Tokenizer(language=language)
+        for batch in batched(texts, _BATCH_SIZE):
+            for tokens in tokenizer.tokenize_batch(batch):
+                counts.update(token for token in tokens
+                              if token.isalpha() and token.lower() == token and token not in lemmas)
+        if include_lexicon:
+            counts.update(lemma for lemma in lemmas if lemma.isalpha() and lemma.lower() == lemma)
+
+        words = [model._seed(word)[0] for word in counts]
+        frequencies = list(counts.values())
+        alphabet = {symbol for symbols in words for symbol in symbols}
+        model.merges = _learn_merges(words, frequencies, vocab_size - len(alphabet), min_frequency)
+        model._ranks = {pair: rank for rank, pair in enumerate(model.merges)}
+        model._reset_cache()
+        return model
+
+    def save(self, path: str) -> None:
+        """Writes the merges, language and affix rules to a JSON file."""
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'format': FORMAT_VERSION, 'language': self.language,
+                       'affix_rules': [list(rule) for rule in self.affix_rules],
+                       'merges': [list(pair) for pair in self.merges]}, file, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str, lexicon: Optional[Lexicon] = None) -> 'SubwordModel':
+        """
+        Reads a model written by ``save``.
+
+        Args:
+            path (str): Path to the model file.
+            lexicon (Optional[Lexicon]): Lexicon of protected lemmas. Defaults
+                to the lexicon of the model's language.
+
+        Returns:
+            SubwordModel: The model.
+
+        Raises:
+            ValueError: If the file is not a model of a supported version.
+        """
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        if not isinstance(data, dict) or data.get('format') != FORMAT_VERSION:
+            raise ValueError(f"Not a subword model of version {FORMAT_VERSION}: {path}")
+        return cls(data['merges'], data['language'], lexicon,
+                   [AffixRule(*rule) for rule in data['affix_rules']])
+
+    def __len__(self) -> int:
+        return len(self.merges)
+
+def _evictions(info) -> int:
+    # Every miss stores one entry, so entries missing from the cache were evicted.
+    return info.misses - info.currsize if info.maxsize else 0
+
+def _merge(symbols: List[str], pair: Tuple[str, str]) -> List[str]:
+    """Replaces every occurrence of a pair, left to right, by the merged symbol."""
+    left, right = pair
+    merged = []
+    index = 0
+    while index < len(symbols):
+        if index + 1 < len(symbols) and symbols[index] == left and symbols[index + 1] == right:
+            merged.append(left + right)
+            index += 2
+        else:
+            merged.append(symbols[index])
+            index += 1
+    return merged
+
+def _learn_merges(words: List[List[str]], frequencies: List[int], budget: int,
+                  min_frequency: int) -> List[Tuple[str, str]]:
+    """
+    Learns up to ``budget`` merges over distinct words with their frequencies,
+    updating pair counts incrementally.
+    """
+    pair_counts: Dict[Tuple[str, str], int] = defaultdict(int)
+    occurrences: Dict[Tuple[str, str], Set[int]] = defaultdict(set)
+    for word_id, symbols in enumerate(words):
+        for pair in zip(symbols, symbols[1:]):
+            pair_counts[pair] += frequencies[word_id]
+            occurrences[pair].add(word_id)
+
+    # Entries are (-count, pair); ties go to the smallest pair, so training is deterministic.
+    queue = [(-count, pair) for pair, count in pair_counts.items()]
+    heapq.heapify(queue)
+    merges: List[Tuple[str, str]] = []
+    while len(merges) < budget and queue:
+        negative, pair = heapq.heappop(queue)
+        count = pair_counts.get(pair, 0)
+        if count != -negative:
+            # Outdated entry: the pair's count changed after it was queued.
+            if count > 0:
+                heapq.heappush(queue, (-count, pair))
+            continue
+        if count < min_frequency:
+            break
+
+        merges.append(pair)
+        changed: Set[Tuple[str, str]] = set()
+        for word_id in occurrences.pop(pair):
+            symbols = words[word_id]
+            merged = _merge(symbols, pair)
+            if len(merged) == len(symbols):
+                continue
+            frequency = frequencies[word_id]
+            for old in zip(symbols, symbols[1:]):
+                pair_counts[old] -= frequency
+                changed.add(old)
+            for new in zip(merged, merged[1:]):
+                pair_counts[new] += frequency
+                occurrences[new].add(word_id)
+                changed.add(new)
+            words[word_id] = merged
+        del pair_counts[pair]
+        changed.discard(pair)
+        for other in changed:
+            count = pair_counts[other]
+            if count > 0:
+                heapq.heappush(queue, (-count, other))
+            else:
+                del pair_counts[other]
+                occurrences.pop(other, None)
+    return merges
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Trains a subword model from the command line.
+
+    Usage: ``python -m seram_tokenizer.subword INPUT OUTPUT [options]``.
+
+    Args:
+        argv (Optional[List[str]]): Command-line arguments, without the program name.
+
+    Returns:
+        int: The process exit status.
+    """
+    parser = argparse.ArgumentParser(prog='python -m seram_tokenizer.subword',
+                                     description='Train a BPE subword model.')
+    parser.add_argument('input', help='Training text, one sentence per line, or a CSV file with --csv-column.')
+    parser.add_argument('output', help='Path of the model file to write.')
+    parser.add_argument('--csv-column', type=int,
+                        help='Read this zero-based CSV column, e.g. 1 for the Geser column of '
+                             'dataset_seram_geser.csv.')
+    parser.add_argument('--vocab-size', type=int, default=DEFAULT_VOCAB_SIZE,
+                        help='Number of symbols, letters and affixes included (default: %(default)s).')
+    parser.add_argument('--min-frequency', type=int, default=DEFAULT_MIN_FREQUENCY,
+                        help='Smallest pair count worth a merge (default: %(default)s).')
+    parser.add_argument('--language', default=DEFAULT_LANGUAGE,
+                        help='Language code of the lexicon and affix rules (default: %(default)s).')
+    parser.add_argument('--no-lexicon', action='store_true',
+                        help='Train on the corpus only, without counting the lexicon lemmas.')
+    parser.add_argument('--encoding', default='utf-8-sig', help='Input encoding (default: %(default)s).')
+    args = parser.parse_args(argv)
+    if args.vocab_size <= 0 or args.min_frequency <= 0:
+        parser.error("--vocab-size and --min-frequency must be positive integers.")
+    if args.language not in available_languages():
+        parser.error(f"unknown --language '{args.language}'.")
+
+    with open(args.input, 'r', encoding=args.encoding, newline='') as file:
+        if args.csv_column is None:
+            texts: Iterable[str] = (line.rstrip('\r\n') for line in file)
+        else:
+            texts = (row[args.csv_column] for row in csv.reader(file) if len(row) > args.csv_column)
+        model = SubwordModel.train(texts, args.vocab_size, args.min_frequency, args.language,
+                                   include_lexicon=not args.no_lexicon)
+    model.save(args.output)
+    print(f"{len(model)} merges written to {args.output}", file=sys.stderr)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,87 +1,744 @@
 # Part of this code inspired by https://github.com/OpenNMT/Tokenizer/blob/master/bindings/python/README.md
 import re
-from typing import List, Dict
-from .find_reduplication import extract_reduplications
-from .suffix_analayser import SuffixAnalyser
-from .prefix_analyser import PrefixAnalyser
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from .affixes import PREFIX, SUFFIX, AffixEngine, AffixRule
+from .languages import DEFAULT_LANGUAGE, get_language
+from .lexicon import Lexicon
+from .phrases import PhraseMatcher
+from .profiling import PipelineProfiler, StageCallback
+from .spans import (TOKEN_PHRASE, TOKEN_PREFIX, TOKEN_PUNCTUATION, TOKEN_REDUPLICATION, TOKEN_SUFFIX,
+                    TOKEN_WORD, TokenSpans)
+
+if TYPE_CHECKING:
+    from .subword import SubwordModel
+
+# Reduplications (same shape as extract_reduplications), plain words and single
+# punctuation characters, tried in that order at every position. Scanning the
+# text once with this pattern yields the final token stream directly, so no
+# placeholder rewriting of the text is needed.
+TOKEN_PATTERN = re.compile(r'\w+-\w+|\w+|[^\w\s]')
+
+# TOKEN_PATTERN with paragog normalization folded in: a word or reduplication
+# may absorb a following detached 'a' / 'ra' particle, exactly where
+# paragog_normaliser.PARAGOG_PATTERN would merge them, so normalization costs
+# no extra pass over the text. Groups: word, particle, punctuation.
+PARAGOG_TOKEN_PATTERN = re.compile(r'(\w+-\w+|\w+)(?:\s+(a|ra)(?=\s|$))?|([^\w\s])')
+
+# TOKEN_PATTERN with the same groups as PARAGOG_TOKEN_PATTERN, for span output.
+_SPAN_PATTERN = re.compile(r'(\w+-\w+|\w+)|([^\w\s])')
+
+# When normalizing, text from a stream cut may still turn out to be a particle
+# that belongs to the word before the cut: '', 'a', 'r', 'ra' (incomplete) or
+# 'a' / 'ra' followed by whitespace.
+_PARTICLE_START = re.compile(r'(?:ra?|a)?\Z|r?a\s')
+_WORD_CHAR = re.compile(r'\w')
+
+# No token spans whitespace, so a stream can always be cut after one of these
+# characters without changing the tokens on either side of the cut.
+_CHUNK_BOUNDARY_CHARS = ' \n\t\r\f\v'
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Distinct words whose affix split is remembered per tokenizer. Word frequencies
+# are Zipfian, so a cache of this size resolves almost every token of a large
+# corpus with one lookup.
+DEFAULT_CACHE_SIZE = 1 << 16
+
+class Tokenizer:
+    """
+    A reusable tokenizer for Seram text.
+
+    The tokenizer is configured once and holds no per-text state, so a single
+    instance can be shared by any number of ``tokenize`` and ``tokenize_batch``
+    calls. Reduplicated words are kept as single tokens, punctuation becomes
+    separate tokens and, optionally, suffixes ('_ra', '_a') and prefixes
+    ('na_', 'da_') are split off words that are not dictionary lemmas, as
+    described by a table of AffixRule.
+
+    The affix split of each distinct word is memoised in a size-bounded LRU
+    cache, which is cleared automatically when the lexicon changes.
+
+    Instead of the affix rules, words can be split into learned pieces by a
+    SubwordModel (``subword=``). With ``phrases=True``, runs of words forming a
+    multi-word lexicon entry (e.g. 'angin timur') become one token.
+
+    Attributes:
+        use_suffix (bool): Whether '_ra' / '_a' suffixes are split off.
+        use_prefix (bool): Whether 'na_' / 'da_' prefixes are split off.
+        language (str): Code of the LanguageProfile providing the default
+            lexicon and affix rules.
+        affix_rules (Tuple[AffixRule, ...]): The affix rule table.
+        normalize_paragog (bool): Whether detached paragog particles are merged.
+        cache_size (Optional[int]): Capacity of the affix cache.
+        subword (Optional[SubwordModel]): Subword model splitting words, or None.
+        phrases (bool): Whether multi-word lexicon entries are merged into one token.
+        profiler (Optional[PipelineProfiler]): Per-stage timings and counters,
+            set by ``enable_profiling``; None (the default) disables profiling.
+    """
+
+    def __init__(self, use_suffix: bool = False, use_prefix: bool = False,
+                 lexicon: Optional[Union[Lexicon, Iterable[str]]] = None,
+                 cache_size: Optional[int] = DEFAULT_CACHE_SIZE,
+                 affix_rules: Optional[Sequence[AffixRule]] = None,
+                 normalize_paragog: bool = False, language: str = DEFAULT_LANGUAGE,
+                 subword: Optional['SubwordModel'] = None, phrases: bool = False):
+        """
+        Initializes the Tokenizer.
+
+        Args:
+            use_suffix (bool): Apply the suffix rules ('_ra' / '_a'). Defaults to False.
+            use_prefix (bool): Apply the prefix rules ('na_' / 'da_'). Defaults to False.
+            lexicon (Optional[Union[Lexicon, Iterable[str]]]): Lexicon, or plain
+                dictionary entries, used to decide which affixed-looking words
+                are lemmas. Defaults to the lexicon of ``language``, which is
+                only loaded once affixes are actually analysed.
+            cache_size (Optional[int]): Number of distinct words whose affix
+                split is cached. 0 disables the cache, None makes it unbounded.
+            affix_rules (Optional[Sequence[AffixRule]]): The affix rule table.
+                Defaults to the rules of ``language``.
+            normalize_paragog (bool): Merge a word and a following detached 'a' /
+                'ra' into one token (as GeserParagogNormalizer does) while
+                scanning. Defaults to False.
+            language (str): Language code of a registered LanguageProfile.
+                Defaults to 'geser'.
+            subword (Optional[SubwordModel]): Split words into the pieces of a
+                trained subword model, an alternative to use_suffix and
+                use_prefix. Defaults to None.
+            phrases (bool): Merge runs of words forming a multi-word lexicon
+                entry into one token, the entry itself (e.g. 'bajak laut'),
+                matched in one pass by a PhraseMatcher. A word that absorbed a
+                paragog particle is not matched. Defaults to False.
+
+        Raises:
+            ValueError: If cache_size is negative, or subword is combined with
+                use_suffix or use_prefix.
+            KeyError: If no profile is registered for ``language``.
+        """
+        if cache_size is not None and cache_size < 0:
+            raise ValueError("'cache_size' must not be negative.")
+        if subword is not None and (use_suffix or use_prefix):
+            raise ValueError("A subword model replaces 'use_suffix' and 'use_prefix'; do not combine them.")
+
+        self.use_suffix = use_suffix
+        self.use_prefix = use_prefix
+        self.cache_size = cache_size
+        self.language = language
+        profile = get_language(language)
+        self.affix_rules = profile.affix_rules if affix_rules is None else tuple(affix_rules)
+        self.normalize_paragog = normalize_paragog
+        self.subword = subword
+        self.phrases = phrases
+        self.token_pattern = TOKEN_PATTERN
+
+        if lexicon is not None and not isinstance(lexicon, Lexicon):
+            lexicon = Lexicon(lexicon)
+        self._lexicon = lexicon
+        self.profiler: Optional[PipelineProfiler] = None
+        self._phrase_key: Optional[Tuple[Lexicon, int]] = None
+        self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        """Creates an empty affix cache with zeroed counters."""
+        self._cached_split = lru_cache(maxsize=self.cache_size)(self._split_affixes)
+        self._cache_key: Optional[Tuple[Any, ...]] = None
+        self._cache_totals = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def _affix_splitter(self):
+        """
+        Returns the cached per-word affix splitter. If the lexicon or the affix
+        options changed since the cache was filled, the affix engine is rebuilt
+        and the cache cleared first.
+        """
+        lexicon = self.lexicon
+        key = (lexicon, lexicon.version, self.use_suffix, self.use_prefix, self.affix_rules)
+        if key != self._cache_key:
+            if self._cache_key is not None:
+                self._clear_cache()
+                self._cache_totals['invalidations'] += 1
+            kinds = {SUFFIX} if self.use_suffix else set()
+            if self.use_prefix:
+                kinds.add(PREFIX)
+            self._affix_engine = AffixEngine(
+                [rule for rule in self.affix_rules if rule.kind in kinds], lexicon)
+            self._cache_key = key
+        return self._cached_split
+
+    def _word_splitter(self):
+        """Returns the per-word splitter of the subword model or the affix rules, or None."""
+        if self.subword is not None:
+            return self.subword.splitter()
+        if self.use_suffix or self.use_prefix:
+            return self._affix_splitter()
+        return None
+
+    def _phrase_matcher(self) -> PhraseMatcher:
+        """Returns the phrase automaton of the lexicon, recompiled if the lexicon changed."""
+        lexicon = self.lexicon
+        key = (lexicon, lexicon.version)
+        if key != self._phrase_key:
+            self._phrase_automaton = PhraseMatcher(lexicon.multi_words)
+            self._phrase_key = key
+        return self._phrase_automaton
+
+    def _merge_phrases(self, tokens: List[str], matches: Optional[List[Tuple[str, str, str]]] = None) -> List[str]:
+        """
+        Merges multi-word entries in scanned tokens. ``matches`` are the
+        PARAGOG_TOKEN_PATTERN groups of the tokens, when normalizing.
+        """
+        keys = None
+        if matches is not None:
+            keys = [None if particle else token for (_, particle, _), token in zip(matches, tokens)]
+        return self._phrase_matcher().merge(tokens, keys)
+
+    def _phrase_ends(self, matches: List[Any]) -> Dict[int, int]:
+        """Maps the index of the first token of each phrase to the index after its last."""
+        keys = []
+        for match in matches:
+            word = match.group(1)
+            particle = match.group(2) if self.normalize_paragog else None
+            keys.append(None if word is None or particle else word)
+        return {start: end for start, end, _ in self._phrase_matcher().find(keys)}
+
+    def _clear_cache(self) -> None:
+        """Empties the affix cache, keeping its cumulative counters."""
+        info = self._cached_split.cache_info()
+        self._cache_totals['hits'] += info.hits
+        self._cache_totals['misses'] += info.misses
+        self._cache_totals['evictions'] += self._evictions(info)
+        self._cached_split.cache_clear()
+
+    def _evictions(self, info) -> int:
+        # Every miss stores one entry, so entries missing from the cache were evicted.
+        return info.misses - info.currsize if info.maxsize else 0
+
+    def cache_info(self) -> Dict[str, Optional[int]]:
+        """
+        Reports the counters of the affix cache since the tokenizer was created.
+        With a subword model, its split cache is the one in use and is reported
+        instead.
+
+        Returns:
+            Dict[str, Optional[int]]: capacity, size, hits, misses, evictions and
+            invalidations (clears caused by a lexicon or option change).
+        """
+        if self.subword is not None:
+            return self.subword.cache_info()
+        info = self._cached_split.cache_info()
+        return {
+            'capacity': info.maxsize,
+            'size': info.currsize,
+            'hits': self._cache_totals['hits'] + info.hits,
+            'misses': self._cache_totals['misses'] + info.misses,
+            'evictions': self._cache_totals['evictions'] + self._evictions(info),
+            'invalidations': self._cache_totals['invalidations'],
+        }
+
+    def clear_cache(self) -> None:
+        """Empties the affix cache (or the subword model's split cache) and resets its counters."""
+        self._reset_cache()
+        if self.subword is not None:
+            self.subword.clear_cache()
+        if self.profiler is not None:
+            self.profiler.sync_cache()
+
+    def enable_profiling(self, callback: Optional[StageCallback] = None) -> PipelineProfiler:
+        """
+        Starts recording per-stage timings and counters.
+
+        Args:
+            callback (Optional[StageCallback]): Called with (stage, seconds,
+                tokens) after every stage, e.g. to export to a metrics system.
+
+        Returns:
+            PipelineProfiler: The profiler; read it with ``snapshot()`` and
+            zero it with ``reset()``.
+        """
+        self.profiler = PipelineProfiler(callback, self.cache_info)
+        return self.profiler
+
+    def disable_profiling(self) -> None:
+        """Stops recording; the hot path is back to a single attribute check."""
+        self.profiler = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cache wraps a bound method and cannot be pickled; it is rebuilt empty.
+        # A profiler is bound to this instance (and may hold a callback), so it is dropped.
+        state = self.__dict__.copy()
+        del state['_cached_split']
+        state['profiler'] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._reset_cache()
+
+    @property
+    def lexicon(self) -> Lexicon:
+        """The lexicon used for affix analysis."""
+        if self._lexicon is None:
+            self._lexicon = get_language(self.language).lexicon
+        return self._lexicon
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        Tokenizes a text into words and punctuation tokens,
+        keeping reduplicated words (e.g. 'lari-lari') as single tokens.
+
+        The text is scanned once from left to right, so the cost is linear in
+        the length of the text regardless of how many reduplications it holds.
+
+        Args:
+            text (str): The input text to be tokenized.
+
+        Returns:
+            List[str]: A list of tokenized words and punctuation.
+
+        Raises:
+            TypeError: If the input is not a string.
+        """
+        if not isinstance(text, str):
+            raise TypeError("Input 'text' must be a string.")
+        split = self._word_splitter()
+        return self._tokenize(text, split)
+
+    def tokenize_batch(self, texts: Iterable[str]) -> List[List[str]]:
+        """
+        Tokenizes many texts with the same configuration.
+
+        The batch is validated and tokenized in one call, and the affix cache is
+        checked once for the whole batch rather than once per text.
+
+        Args:
+            texts (Iterable[str]): The texts to be tokenized.
+
+        Returns:
+            List[List[str]]: One token list per input text, in input order.
+
+        Raises:
+            TypeError: If any element is not a string.
+        """
+        if isinstance(texts, str):
+            raise TypeError("Input 'texts' must be an iterable of strings, not a string.")
+
+        split = self._word_splitter()
+        batch = []
+        for text in texts:
+            if not isinstance(text, str):
+                raise TypeError("All elements in 'texts' must be strings.")
+            batch.append(self._tokenize(text, split))
+        return batch
+
+    def tokenize_spans(self, text: str) -> TokenSpans:
+        """
+        Tokenizes a text into character offsets instead of token strings.
+
+        Produces the same tokens as ``tokenize``, as (start, end, kind) triples
+        stored in compact integer arrays. Affix splits keep their relation to
+        the source: for 'fudicastelara' the base spans 'fudicastel' and the
+        '_ra' marker spans the final 'ra'.
+
+        Args:
+            text (str): The input text to be tokenized.
+
+        Returns:
+            TokenSpans: The token offsets and kinds.
+
+        Raises:
+            TypeError: If the input is not a string.
+        """
+        if not isinstance(text, str):
+            raise TypeError("Input 'text' must be a string.")
+        if self.profiler is not None:
+            start = time.perf_counter()
+            spans = self._tokenize_spans(text)
+            self.profiler.record('spans', time.perf_counter() - start, len(spans))
+            return spans
+        return self._tokenize_spans(text)
+
+    def _tokenize_spans(self, text: str) -> TokenSpans:
+        """Builds the TokenSpans of one text."""
+        split = self._word_splitter()
+        pattern = PARAGOG_TOKEN_PATTERN if self.normalize_paragog else _SPAN_PATTERN
+        spans = TokenSpans(text)
+        append = spans.append
+
+        matches = pattern.finditer(text)
+        phrase_ends: Dict[int, int] = {}
+        if self.phrases:
+            matches = list(matches)
+            phrase_ends = self._phrase_ends(matches)
+        skip = 0
+        for index, match in enumerate(matches):
+            if index < skip:
+                continue
+            if phrase_ends:
+                phrase_end = phrase_ends.get(index)
+                if phrase_end is not None:
+                    append(match.start(), matches[phrase_end - 1].end(), TOKEN_PHRASE)
+                    skip = phrase_end
+                    continue
+            start, end = match.span()
+            word = match.group(1)
+            if word is None:
+                append(start, end, TOKEN_PUNCTUATION)
+                continue
+
+            kind = TOKEN_REDUPLICATION if '-' in word else TOKEN_WORD
+            particle = match.group(2) if self.normalize_paragog else None
+            pieces = split(word + particle if particle else word) if split else (word,)
+            if len(pieces) == 1:
+                append(start, end, kind)
+                continue
+
+            # Offsets of the characters of the (possibly paragog-merged) token.
+            positions = list(range(start, start + len(word)))
+            if particle:
+                positions.extend(range(match.start(2), match.end(2)))
+            index = 0
+            for piece in pieces:
+                if piece.endswith('_'):
+                    size, piece_kind = len(piece) - 1, TOKEN_PREFIX
+                elif piece.startswith('_'):
+                    size, piece_kind = len(piece) - 1, TOKEN_SUFFIX
+                else:
+                    size, piece_kind = len(piece), kind
+                if size:
+                    append(positions[index], positions[index + size - 1] + 1, piece_kind)
+                else:
+                    # An empty base, e.g. 'na' split into 'na_' and ''.
+                    position = positions[index] if index < len(positions) else end
+                    append(position, position, piece_kind)
+                index += size
+
+        return spans
+
+    def tokenize_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Lazily tokenizes text arriving as a sequence of chunks.
+
+        Chunks may be cut anywhere, including inside a word, a reduplication or
+        a run of punctuation: the tail of each chunk after its last whitespace is
+        carried over to the next one, so the tokens are exactly those of
+        ``tokenize("".join(chunks))``. Memory use is bounded by the chunk size
+        plus the longest whitespace-free run in the text (and, when matching
+        phrases, the words of the longest phrase).
+
+        Args:
+            chunks (Iterable[str]): Pieces of the text, in order.
+
+        Yields:
+            str: Tokens, in text order.
+
+        Raises:
+            TypeError: If any chunk is not a string.
+        """
+        if isinstance(chunks, str):
+            chunks = (chunks,)
+
+        split = self._word_splitter()
+
+        carry = ''
+        for chunk in chunks:
+            if not isinstance(chunk, str):
+                raise TypeError("All chunks must be strings.")
+            buffer = carry + chunk
+            cut = max(buffer.rfind(char) for char in _CHUNK_BOUNDARY_CHARS) + 1
+            if cut and self.normalize_paragog:
+                cut = self._paragog_safe_cut(buffer, cut)
+            if cut and self.phrases:
+                cut = self._phrase_safe_cut(buffer, cut)
+            if cut:
+                carry = buffer[cut:]
+                yield from self._tokenize(buffer[:cut], split)
+            else:
+                carry = buffer
+
+        if carry:
+            yield from self._tokenize(carry, split)
+
+    def _paragog_safe_cut(self, buffer: str, cut: int) -> int:
+        """
+        Moves a stream cut back until no paragog particle after it could still
+        merge into the word before it.
+
+        Args:
+            buffer (str): The buffered text.
+            cut (int): A cut position right after whitespace.
+
+        Returns:
+            int: A safe cut position right after whitespace, or 0.
+        """
+        while cut and _PARTICLE_START.match(buffer, cut):
+            end = cut
+            while end and buffer[end - 1].isspace():
+                end -= 1
+            if not end or not _WORD_CHAR.match(buffer, end - 1):
+                return cut
+            cut = max(buffer.rfind(char, 0, end) for char in _CHUNK_BOUNDARY_CHARS) + 1
+        return cut
+
+    def _phrase_safe_cut(self, buffer: str, cut: int) -> int:
+        """
+        Moves a stream cut back until no phrase can cross it.
+
+        Phrases are chosen left to right, so the choice at a token is final
+        once the longest phrase starting there fits before the cut. The cut
+        moves back to the start of a token whose choice is final, which lies
+        outside every phrase and follows whitespace.
+
+        Args:
+            buffer (str): The buffered text.
+            cut (int): A safe cut position of the text without phrases.
+
+        Returns:
+            int: A safe cut position right after whitespace, or 0.
+        """
+        longest = self._phrase_matcher().max_length
+        if not longest:
+            return cut
+        pattern = PARAGOG_TOKEN_PATTERN if self.normalize_paragog else _SPAN_PATTERN
+        matches = list(pattern.finditer(buffer, 0, cut))
+        inside = set()
+        for start, end in self._phrase_ends(matches).items():
+            inside.update(range(start + 1, end))
+        for index in range(min(len(matches) - longest + 1, len(matches) - 1), 0, -1):
+            position = matches[index].start()
+            if index not in inside and buffer[position - 1].isspace():
+                return position
+        return 0
+
+    def tokenize_file(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      encoding: str = 'utf-8') -> Iterator[str]:
+        """
+        Lazily tokenizes a text file, reading it in bounded chunks.
+
+        Args:
+            path (str): Path to the text file.
+            chunk_size (int): Number of characters read at a time.
+            encoding (str): File encoding. Defaults to 'utf-8'.
+
+        Yields:
+            str: Tokens, in file order.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError("'chunk_size' must be a positive integer.")
+
+        with open(path, 'r', encoding=encoding) as file:
+            yield from self.tokenize_stream(iter(lambda: file.read(chunk_size), ''))
+
+    def _tokenize(self, text: str, split) -> List[str]:
+        """Tokenizes one text, splitting affixes with ``split`` unless it is None."""
+        if not text:
+            return []
+        if self.profiler is not None:
+            return self._tokenize_profiled(text, split)
+
+        # Step 1: Single left-to-right sweep emitting reduplication, word and punctuation tokens
+        if self.normalize_paragog:
+            matches = PARAGOG_TOKEN_PATTERN.findall(text)
+            raw_tokens: List[str] = [word + particle or punctuation for word, particle, punctuation in matches]
+            if self.phrases:
+                raw_tokens = self._merge_phrases(raw_tokens, matches)
+        else:
+            raw_tokens = self.token_pattern.findall(text)
+            if self.phrases:
+                raw_tokens = self._merge_phrases(raw_tokens)
+        if split is None:
+            return raw_tokens
+
+        # Step 2: Apply affix splitting, one cached decision per distinct word
+        final_tokens: List[str] = []
+        extend = final_tokens.extend
+        for token in raw_tokens:
+            extend(split(token))
+
+        return final_tokens
+
+    def _tokenize_profiled(self, text: str, split) -> List[str]:
+        """``_tokenize`` with every stage timed and counted by the profiler."""
+        profiler = self.profiler
+        clock = time.perf_counter
+
+        start = clock()
+        merges = 0
+        if self.normalize_paragog:
+            matches = PARAGOG_TOKEN_PATTERN.findall(text)
+            raw_tokens: List[str] = [word + particle or punctuation
+                                     for word, particle, punctuation in matches]
+            merges = sum(1 for _, particle, _ in matches if particle)
+            if self.phrases:
+                raw_tokens = self._merge_phrases(raw_tokens, matches)
+        else:
+            raw_tokens = self.token_pattern.findall(text)
+            if self.phrases:
+                raw_tokens = self._merge_phrases(raw_tokens)
+        profiler.record('scan', clock() - start, len(raw_tokens))
+        phrases = sum(1 for token in raw_tokens if ' ' in token) if self.phrases else 0
+        # A merged phrase (e.g. 'anak far-farara') is counted as a phrase only.
+        reduplications = sum(1 for token in raw_tokens if '-' in token and len(token) > 1 and ' ' not in token)
+
+        suffixes = prefixes = subwords = 0
+        if split is None:
+            final_tokens = raw_tokens
+        else:
+            start = clock()
+            final_tokens = []
+            extend = final_tokens.extend
+            subword = self.subword is not None
+            for token in raw_tokens:
+                pieces = split(token)
+                if len(pieces) > 1:
+                    # Learned pieces are not affix splits, even when one is an affix.
+                    if subword:
+                        subwords += 1
+                    elif pieces[0].endswith('_'):
+                        prefixes += 1
+                    else:
+                        suffixes += 1
+                extend(pieces)
+            profiler.record('affix', clock() - start, len(final_tokens))
+
+        profiler.count(texts=1, tokens=len(final_tokens), reduplications=reduplications,
+                       paragog_merges=merges, phrase_merges=phrases, suffix_splits=suffixes,
+                       prefix_splits=prefixes, subword_splits=subwords)
+        return final_tokens
+
+    def _split_affixes(self, token: str) -> Tuple[str, ...]:
+        """Splits the affix off a single token with the current affix engine."""
+        return self._affix_engine.split(token)
+
+class MultilingualTokenizer:
+    """
+    Tokenizes texts of several Seram languages with one shared configuration.
+
+    One Tokenizer is kept per language code, created on first use, so each
+    language has its own lexicon, affix rules and affix cache, and switching
+    language between calls is a dictionary lookup: no file is re-read and no
+    set is rebuilt.
+
+    Attributes:
+        default_language (str): Language used when a call names none.
+        options (Dict[str, Any]): Tokenizer options shared by every language.
+    """
+
+    def __init__(self, default_language: str = DEFAULT_LANGUAGE, **options: Any):
+        """
+        Initializes the MultilingualTokenizer.
+
+        Args:
+            default_language (str): Language code used when a call names none.
+                Defaults to 'geser'.
+            **options: Keyword arguments passed to every per-language
+                ``Tokenizer`` (e.g. use_suffix, normalize_paragog).
+
+        Raises:
+            ValueError: If options include 'language' or 'lexicon', which are
+                chosen per language.
+            KeyError: If default_language is not registered.
+        """
+        if 'language' in options or 'lexicon' in options:
+            raise ValueError("'language' and 'lexicon' are chosen per call, not shared.")
+        get_language(default_language)
+        self.default_language = default_language
+        self.options = options
+        self._tokenizers: Dict[str, Tokenizer] = {}
+        self._lock = threading.Lock()
+
+    def tokenizer(self, language: Optional[str] = None) -> Tokenizer:
+        """
+        Returns the Tokenizer of a language, creating it on first use.
+
+        Args:
+            language (Optional[str]): Language code. Defaults to default_language.
+
+        Returns:
+            Tokenizer: The shared tokenizer of that language.
+
+        Raises:
+            KeyError: If the language is not registered.
+        """
+        language = self.default_language if language is None else language
+        tokenizer = self._tokenizers.get(language)
+        if tokenizer is None:
+            with self._lock:
+                tokenizer = self._tokenizers.get(language)
+                if tokenizer is None:
+                    tokenizer = self._tokenizers[language] = Tokenizer(language=language, **self.options)
+        return tokenizer
+
+    def tokenize(self, text: str, language: Optional[str] = None) -> List[str]:
+        """Tokenizes one text of the given language (default: default_language)."""
+        return self.tokenizer(language).tokenize(text)
+
+    def tokenize_batch(self, texts: Iterable[str], language: Optional[str] = None) -> List[List[str]]:
+        """Tokenizes many texts of the same language (default: default_language)."""
+        return self.tokenizer(language).tokenize_batch(texts)
+
+    def tokenize_requests(self, requests: Iterable[Tuple[str, Optional[str]]]) -> List[List[str]]:
+        """
+        Tokenizes a mixed-language stream of (text, language) pairs.
+
+        Args:
+            requests (Iterable[Tuple[str, Optional[str]]]): Texts with their
+                language codes; None selects default_language.
+
+        Returns:
+            List[List[str]]: One token list per request, in input order.
+
+        Raises:
+            KeyError: If a language is not registered.
+        """
+        return [self.tokenizer(language).tokenize(text) for text, language in requests]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
 
 class SeramTokenizer:
     """
     A tokenizer for Seram text, designed to handle reduplicated words and preserve punctuation as separate tokens.
+
+    This is a thin compatibility wrapper that binds one text to a ``Tokenizer``.
+    For tokenizing many texts, create one ``Tokenizer`` and reuse it.
     """
 
-    def __init__(self, text: str, use_suffix:bool = False, use_prefix:bool = False):
+    def __init__(self, text: str, use_suffix:bool = False, use_prefix:bool = False, **options: Any):
         """
         Initializes the SeramTokenizer with the input text.
 
         Args:
             text (str): The input text to be tokenized.
+            use_suffix (bool): Split '_ra' / '_a' suffixes. Defaults to False.
+            use_prefix (bool): Split 'na_' / 'da_' prefixes. Defaults to False.
+            **options: Further keyword arguments passed to ``Tokenizer``, e.g.
+                ``subword=`` a trained SubwordModel instead of the affix options.
         """
         if not isinstance(text, str):
             raise TypeError("Input 'text' must be a string.")
         self.text = text
         self.use_suffix = use_suffix
         self.use_prefix = use_prefix
-        self.token_pattern = re.compile(r'\w+|[^\w\s]')
+        self.options = options
+        self.token_pattern = TOKEN_PATTERN
 
     def tokenize(self) -> List[str]:
         """
         Tokenizes the input text into words and punctuation tokens,
-        handling reduplicated words with placeholders to preserve structure.
+        keeping reduplicated words (e.g. 'lari-lari') as single tokens.
 
         Returns:
             List[str]: A list of tokenized words and punctuation.
         """
-        if not self.text:
-            return []
-        
-        # Step 1: Detect reduplications and replace them with unique placeholders
-        reduplications: List[str] = extract_reduplications(self.text)
-        placeholder_map: Dict[str, str] = {}
-        processed_text = self.text        
-
-        for i, word in enumerate(reduplications):
-            placeholder = f"__REDUPLICATION_PLACEHOLDER_{i}__"
-            processed_text = re.sub(re.escape(word), placeholder, processed_text)
-            placeholder_map[placeholder] = word
-
-        # Step 4: Tokenize including punctuation as separate tokens
-        raw_tokens = self.token_pattern.findall(processed_text)
-        
-        # Step 3: Affix Analysis Prep
-        clean_tokens = [t for t in raw_tokens if t.isalpha()]
-        ra_words, a_words, na_words, da_words = set(), set(), set(), set()
-
-        if self.use_suffix:
-            suffix_analyser = SuffixAnalyser(" ".join(clean_tokens))
-            ra_words = suffix_analyser.find_ra_suffix_words()
-            a_words = suffix_analyser.find_a_suffix_words()
-
-        if self.use_prefix:
-            prefix_analyser = PrefixAnalyser(" ".join(clean_tokens))
-            na_words = prefix_analyser.get_na_words()
-            da_words = prefix_analyser.get_da_words()
-
-        # Step 4: Restore reduplications + apply affix splitting
-        final_tokens = []
-        for token in raw_tokens:
-            for placeholder, original_word in placeholder_map.items():
-                token = token.replace(placeholder, original_word)
-
-            if self.use_suffix and token in ra_words and token.endswith('ra'):
-                base = token[:-2]
-                final_tokens.extend([base, '_ra'])
-            elif self.use_suffix and token in a_words and token.endswith('a'):
-                base = token[:-1]
-                final_tokens.extend([base, '_a'])
-            elif self.use_prefix and token in na_words and token.startswith('na'):
-                base = token[2:]
-                final_tokens.extend(['na_', base])
-            elif self.use_prefix and token in da_words and token.startswith('da'):
-                base = token[2:]
-                final_tokens.extend(['da_', base])
-            else:
-                final_tokens.append(token)
-
-        return final_tokens
-
+        return Tokenizer(self.use_suffix, self.use_prefix, **self.options).tokenize(self.text)
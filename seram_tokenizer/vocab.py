@@ -0,0 +1,279 @@
+import json
+from collections import Counter
+from itertools import chain
+from typing import Iterable, List, Optional, Sequence, Union
+from .affixes import DEFAULT_AFFIX_RULES
+from .tokenizer import Tokenizer
+
+PAD_TOKEN = '<pad>'
+UNK_TOKEN = '<unk>'
+
+# Padding and unknown tokens, then the markers of the default affix rules
+# ('_ra', '_a', 'na_', 'da_'), so they get the same small ids in every vocabulary.
+DEFAULT_SPECIAL_TOKENS = (PAD_TOKEN, UNK_TOKEN) + tuple(rule.marker for rule in DEFAULT_AFFIX_RULES)
+
+_BUILD_BATCH_SIZE = 1000
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("Batch encoding requires NumPy: pip install seram_tokenizer[numpy]") from e
+    return numpy
+
+class _TokenIds(dict):
+    """Token-to-id mapping whose missing tokens map to the unknown id."""
+
+    def __init__(self, tokens: Sequence[str]):
+        super().__init__((token, index) for index, token in enumerate(tokens))
+        self.unk_id = -1
+
+    def __missing__(self, token: str) -> int:
+        return self.unk_id
+
+class EncodedBatch:
+    """
+    Token ids of a batch of texts.
+
+    Ragged batches store every id in one flat ``values`` array, row ``i`` being
+    ``values[offsets[i]:offsets[i + 1]]``. Padded batches store a
+    ``(rows, width)`` ``values`` matrix filled with the padding id.
+
+    Attributes:
+        values (numpy.ndarray): int32 ids, flat (ragged) or 2-D (padded).
+        offsets (numpy.ndarray): int32 row boundaries, ``rows + 1`` entries.
+        lengths (numpy.ndarray): int32 number of real (non-padding) ids per row.
+        padded (bool): Whether ``values`` is a padded matrix.
+    """
+
+    def __init__(self, values, offsets, lengths, padded: bool):
+        self.values = values
+        self.offsets = offsets
+        self.lengths = lengths
+        self.padded = padded
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def row(self, index: int):
+        """Returns the real (non-padding) ids of one row."""
+        if self.padded:
+            return self.values[index, :self.lengths[index]]
+        return self.values[self.offsets[index]:self.offsets[index + 1]]
+
+class Vocabulary:
+    """
+    A mapping between tokens and integer ids.
+
+    Special tokens come first, followed by corpus tokens ranked by frequency.
+    Tokens missing from the vocabulary are encoded as the unknown token.
+
+    Attributes:
+        tokens (List[str]): The token of each id.
+        special_tokens (List[str]): The special tokens, a prefix of ``tokens``.
+        pad_id (int): Id of the padding token.
+        unk_id (int): Id of the unknown token.
+    """
+
+    def __init__(self, tokens: Sequence[str], special_tokens: Sequence[str] = DEFAULT_SPECIAL_TOKENS):
+        """
+        Initializes the Vocabulary.
+
+        Args:
+            tokens (Sequence[str]): Tokens in id order. Special tokens missing
+                from the start of the list are prepended.
+            special_tokens (Sequence[str]): Special tokens; must include the
+                padding and unknown tokens.
+
+        Raises:
+            ValueError: If special_tokens lacks '<pad>' or '<unk>', or a token
+                appears twice.
+        """
+        if PAD_TOKEN not in special_tokens or UNK_TOKEN not in special_tokens:
+            raise ValueError(f"'special_tokens' must include '{PAD_TOKEN}' and '{UNK_TOKEN}'.")
+
+        self.special_tokens = list(special_tokens)
+        tokens = list(tokens)
+        if tokens[:len(self.special_tokens)] != self.special_tokens:
+            tokens = self.special_tokens + tokens
+        self.tokens = tokens
+        self._index = _TokenIds(tokens)
+        if len(self._index) != len(tokens):
+            raise ValueError("Vocabulary tokens must be unique.")
+        self.pad_id = self._index[PAD_TOKEN]
+        self.unk_id = self._index.unk_id = self._index[UNK_TOKEN]
+        self._id_to_token = None
+
+    @classmethod
+    def build(cls, texts: Iterable[str], tokenizer: Optional[Tokenizer] = None, min_count: int = 1,
+              max_size: Optional[int] = None,
+              special_tokens: Sequence[str] = DEFAULT_SPECIAL_TOKENS) -> 'Vocabulary':
+        """
+        Builds a frequency-ranked vocabulary from a corpus.
+
+        Ties in frequency are broken alphabetically, so the same corpus always
+        gives the same ids.
+
+        Args:
+            texts (Iterable[str]): The corpus, one text at a time.
+            tokenizer (Optional[Tokenizer]): Tokenizer to use. Defaults to ``Tokenizer()``.
+            min_count (int): Minimum frequency of a kept token. Defaults to 1.
+            max_size (Optional[int]): Maximum vocabulary size, special tokens
+                included. Defaults to no limit.
+            special_tokens (Sequence[str]): Special tokens placed first.
+
+        Returns:
+            Vocabulary: The vocabulary.
+
+        Raises:
+            ValueError: If min_count is below 1 or max_size is smaller than the
+                number of special tokens.
+        """
+        if min_count < 1:
+            raise ValueError("'min_count' must be at least 1.")
+        if max_size is not None and max_size < len(special_tokens):
+            raise ValueError("'max_size' must leave room for the special tokens.")
+
+        tokenizer = Tokenizer() if tokenizer is None else tokenizer
+        counts: Counter = Counter()
+        batch: List[str] = []
+        for text in texts:
+            batch.append(text)
+            if len(batch) == _BUILD_BATCH_SIZE:
+                counts.update(chain.from_iterable(tokenizer.tokenize_batch(batch)))
+                batch = []
+        counts.update(chain.from_iterable(tokenizer.tokenize_batch(batch)))
+
+        specials = set(special_tokens)
+        ranked = sorted((token for token, count in counts.items()
+                         if count >= min_count and token not in specials),
+                        key=lambda token: (-counts[token], token))
+        if max_size is not None:
+            ranked = ranked[:max_size - len(special_tokens)]
+        return cls(list(special_tokens) + ranked, special_tokens)
+
+    def save(self, path: str) -> None:
+        """Writes the vocabulary to a JSON file."""
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({'special_tokens': self.special_tokens, 'tokens': self.tokens},
+                      file, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> 'Vocabulary':
+        """Reads a vocabulary written by ``save``."""
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        return cls(data['tokens'], data['special_tokens'])
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __contains__(self, token: str) -> bool:
+        return token in self._index
+
+    def token_to_id(self, token: str) -> int:
+        """Returns the id of a token, or the unknown id."""
+        return self._index[token]
+
+    def id_to_token(self, token_id: int) -> str:
+        """Returns the token of an id."""
+        return self.tokens[token_id]
+
+    def encode(self, tokens: Iterable[str]) -> List[int]:
+        """Maps a list of tokens to their ids."""
+        return list(map(self._index.__getitem__, tokens))
+
+    def encode_batch(self, texts: Iterable[Union[str, Sequence[str]]],
+                     tokenizer: Optional[Tokenizer] = None,
+                     padding: Union[bool, str] = False, max_length: Optional[int] = None,
+                     truncation: str = 'right') -> EncodedBatch:
+        """
+        Tokenizes and encodes a batch of texts into NumPy int32 arrays.
+
+        All ids of the batch are looked up in one C-level pass over the
+        flattened tokens (``map`` over the index's ``__getitem__``, unknown
+        tokens handled by ``__missing__``), with no Python-level code per
+        known token.
+
+        Args:
+            texts (Iterable[Union[str, Sequence[str]]]): Texts, or already
+                tokenized texts.
+            tokenizer (Optional[Tokenizer]): Tokenizer for raw texts. Defaults to ``Tokenizer()``.
+            padding (Union[bool, str]): False for a ragged batch, True or
+                'longest' to pad to the longest row, 'max_length' to pad to
+                ``max_length``.
+            max_length (Optional[int]): Maximum number of ids per row.
+            truncation (str): Which end of a too-long row is cut, 'right' or 'left'.
+
+        Returns:
+            EncodedBatch: The encoded batch.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If an option is invalid.
+        """
+        np = _require_numpy()
+        if padding not in (False, True, 'longest', 'max_length'):
+            raise ValueError(f"Unknown padding: '{padding}'")
+        if truncation not in ('right', 'left'):
+            raise ValueError(f"Unknown truncation: '{truncation}'")
+        if max_length is not None and max_length < 0:
+            raise ValueError("'max_length' must not be negative.")
+        if padding == 'max_length' and max_length is None:
+            raise ValueError("padding='max_length' requires 'max_length'.")
+
+        texts = list(texts)
+        tokenizer = Tokenizer() if tokenizer is None else tokenizer
+        types = set(map(type, texts))
+        if types == {str}:
+            rows: List[Sequence[str]] = tokenizer.tokenize_batch(texts)
+        elif str in types:
+            rows = [tokenizer.tokenize(text) if isinstance(text, str) else text for text in texts]
+        else:
+            rows = texts
+
+        if max_length is not None:
+            if truncation == 'right':
+                rows = [row[:max_length] for row in rows]
+            else:
+                rows = [row[len(row) - max_length:] if len(row) > max_length else row for row in rows]
+
+        lengths = np.fromiter(map(len, rows), dtype=np.int32, count=len(rows))
+        offsets = np.zeros(len(rows) + 1, dtype=np.int32)
+        np.cumsum(lengths, out=offsets[1:])
+        total = int(offsets[-1])
+        ids = np.fromiter(map(self._index.__getitem__, chain.from_iterable(rows)),
+                          dtype=np.int32, count=total)
+
+        if not padding:
+            return EncodedBatch(ids, offsets, lengths, padded=False)
+
+        width = max_length if padding == 'max_length' else int(lengths.max(initial=0))
+        values = np.full((len(rows), width), self.pad_id, dtype=np.int32)
+        values[np.arange(width) < lengths[:, None]] = ids
+        return EncodedBatch(values, offsets, lengths, padded=True)
+
+    def decode_batch(self, batch: EncodedBatch) -> List[List[str]]:
+        """
+        Maps an encoded batch back to tokens, dropping padding.
+
+        Args:
+            batch (EncodedBatch): A batch returned by ``encode_batch``.
+
+        Returns:
+            List[List[str]]: The tokens of each row.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        np = _require_numpy()
+        if self._id_to_token is None:
+            self._id_to_token = np.array(self.tokens, dtype=object)
+
+        if batch.padded:
+            ids = batch.values[np.arange(batch.values.shape[1]) < batch.lengths[:, None]]
+        else:
+            ids = batch.values
+        tokens = self._id_to_token[ids].tolist()
+        offsets = batch.offsets.tolist()
+        return [tokens[start:end] for start, end in zip(offsets, offsets[1:])]
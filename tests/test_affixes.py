@@ -0,0 +1,57 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import SeramTokenizer, Tokenizer
+from seram_tokenizer.affixes import DEFAULT_AFFIX_RULES, PREFIX, SUFFIX, AffixEngine, AffixRule
+from seram_tokenizer.lexicon import Lexicon
+
+LEXICON = Lexicon(["kata", "tura", "nasi", "dara"], vowels="aiueo", consonants="bcdfgklmnprstw")
+
+class TestAffixEngine(unittest.TestCase):
+    def test_default_rules(self):
+        engine = AffixEngine(lexicon=LEXICON)
+        self.assertEqual(engine.split("ayaira"), ("ayai", "_ra"))
+        self.assertEqual(engine.split("sederhana"), ("sederhan", "_a"))
+        self.assertEqual(engine.split("dafakaleus"), ("da_", "fakaleus"))
+        self.assertEqual(engine.split("namaku"), ("na_", "maku"))
+        # Lemmas, capitalised and non-alphabetic tokens are left alone.
+        for word in ("tura", "kata", "nasi", "Ayaira", "lari-lara", "123a"):
+            self.assertEqual(engine.split(word), (word,))
+
+    def test_first_claiming_rule_decides(self):
+        engine = AffixEngine(lexicon=LEXICON)
+        # 'ra' claims the word; a consonant before it fails the rule, and the
+        # shorter 'a' rule is not tried.
+        self.assertEqual(engine.split("tikra"), ("tikra",))
+        # Once no suffix applies, prefixes are still tried.
+        self.assertEqual(engine.split("nakra"), ("na_", "kra"))
+
+    def test_apply_single_pass(self):
+        engine = AffixEngine(lexicon=LEXICON)
+        self.assertEqual(engine.apply(["Si", "dafakaleus", "ayaira", "."]),
+                         ["Si", "da_", "fakaleus", "ayai", "_ra", "."])
+
+    def test_custom_rule(self):
+        rules = (AffixRule("ku", SUFFIX, context="vowels"),) + DEFAULT_AFFIX_RULES
+        self.assertEqual(AffixRule("ku", SUFFIX).marker, "_ku")
+        self.assertEqual(AffixRule("ma", PREFIX).marker, "ma_")
+        tokenizer = Tokenizer(use_suffix=True, lexicon=LEXICON, affix_rules=rules)
+        self.assertEqual(tokenizer.tokenize("rumaiku ayaira"), ["rumai", "_ku", "ayai", "_ra"])
+        self.assertEqual(SeramTokenizer("rumaiku", use_suffix=True, lexicon=LEXICON,
+                                        affix_rules=rules).tokenize(), ["rumai", "_ku"])
+
+    def test_kinds_follow_tokenizer_flags(self):
+        text = "dafakaleus ayaira"
+        self.assertEqual(Tokenizer(use_suffix=True, lexicon=LEXICON).tokenize(text),
+                         ["dafakaleus", "ayai", "_ra"])
+        self.assertEqual(Tokenizer(use_prefix=True, lexicon=LEXICON).tokenize(text),
+                         ["da_", "fakaleus", "ayaira"])
+
+    def test_invalid_rules(self):
+        for rule in (AffixRule("ra", "infix"), AffixRule("", SUFFIX), AffixRule("ra", SUFFIX, "tones")):
+            with self.assertRaises(ValueError):
+                AffixEngine([rule], lexicon=LEXICON)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import Tokenizer
+from seram_tokenizer.benchmark import (compare, load_dataset, main, measure_tokenizer,
+                                       run_benchmarks, synthetic_corpus)
+
+class TestSyntheticCorpus(unittest.TestCase):
+    def test_size_and_determinism(self):
+        corpus = synthetic_corpus(4096, seed=1)
+        size = sum(len(text.encode('utf-8')) + 1 for text in corpus)
+        self.assertGreaterEqual(size, 4096)
+        self.assertLess(size, 4096 + 200)
+        self.assertEqual(corpus, synthetic_corpus(4096, seed=1))
+
+    def test_variants(self):
+        reduplicated = synthetic_corpus(4096, 'reduplication')
+        tokens = [token for text in reduplicated for token in Tokenizer().tokenize(text)]
+        self.assertGreater(sum('-' in token for token in tokens), len(tokens) / 2)
+
+        affixed = synthetic_corpus(4096, 'affix')
+        tokens = [token for row in Tokenizer(use_suffix=True, use_prefix=True).tokenize_batch(affixed)
+                  for token in row]
+        self.assertGreater(sum(token.startswith('_') or token.endswith('_') for token in tokens),
+                           len(tokens) / 10)
+
+        with self.assertRaises(ValueError):
+            synthetic_corpus(10, 'unknown')
+
+    def test_load_dataset(self):
+        sentences = load_dataset()
+        self.assertGreater(len(sentences), 1000)
+        self.assertEqual(sentences[0], 'ma ar')
+
+class TestMeasurements(unittest.TestCase):
+    def test_measure_tokenizer(self):
+        result = measure_tokenizer(Tokenizer(use_suffix=True), synthetic_corpus(2048), repeat=1)
+        for metric in ('mb_per_second', 'tokens_per_second', 'latency_p50_us',
+                       'latency_p95_us', 'latency_p99_us', 'peak_memory_kb'):
+            self.assertGreater(result[metric], 0)
+        self.assertLessEqual(result['latency_p50_us'], result['latency_p99_us'])
+
+    def test_run_benchmarks_report(self):
+        report = run_benchmarks(sizes=[1024], variants=['mixed'], modes=['plain', 'both'],
+                                dataset=None, repeat=1, memory=False, import_time=False)
+        self.assertEqual(sorted(report['results']), ['mixed-1KB/both', 'mixed-1KB/plain'])
+        self.assertIn('python', report['metadata'])
+        json.dumps(report)
+        with self.assertRaises(ValueError):
+            run_benchmarks(modes=['fast'])
+
+class TestCompare(unittest.TestCase):
+    BASELINE = {'results': {'case/plain': {'mb_per_second': 10.0, 'latency_p99_us': 100.0,
+                                           'peak_memory_kb': 50.0}}}
+
+    def report(self, **metrics):
+        values = dict(self.BASELINE['results']['case/plain'])
+        values.update(metrics)
+        return {'results': {'case/plain': values, 'other/plain': {'mb_per_second': 1.0}}}
+
+    def test_no_regression_within_threshold(self):
+        self.assertEqual(compare(self.BASELINE, self.report(mb_per_second=8.0, latency_p99_us=120.0)), [])
+        self.assertEqual(compare(self.BASELINE, self.report(mb_per_second=50.0, peak_memory_kb=1.0)), [])
+
+    def test_regression_direction(self):
+        regressions = compare(self.BASELINE, self.report(mb_per_second=5.0, latency_p99_us=200.0))
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith('case/plain mb_per_second'))
+
+    def test_thresholds(self):
+        current = self.report(latency_p99_us=120.0)
+        self.assertEqual(len(compare(self.BASELINE, current, threshold=0.1)), 1)
+        self.assertEqual(compare(self.BASELINE, current, threshold=0.1,
+                                 thresholds={'latency_p99_us': 0.5}), [])
+
+class TestMain(unittest.TestCase):
+    ARGS = ['--sizes', '1KB', '--variants', 'mixed', '--modes', 'plain', '--dataset', 'missing.csv',
+            '--repeat', '1', '--no-memory', '--no-import']
+
+    def test_save_and_compare(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            with redirect_stderr(io.StringIO()):
+                self.assertEqual(main(self.ARGS + ['--save', path]), 0)
+            with open(path, 'r', encoding='utf-8') as file:
+                baseline = json.load(file)
+            self.assertIn('mixed-1KB/plain', baseline['results'])
+
+            baseline['results']['mixed-1KB/plain']['mb_per_second'] *= 1000
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(baseline, file)
+            stderr = io.StringIO()
+            with redirect_stderr(stderr):
+                self.assertEqual(main(self.ARGS + ['--baseline', path]), 1)
+            self.assertIn('regression: mixed-1KB/plain mb_per_second', stderr.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import Lexicon, Tokenizer
+from seram_tokenizer.cache import CachedTokenizer, TokenCache, tokenizer_fingerprint
+
+class CountingTokenizer(Tokenizer):
+    """A Tokenizer recording the texts it actually tokenizes."""
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.seen = []
+
+    def tokenize_batch(self, texts):
+        texts = list(texts)
+        self.seen.extend(texts)
+        return super().tokenize_batch(texts)
+
+class TestTokenCache(unittest.TestCase):
+    TEXTS = ['aku tagi bua arlean', 'anggur a tura fudicastelara.', '', 'lari-lari!', 'aku tagi bua arlean']
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'tokens.db')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_matches_tokenizer_and_skips_cached_texts(self):
+        reference = Tokenizer(use_suffix=True, normalize_paragog=True).tokenize_batch(self.TEXTS)
+        tokenizer = CountingTokenizer(use_suffix=True, normalize_paragog=True)
+        with CachedTokenizer(self.path, tokenizer) as cached:
+            self.assertEqual(cached.tokenize_batch(self.TEXTS), reference)
+            # Each distinct text is tokenized once, even within a batch.
+            self.assertEqual(len(tokenizer.seen), 4)
+
+        tokenizer = CountingTokenizer(use_suffix=True, normalize_paragog=True)
+        with CachedTokenizer(self.path, tokenizer) as cached:
+            self.assertEqual(cached.tokenize_batch(self.TEXTS), reference)
+            self.assertEqual(cached.tokenize(self.TEXTS[1]), reference[1])
+            self.assertEqual(tokenizer.seen, [])
+            self.assertEqual(cached.cache.stats()['hits'], 6)
+
+    def test_configuration_change_invalidates(self):
+        lexicon = Lexicon(['tura'])
+        tokenizer = CountingTokenizer(use_suffix=True, lexicon=lexicon)
+        with CachedTokenizer(self.path, tokenizer) as cached:
+            self.assertEqual(cached.tokenize('tura'), ['tura'])
+            plain = CachedTokenizer(cached.cache, CountingTokenizer())
+            self.assertNotEqual(plain.fingerprint, cached.fingerprint)
+
+            lexicon.remove_words(['tura'])
+            self.assertEqual(cached.tokenize('tura'), ['tu', '_ra'])
+            self.assertEqual(tokenizer.seen, ['tura', 'tura'])
+
+        # The fingerprint depends on lexicon content, not on the object or its version.
+        self.assertEqual(tokenizer_fingerprint(Tokenizer(use_suffix=True, lexicon=Lexicon([]))),
+                         tokenizer_fingerprint(Tokenizer(use_suffix=True, lexicon=lexicon)))
+        self.assertEqual(tokenizer_fingerprint(Tokenizer(lexicon=Lexicon(['x']))),
+                         tokenizer_fingerprint(Tokenizer()))
+
+    def test_eviction_keeps_recent_entries(self):
+        fingerprint = tokenizer_fingerprint(Tokenizer())
+        with TokenCache(self.path, max_bytes=2000) as cache:
+            for start in range(0, 100, 10):
+                texts = [f'kata{index}' for index in range(start, start + 10)]
+                cache.put_many(fingerprint, texts, [[text] for text in texts])
+                # Keep the first batch in use.
+                cache.get_many(fingerprint, ['kata0'])
+
+            stats = cache.stats()
+            self.assertLessEqual(stats['bytes'], 2000)
+            self.assertGreater(stats['evictions'], 0)
+            self.assertEqual(len(cache), 100 - stats['evictions'])
+            self.assertEqual(cache.get_many(fingerprint, ['kata0', 'kata99', 'kata1']),
+                             [['kata0'], ['kata99'], None])
+
+    def test_lookups_do_not_take_the_write_lock(self):
+        fingerprint = tokenizer_fingerprint(Tokenizer())
+        with TokenCache(self.path) as cache:
+            cache.put_many(fingerprint, ['a', 'b'], [['a'], ['b']])
+        writer = sqlite3.connect(self.path, isolation_level=None)
+        with TokenCache(self.path, timeout=0.1) as cache:
+            writer.execute('BEGIN IMMEDIATE')
+            self.assertEqual(cache.get_many(fingerprint, ['a', 'c']), [['a'], None])
+            writer.execute('ROLLBACK')
+        # The hit's recency is written on close.
+        used = dict(writer.execute('SELECT tokens, used FROM tokens'))
+        writer.close()
+        self.assertGreater(used[b'a'], used[b'b'])
+
+    def test_lone_surrogates_round_trip(self):
+        text = 'abc \ud800 x'
+        with CachedTokenizer(self.path) as cached:
+            expected = Tokenizer().tokenize(text)
+            self.assertEqual(cached.tokenize(text), expected)
+        with CachedTokenizer(self.path) as cached:
+            self.assertEqual(cached.tokenize(text), expected)
+            self.assertEqual(cached.cache.hits, 1)
+
+    def test_persistence_and_clear(self):
+        fingerprint = tokenizer_fingerprint(Tokenizer())
+        with TokenCache(self.path) as cache:
+            cache.put_many(fingerprint, ['a b', ''], [['a', 'b'], []])
+        with TokenCache(self.path) as cache:
+            self.assertEqual(cache.get_many(fingerprint, ['', 'a b', 'c']), [[], ['a', 'b'], None])
+            cache.clear()
+            self.assertEqual((len(cache), cache.size), (0, 0))
+            with self.assertRaises(ValueError):
+                cache.put_many(fingerprint, ['a'], [])
+
+    def test_versions(self):
+        # An older cache is emptied and upgraded.
+        connection = sqlite3.connect(self.path)
+        connection.executescript("CREATE TABLE tokens (key BLOB PRIMARY KEY, tokens TEXT, size INTEGER, used INTEGER);"
+                                 "INSERT INTO tokens VALUES (x'00', 'a b', 4, 1); PRAGMA user_version = 1;")
+        connection.close()
+        fingerprint = tokenizer_fingerprint(Tokenizer())
+        with TokenCache(self.path) as cache:
+            self.assertEqual((len(cache), cache.size), (0, 0))
+            cache.put_many(fingerprint, ['a b'], [['a', 'b']])
+        with TokenCache(self.path) as cache:
+            self.assertEqual(cache.get_many(fingerprint, ['a b']), [['a', 'b']])
+
+        # A newer one is left alone.
+        connection = sqlite3.connect(self.path)
+        connection.execute('PRAGMA user_version = 99')
+        connection.close()
+        with self.assertRaises(ValueError):
+            TokenCache(self.path)
+        with self.assertRaises(ValueError):
+            TokenCache(os.path.join(self.directory.name, 'other.db'), max_bytes=0)
+
+    def test_invalid_input(self):
+        with CachedTokenizer(self.path) as cached:
+            with self.assertRaises(TypeError):
+                cached.tokenize(None)
+            with self.assertRaises(TypeError):
+                cached.tokenize_batch('text')
+            with self.assertRaises(ValueError):
+                CachedTokenizer(cached.cache, Tokenizer(), use_suffix=True)
+
+if __name__ == '__main__':
+    unittest.main()
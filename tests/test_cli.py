@@ -0,0 +1,70 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest import mock
+from seram_tokenizer.cli import main
+
+class TestCommandLine(unittest.TestCase):
+    LINES = "aku fas anggura tura fudicastelara.\nSi dafakaleus ayaira\n\nlari-lari!\n"
+
+    def test_parallel_output_matches_sequential(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "in.txt")
+            with open(source, "w", encoding="utf-8") as file:
+                file.write(self.LINES * 25)
+            outputs = []
+            for workers in ("1", "2"):
+                target = os.path.join(tmp, f"out{workers}.txt")
+                main([source, "-o", target, "--use-suffix", "-j", workers, "--batch-size", "3"])
+                with open(target, encoding="utf-8") as file:
+                    outputs.append(file.read())
+            self.assertEqual(outputs[0], outputs[1])
+            self.assertEqual(len(outputs[0].splitlines()), 100)
+
+    def test_main_with_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "in.txt")
+            target = os.path.join(tmp, "out.txt")
+            with open(source, "w", encoding="utf-8") as file:
+                file.write(self.LINES)
+            self.assertEqual(main([source, "-o", target]), 0)
+            with open(target, encoding="utf-8") as file:
+                self.assertEqual(file.readline(), "aku fas anggura tura fudicastelara .\n")
+
+    def test_missing_input_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit):
+                main([os.path.join(tmp, "missing.txt"), "-o", os.path.join(tmp, "out.txt")])
+            self.assertIn("can't open", stderr.getvalue())
+            self.assertFalse(os.path.exists(os.path.join(tmp, "out.txt")))
+
+    def test_bad_subword_model(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            invalid = os.path.join(tmp, "model.json")
+            with open(invalid, "w", encoding="utf-8") as file:
+                file.write("[]")
+            for path in (os.path.join(tmp, "missing.json"), invalid):
+                stderr = io.StringIO()
+                with contextlib.redirect_stderr(stderr), self.assertRaises(SystemExit):
+                    main(["--subword", path, "-o", os.path.join(tmp, "out.txt")])
+                self.assertIn(f"can't load subword model '{path}'", stderr.getvalue())
+            self.assertFalse(os.path.exists(os.path.join(tmp, "out.txt")))
+
+    def test_standard_streams_use_encoding(self):
+        stdin = io.TextIOWrapper(io.BytesIO("lari-lari ayaira!\n".encode("utf-16")), encoding="ascii")
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="ascii")
+        with mock.patch("sys.stdin", stdin), mock.patch("sys.stdout", stdout):
+            self.assertEqual(main(["--encoding", "utf-16", "--use-suffix"]), 0)
+        self.assertEqual(stdout.buffer.getvalue().decode("utf-16"), "lari-lari ayai _ra !\n")
+
+    def test_unknown_language(self):
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["--language", "klingon"])
+
+if __name__ == '__main__':
+    unittest.main()
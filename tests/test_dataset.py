@@ -0,0 +1,91 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import Tokenizer
+from seram_tokenizer.dataset import MANIFEST_FILE, TokenizedDataset, export_dataset, main
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'dataset_seram_geser.csv')
+
+class TestTokenizedDataset(unittest.TestCase):
+    ROWS = [
+        ('saya pergi ke sungai', 'aku tagi bua arlean'),
+        ('"anggur, itu"', 'anggur a tura fudicastelara.'),
+        ('', 'lari-lari!'),
+        ('hanya satu kolom', None),
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.csv = os.path.join(self.directory.name, 'corpus.csv')
+        with open(self.csv, 'w', encoding='utf-8') as file:
+            for source, target in self.ROWS:
+                file.write(source if target is None else f'{source},{target}')
+                file.write('\n')
+        self.output = os.path.join(self.directory.name, 'tokenized')
+        self.tokenizers = [Tokenizer(), Tokenizer(use_suffix=True, normalize_paragog=True)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        self.assertEqual(export_dataset(self.csv, self.output, self.tokenizers), 4)
+        with TokenizedDataset(self.output) as dataset:
+            self.assertEqual(len(dataset), 4)
+            self.assertEqual(dataset.columns, ['indonesian', 'geser'])
+            self.assertEqual(dataset[1], {
+                'indonesian': self.tokenizers[0].tokenize('anggur, itu'),
+                'geser': self.tokenizers[1].tokenize('anggur a tura fudicastelara.'),
+            })
+            self.assertEqual(dataset.tokens('indonesian', 2), [])
+            self.assertEqual(dataset[-1], {'indonesian': ['hanya', 'satu', 'kolom'], 'geser': []})
+            self.assertEqual(len(list(dataset)), 4)
+
+            vocabulary = dataset.vocabulary('geser')
+            self.assertEqual(list(dataset.ids('geser', 0)), vocabulary.encode(['aku', 'tagi', 'bua', 'arlean']))
+            self.assertEqual(dataset.manifest['tokenizers']['geser']['normalize_paragog'], True)
+
+    def test_errors(self):
+        export_dataset(self.csv, self.output, self.tokenizers)
+        with TokenizedDataset(self.output) as dataset:
+            with self.assertRaises(IndexError):
+                dataset.ids('geser', 4)
+            with self.assertRaises(KeyError):
+                dataset.tokens('gorom', 0)
+        with self.assertRaises(ValueError):
+            export_dataset(self.csv, self.output, self.tokenizers[:1])
+
+        with open(os.path.join(self.output, MANIFEST_FILE), 'w', encoding='utf-8') as file:
+            json.dump({'format': 99}, file)
+        with self.assertRaises(ValueError):
+            TokenizedDataset(self.output)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_to_numpy(self):
+        export_dataset(self.csv, self.output, self.tokenizers)
+        dataset = TokenizedDataset(self.output)
+        ids, offsets = dataset.to_numpy('geser')
+        self.assertEqual(offsets.tolist()[0], 0)
+        self.assertEqual(len(offsets), 5)
+        self.assertEqual(ids[offsets[1]:offsets[2]].tolist(), list(dataset.ids('geser', 1)))
+        del ids, offsets
+        dataset.close()
+
+    def test_main_on_bundled_dataset(self):
+        with redirect_stderr(StringIO()):
+            self.assertEqual(main([DATASET, self.output, '--use-suffix']), 0)
+        with TokenizedDataset(self.output) as dataset:
+            self.assertEqual(len(dataset), 3538)
+            self.assertEqual(dataset[0], {'indonesian': ['ambil', 'air'], 'geser': ['ma', 'ar']})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer.fuzzy import FuzzyIndex, Match, edit_distance, main
+from seram_tokenizer.lexicon import Lexicon
+
+class TestEditDistance(unittest.TestCase):
+    def test_distances(self):
+        self.assertEqual(edit_distance('anggur', 'anggur'), 0)
+        self.assertEqual(edit_distance('anggura', 'anggur'), 1)
+        self.assertEqual(edit_distance('nugu', 'ngu'), 1)
+        self.assertEqual(edit_distance('tura', 'tuar'), 1)
+        self.assertEqual(edit_distance('kitten', 'sitting'), 3)
+        self.assertEqual(edit_distance('', 'aku'), 3)
+
+    def test_bound(self):
+        self.assertEqual(edit_distance('kitten', 'sitting', max_distance=1), 2)
+        self.assertEqual(edit_distance('a', 'abcdef', max_distance=2), 3)
+
+class TestFuzzyIndex(unittest.TestCase):
+    WORDS = ['anggur', 'angsuran', 'aku', 'kau', 'ku', 'tura', 'lari-lari', 'afi boil']
+
+    def setUp(self):
+        self.index = FuzzyIndex(self.WORDS)
+
+    def brute_force(self, word, max_distance=2):
+        matches = [Match(entry, edit_distance(word, entry, max_distance)) for entry in self.WORDS]
+        return sorted((match for match in matches if match.distance <= max_distance),
+                      key=lambda match: (match.distance, match.word))
+
+    def test_lookup_matches_brute_force(self):
+        for word in ('anggura', 'aku', 'tuar', 'lari-lar', 'afi bol', 'xyzxyz', ''):
+            self.assertEqual(self.index.lookup(word), self.brute_force(word), word)
+
+    def test_ranking_and_limit(self):
+        self.assertEqual(self.index.lookup('aku'),
+                         [Match('aku', 0), Match('kau', 1), Match('ku', 1)])
+        self.assertEqual(self.index.lookup('anggura', limit=1), [Match('anggur', 1)])
+        self.assertEqual(self.index.lookup('anggura', max_distance=0), [])
+        with self.assertRaises(ValueError):
+            self.index.lookup('aku', max_distance=3)
+
+    def test_batch(self):
+        self.assertEqual(self.index.lookup_batch(['aku', 'tuar', 'aku'], max_distance=1),
+                         [self.index.lookup('aku', 1), [Match('tura', 1)], self.index.lookup('aku', 1)])
+
+    def test_from_lexicon(self):
+        index = FuzzyIndex.from_lexicon(Lexicon(self.WORDS, vowels='aiu', consonants='gkr'), max_distance=1)
+        self.assertEqual(len(index), len(self.WORDS))
+        self.assertEqual(index.lookup('anggura'), [Match('anggur', 1)])
+        with self.assertRaises(ValueError):
+            FuzzyIndex(self.WORDS, max_distance=-1)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'index.json')
+            self.index.save(path)
+            loaded = FuzzyIndex.load(path)
+            self.assertEqual(loaded.lookup('anggura'), self.index.lookup('anggura'))
+            self.assertEqual(loaded.max_distance, 2)
+
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write('{"format": 99}')
+            with self.assertRaises(ValueError):
+                FuzzyIndex.load(path)
+
+    def test_main_builds_geser_index(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'geser.fuzzy.json')
+            self.assertEqual(main([path, '--max-distance', '1']), 0)
+            index = FuzzyIndex.load(path)
+        self.assertEqual(index.max_distance, 1)
+        self.assertIn(Match('anggur', 1), index.lookup('anggura'))
+
+if __name__ == '__main__':
+    unittest.main()
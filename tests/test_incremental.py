@@ -0,0 +1,75 @@
+import os
+import random
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import Tokenizer
+from seram_tokenizer.incremental import TokenDiff, TokenizationSession
+
+class TestTokenizationSession(unittest.TestCase):
+    TEXT = "aku fas anggur a tura fudicastelara. Si dafakaleus ayaira, lari-lari a!"
+
+    def assertMatchesFullTokenization(self, session):
+        tokenizer = session.tokenizer
+        self.assertEqual(session.tokens, tokenizer.tokenize(session.text))
+        self.assertEqual(list(session.spans().spans()), list(tokenizer.tokenize_spans(session.text).spans()))
+
+    def test_typing_returns_token_diffs(self):
+        session = TokenizationSession("aku tagi", use_suffix=True)
+        self.assertEqual(session.edit(8, 0, ' bua'), TokenDiff(2, [], ['bua']))
+        self.assertEqual(session.edit(12, 0, 'ra'), TokenDiff(3, [], ['_ra']))
+        self.assertEqual(session.edit(4, 4, 'lari-lari'), TokenDiff(1, ['tagi'], ['lari-lari']))
+        self.assertEqual(session.edit(0, 0, ''), TokenDiff(0, [], []))
+        self.assertEqual(session.text, "aku lari-lari buara")
+        self.assertMatchesFullTokenization(session)
+
+    def test_edits_next_to_the_window_boundaries(self):
+        session = TokenizationSession("lari lari anggur ra", normalize_paragog=True)
+        self.assertEqual(session.tokens, ['lari', 'lari', 'anggurra'])
+        # Joining two words into a reduplication reaches back over the space.
+        self.assertEqual(session.edit(4, 1, '-'), TokenDiff(0, ['lari', 'lari'], ['lari-lari']))
+        # A particle separated from its word becomes a token of its own.
+        self.assertEqual(session.edit(16, 0, '.'), TokenDiff(1, ['anggurra'], ['anggur', '.', 'ra']))
+        self.assertMatchesFullTokenization(session)
+
+    def test_random_edits_match_full_tokenization(self):
+        rng = random.Random(7)
+        pieces = list("ab ra na-,.!\n") + [' a ', 'ra ', 'lari-lari', 'fudicastelara', ' na', 'da']
+        for options in ({}, {'use_suffix': True, 'use_prefix': True},
+                        {'use_suffix': True, 'use_prefix': True, 'normalize_paragog': True}):
+            session = TokenizationSession(self.TEXT * 3, **options)
+            for _ in range(200):
+                before = list(session.tokens)
+                offset = rng.randint(0, len(session.text))
+                deleted = rng.randint(0, min(4, len(session.text) - offset))
+                inserted = ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 2)))
+                diff = session.edit(offset, deleted, inserted)
+                self.assertEqual(session.tokens, session.tokenizer.tokenize(session.text))
+                self.assertEqual(before[:diff.start] + diff.inserted + before[diff.start + len(diff.removed):],
+                                 session.tokens)
+            self.assertMatchesFullTokenization(session)
+
+    def test_apply_and_reset(self):
+        tokenizer = Tokenizer(use_prefix=True)
+        session = TokenizationSession('', tokenizer)
+        diffs = session.apply([(0, 0, 'dafakaleus'), (10, 0, '!'), (0, 10, 'aku')])
+        self.assertEqual([diff.inserted for diff in diffs], [['da_', 'fakaleus'], ['!'], ['aku']])
+        self.assertEqual(session.tokens, ['aku', '!'])
+        session.reset(self.TEXT)
+        self.assertEqual(len(session), len(tokenizer.tokenize(self.TEXT)))
+
+    def test_invalid_edits(self):
+        session = TokenizationSession("aku")
+        with self.assertRaises(ValueError):
+            session.edit(2, 2)
+        with self.assertRaises(ValueError):
+            session.edit(-1, 0, 'a')
+        with self.assertRaises(TypeError):
+            session.edit(0, 0, None)
+        with self.assertRaises(TypeError):
+            TokenizationSession(None)
+        with self.assertRaises(ValueError):
+            TokenizationSession("aku", Tokenizer(), use_suffix=True)
+
+if __name__ == '__main__':
+    unittest.main()
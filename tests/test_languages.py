@@ -0,0 +1,100 @@
+import os
+import pickle
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import MultilingualTokenizer, Tokenizer
+from seram_tokenizer.affixes import SUFFIX, AffixRule
+from seram_tokenizer.languages import (_PROFILES, LanguageProfile, available_languages,
+                                       get_language, register_language)
+from seram_tokenizer.lexicon import Lexicon, get_lexicon
+
+class LanguageTestCase(unittest.TestCase):
+    def setUp(self):
+        self.loads = 0
+
+        def load_test_language():
+            self.loads += 1
+            return Lexicon(['fudicastelara'], vowels='aeiou', consonants='bcdfgklmnprstv')
+
+        # A second language with its own lemma list and a single '_ke' suffix rule.
+        register_language(LanguageProfile('test', 'Test', load_test_language,
+                                          affix_rules=[AffixRule('ke', SUFFIX)]))
+
+    def tearDown(self):
+        _PROFILES.pop('test', None)
+
+class TestLanguageProfiles(LanguageTestCase):
+    def test_geser_is_registered(self):
+        profile = get_language('geser')
+        self.assertEqual(profile.name, 'Geser')
+        self.assertIs(profile.lexicon, get_lexicon('geser'))
+        self.assertIn('geser', available_languages())
+
+    def test_unknown_language(self):
+        with self.assertRaises(KeyError):
+            get_language('klingon')
+        with self.assertRaises(KeyError):
+            Tokenizer(language='klingon')
+
+    def test_lexicon_loaded_lazily_once(self):
+        profile = get_language('test')
+        self.assertFalse(profile.loaded)
+        Tokenizer(use_suffix=True, language='test')
+        self.assertEqual(self.loads, 0)
+        self.assertIs(profile.lexicon, profile.lexicon)
+        self.assertEqual(self.loads, 1)
+
+    def test_invalid_profiles(self):
+        with self.assertRaises(TypeError):
+            LanguageProfile('bad', 'Bad', ['kata'])
+        with self.assertRaises(TypeError):
+            register_language('geser')
+        profile = LanguageProfile('bad', 'Bad', lambda: ['kata'])
+        with self.assertRaises(TypeError):
+            profile.lexicon
+
+class TestLanguageTokenizers(LanguageTestCase):
+    TEXT = "fudicastelara sukake"
+
+    def test_tokenizer_uses_language_rules(self):
+        geser = Tokenizer(use_suffix=True)
+        test = Tokenizer(use_suffix=True, language='test')
+        self.assertEqual(geser.tokenize(self.TEXT), ['fudicastela', '_ra', 'sukake'])
+        self.assertEqual(test.tokenize(self.TEXT), ['fudicastelara', 'suka', '_ke'])
+
+    def test_explicit_options_override_profile(self):
+        tokenizer = Tokenizer(use_suffix=True, language='test', lexicon=['sukake'],
+                              affix_rules=[AffixRule('ra', SUFFIX)])
+        self.assertEqual(tokenizer.tokenize(self.TEXT), ['fudicastela', '_ra', 'sukake'])
+
+    def test_multilingual_switching(self):
+        tokenizer = MultilingualTokenizer(use_suffix=True)
+        requests = [(self.TEXT, 'test'), (self.TEXT, None), (self.TEXT, 'geser'), (self.TEXT, 'test')]
+        self.assertEqual(tokenizer.tokenize_requests(requests), [
+            ['fudicastelara', 'suka', '_ke'],
+            ['fudicastela', '_ra', 'sukake'],
+            ['fudicastela', '_ra', 'sukake'],
+            ['fudicastelara', 'suka', '_ke'],
+        ])
+        self.assertIs(tokenizer.tokenizer('test'), tokenizer.tokenizer('test'))
+        self.assertIs(tokenizer.tokenizer(), tokenizer.tokenizer('geser'))
+        self.assertEqual(self.loads, 1)
+        self.assertEqual(tokenizer.tokenize_batch([self.TEXT], language='test'),
+                         [['fudicastelara', 'suka', '_ke']])
+
+    def test_multilingual_validation_and_pickle(self):
+        with self.assertRaises(ValueError):
+            MultilingualTokenizer(language='geser')
+        with self.assertRaises(KeyError):
+            MultilingualTokenizer(default_language='klingon')
+        with self.assertRaises(KeyError):
+            MultilingualTokenizer().tokenize(self.TEXT, language='klingon')
+
+        tokenizer = MultilingualTokenizer(use_suffix=True)
+        tokenizer.tokenize(self.TEXT)
+        copy = pickle.loads(pickle.dumps(tokenizer))
+        self.assertEqual(copy.tokenize(self.TEXT), ['fudicastela', '_ra', 'sukake'])
+
+if __name__ == '__main__':
+    unittest.main()
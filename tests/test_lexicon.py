@@ -0,0 +1,100 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import lexicon
+from seram_tokenizer.lexicon import Lexicon, get_lexicon, load_data_file
+from seram_tokenizer.tokenizer import Tokenizer
+
+PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Records every file opened while importing the package and every public name.
+IMPORT_PROBE = """
+import builtins, io, json, sys, time
+opened = []
+real_open = io.open
+def tracking_open(file, *args, **kwargs):
+    opened.append(str(file))
+    return real_open(file, *args, **kwargs)
+builtins.open = io.open = tracking_open
+start = time.perf_counter()
+import seram_tokenizer
+seconds = time.perf_counter() - start
+print(json.dumps({
+    'opened': [path for path in opened if 'seram_tokenizer' in path and path.endswith('.txt')],
+    'pkg_resources': 'pkg_resources' in sys.modules,
+    'seconds': seconds,
+}))
+"""
+
+class TestStartup(unittest.TestCase):
+    def test_import_does_no_file_io(self):
+        result = subprocess.run([sys.executable, '-c', IMPORT_PROBE], cwd=PACKAGE_ROOT,
+                                stdout=subprocess.PIPE, check=True)
+        probe = json.loads(result.stdout.decode())
+        self.assertEqual(probe['opened'], [])
+        self.assertFalse(probe['pkg_resources'])
+        self.assertLess(probe['seconds'], 0.5)
+
+class TestLexiconRegistry(unittest.TestCase):
+    def test_shared_lexicon_is_loaded_once(self):
+        self.assertIs(get_lexicon(), get_lexicon())
+        self.assertIs(load_data_file('vocal.txt'), load_data_file('vocal.txt'))
+        self.assertEqual(set(lexicon._DATA_FILES),
+                         {'geser_word.txt', 'vocal.txt', 'consonant.txt', 'pronounce.txt'})
+
+    def test_legacy_module_sets_share_the_lexicon(self):
+        from seram_tokenizer import find_words, prefix_analyser, suffix_analayser
+        shared = get_lexicon()
+        self.assertEqual(set(find_words.DICTIONARY_WORDS), shared.words)
+        self.assertEqual(suffix_analayser.LEMMA_WITH_RA, shared.lemma_with_ra)
+        self.assertEqual(prefix_analyser.LEMMA_WITH_DA, shared.lemma_with_da)
+        self.assertIn('a', suffix_analayser.VOCAL_LETTERS)
+        # Derived subsets cannot be changed behind the lexicon's back.
+        with self.assertRaises(AttributeError):
+            suffix_analayser.LEMMA_WITH_RA.add('fudicastelara')
+
+    def test_legacy_dictionary_words_changes_reach_the_lexicon(self):
+        from seram_tokenizer import find_words
+        shared = get_lexicon()
+        tokenizer = Tokenizer(use_suffix=True)
+        self.assertEqual(tokenizer.tokenize('fudicastelara'), ['fudicastela', '_ra'])
+        version = shared.version
+        try:
+            find_words.DICTIONARY_WORDS.add('fudicastelara')
+            self.assertIn('fudicastelara', shared.single_words)
+            self.assertEqual(shared.version, version + 1)
+            self.assertEqual(tokenizer.tokenize('fudicastelara'), ['fudicastelara'])
+            find_words.DICTIONARY_WORDS.update(['kata satu', 'kata dua'])
+            self.assertEqual(shared.version, version + 2)
+            self.assertIn('kata satu', shared.multi_words)
+        finally:
+            find_words.DICTIONARY_WORDS -= {'fudicastelara', 'kata satu', 'kata dua'}
+        self.assertNotIn('fudicastelara', shared.lemma_with_ra)
+        self.assertEqual(tokenizer.tokenize('fudicastelara'), ['fudicastela', '_ra'])
+
+    def test_derived_subsets(self):
+        custom = Lexicon(['ayaira', 'nasi', 'dara', 'kata', 'ada baru'], vowels='aiueo', consonants='bcd')
+        self.assertEqual(custom.multi_words, {'ada baru'})
+        self.assertEqual(custom.lemma_with_ra, {'ayaira', 'dara'})
+        self.assertEqual(custom.lemma_with_a, {'ayaira', 'dara', 'kata'})
+        self.assertEqual(custom.lemma_with_na, {'nasi'})
+        self.assertEqual(custom.lemma_with_da, {'dara'})
+
+    def test_changes_bump_version(self):
+        custom = Lexicon(['kata'], vowels='aiueo', consonants='bcd')
+        custom.add_words(['nasi'])
+        self.assertEqual(custom.version, 1)
+        self.assertIn('nasi', custom.lemma_with_na)
+        custom.remove_words(['nasi'])
+        self.assertEqual(custom.version, 2)
+        self.assertNotIn('nasi', custom.lemma_with_na)
+
+    def test_unknown_lexicon(self):
+        with self.assertRaises(KeyError):
+            get_lexicon('unknown')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import pickle
+import random
+import sys
+import tempfile
+import unittest
+from collections import Counter
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import Tokenizer
+from seram_tokenizer.lexicon import Lexicon
+from seram_tokenizer.oov import FrequencySketch, OOVAnalyzer, OOVStats
+
+class TestFrequencySketch(unittest.TestCase):
+    def stream(self, seed=0):
+        rng = random.Random(seed)
+        # Zipf-like: a few heavy hitters and a long tail of rare items.
+        return [f'w{min(int(rng.paretovariate(1.0)), 5000)}' for _ in range(20000)]
+
+    def test_heavy_hitters_within_error_bound(self):
+        items = self.stream()
+        exact = Counter(items)
+        sketch = FrequencySketch(50)
+        for item in items:
+            sketch.add(item)
+        self.assertLessEqual(len(sketch), 100)
+        self.assertLessEqual(sketch.error_bound, len(items) / 51)
+        estimates = dict(sketch.most_common())
+        for item, count in exact.most_common(10):
+            self.assertIn(item, estimates)
+            self.assertLessEqual(estimates[item], count)
+            self.assertGreaterEqual(estimates[item], count - sketch.error_bound)
+
+    def test_merge(self):
+        first, second = self.stream(1), self.stream(2)
+        exact = Counter(first + second)
+        left, right = FrequencySketch(50), FrequencySketch(50)
+        left.update(Counter(first))
+        right.update(Counter(second))
+        left.merge(right)
+        self.assertEqual(left.total, len(first) + len(second))
+        estimates = dict(left.most_common())
+        for item, count in exact.most_common(5):
+            self.assertGreaterEqual(estimates[item], count - left.error_bound)
+        with self.assertRaises(ValueError):
+            left.merge(FrequencySketch(10))
+        with self.assertRaises(ValueError):
+            FrequencySketch(0)
+
+class TestOOVAnalyzer(unittest.TestCase):
+    LEXICON = Lexicon(['aku', 'fas', 'nugu', 'lari-lari', 'tura'])
+    TEXTS = ["Aku fas anggur, 12 tura.", "aku soa soa!", "", "lari-lari fudicastelara"]
+
+    def analyzer(self, **options):
+        return OOVAnalyzer(self.LEXICON, tokenizer=Tokenizer(use_suffix=True), **options)
+
+    def test_document_and_corpus_coverage(self):
+        analyzer = self.analyzer()
+        documents = list(analyzer.analyze_texts(self.TEXTS))
+        self.assertEqual([(document.tokens, document.unknown) for document in documents],
+                         [(4, 1), (3, 2), (0, 0), (2, 1)])
+        self.assertEqual(documents[2].coverage, 1.0)
+        self.assertAlmostEqual(documents[0].coverage, 0.75)
+
+        stats = analyzer.stats
+        self.assertEqual((stats.documents, stats.tokens, stats.unknown), (4, 9, 4))
+        self.assertAlmostEqual(stats.coverage, 5 / 9)
+        self.assertEqual(stats.most_common(), [('soa', 2), ('anggur', 1), ('fudicastela', 1)])
+
+    def test_case_sensitive_lookup(self):
+        analyzer = self.analyzer(lowercase=False)
+        analyzer.add_document(['Aku', 'aku'])
+        self.assertEqual(analyzer.stats.most_common(), [('Aku', 1)])
+
+    def test_analyze_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'corpus.txt')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write('\n'.join(self.TEXTS) + '\n')
+            analyzer = self.analyzer()
+            self.assertEqual(len(list(analyzer.analyze_file(path))), 4)
+        self.assertEqual(analyzer.stats.unknown, 4)
+
+    def test_merge_parallel_parts(self):
+        whole = self.analyzer()
+        list(whole.analyze_texts(self.TEXTS * 3))
+
+        parts = []
+        for index in range(3):
+            part = self.analyzer()
+            list(part.analyze_texts(self.TEXTS))
+            # Partial results travel between processes as pickled OOVStats.
+            parts.append(pickle.loads(pickle.dumps(part.stats)))
+        merged = OOVStats()
+        for part in parts:
+            merged.merge(part)
+        self.assertEqual(merged.as_dict(), whole.stats.as_dict())
+        with self.assertRaises(ValueError):
+            merged.merge(OOVStats(max_types=10))
+
+    def test_bounded_types(self):
+        analyzer = self.analyzer(max_types=1)
+        list(analyzer.analyze_texts(self.TEXTS * 10))
+        self.assertFalse(analyzer.stats.exact)
+        self.assertEqual(analyzer.stats.most_common(1)[0][0], 'soa')
+        self.assertLessEqual(len(analyzer.stats.counts), 2)
+        self.assertEqual(analyzer.stats.unknown, 40)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import GeserParagogNormalizer, Tokenizer
+from seram_tokenizer.paragog_normaliser import normalize_paragogs
+
+class TestParagogNormalizer(unittest.TestCase):
+    def test_merges_detached_particles(self):
+        normalizer = GeserParagogNormalizer(["aku fas anggur a tura", "ayai ra", "kata a."])
+        self.assertEqual(normalizer.normalize(), ["aku fas anggura tura", "ayaira", "kata a."])
+
+    def test_only_matched_occurrences_are_merged(self):
+        # 'kata a' also occurs inside 'bakata abu', which must stay as it is.
+        self.assertEqual(normalize_paragogs("kata a bakata abu"), "kataa bakata abu")
+        self.assertEqual(normalize_paragogs("kata\ta  dan"), "kataa  dan")
+
+    def test_short_lines_pass_through_lazily(self):
+        sentences = (sentence for sentence in ["aku", "", "anggur a"])
+        normalized = GeserParagogNormalizer(sentences).iter_normalize()
+        self.assertEqual(next(normalized), "aku")
+        self.assertEqual(list(normalized), ["", "anggura"])
+
+    def test_invalid_input(self):
+        with self.assertRaises(TypeError):
+            GeserParagogNormalizer("aku a")
+        with self.assertRaises(TypeError):
+            GeserParagogNormalizer(123)
+        with self.assertRaises(TypeError):
+            GeserParagogNormalizer(["aku a", 1]).normalize()
+
+class TestParagogTokenizerStage(unittest.TestCase):
+    TEXT = "aku fas anggur a tura, lari-lari a di ayai ra. kata a, ma ra\nra a"
+
+    def test_matches_normalize_then_tokenize(self):
+        for use_suffix in (False, True):
+            tokenizer = Tokenizer(use_suffix=use_suffix, normalize_paragog=True)
+            expected = Tokenizer(use_suffix=use_suffix).tokenize(normalize_paragogs(self.TEXT))
+            self.assertEqual(tokenizer.tokenize(self.TEXT), expected)
+
+    def test_stream_keeps_particles_across_chunks(self):
+        tokenizer = Tokenizer(normalize_paragog=True)
+        expected = tokenizer.tokenize(self.TEXT)
+        self.assertIn("anggura", expected)
+        for size in range(1, 9):
+            chunks = (self.TEXT[i:i + size] for i in range(0, len(self.TEXT), size))
+            self.assertEqual(list(tokenizer.tokenize_stream(chunks)), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import Tokenizer
+from seram_tokenizer.parallel import ParallelTokenizer, batched
+
+class TestParallelTokenizer(unittest.TestCase):
+    TEXTS = ["aku fas anggura tura fudicastelara.", "Si dafakaleus ayaira", "",
+             "Dia suka lari-lari di pagi hari.", "123 ?!"] * 20
+
+    def test_order_preserved_across_workers(self):
+        expected = Tokenizer(use_suffix=True, use_prefix=True).tokenize_batch(self.TEXTS)
+        parallel = ParallelTokenizer(workers=2, chunk_size=3, use_suffix=True, use_prefix=True)
+        self.assertEqual(list(parallel.tokenize_corpus(iter(self.TEXTS))), expected)
+
+    def test_stats(self):
+        parallel = ParallelTokenizer(workers=1, chunk_size=7)
+        tokens = list(parallel.tokenize_corpus(self.TEXTS))
+        self.assertEqual(parallel.stats.sentences, len(self.TEXTS))
+        self.assertEqual(parallel.stats.tokens, sum(len(t) for t in tokens))
+        self.assertGreater(parallel.stats.seconds, 0)
+        self.assertIn('tokens_per_second', parallel.stats.as_dict())
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            ParallelTokenizer(workers=0)
+        with self.assertRaises(ValueError):
+            ParallelTokenizer(chunk_size=0)
+
+    def test_batched(self):
+        self.assertEqual(list(batched(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+if __name__ == '__main__':
+    unittest.main()
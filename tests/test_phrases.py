@@ -0,0 +1,107 @@
+import os
+import pickle
+import random
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import CachedTokenizer, Lexicon, Tokenizer
+from seram_tokenizer.incremental import TokenizationSession
+from seram_tokenizer.phrases import PhraseMatch, PhraseMatcher
+from seram_tokenizer.spans import TOKEN_PHRASE
+
+class TestPhraseMatcher(unittest.TestCase):
+    PHRASES = ['a b', 'a b c', 'b c d', 'c d', 'b c', 'lari-lari a', 'x , y', 'single']
+
+    def brute_force(self, phrases, tokens):
+        entries = {tuple(phrase.split()) for phrase in phrases}
+        matches = []
+        start = 0
+        while start < len(tokens):
+            for end in range(len(tokens), start + 1, -1):
+                if tuple(tokens[start:end]) in entries:
+                    matches.append(PhraseMatch(start, end, ' '.join(tokens[start:end])))
+                    start = end
+                    break
+            else:
+                start += 1
+        return matches
+
+    def test_leftmost_longest(self):
+        matcher = PhraseMatcher(self.PHRASES)
+        # Single words and entries with punctuation are not compiled.
+        self.assertEqual(len(matcher), 6)
+        self.assertEqual(matcher.max_length, 3)
+        self.assertEqual(matcher.find('x a b c d'.split()), [PhraseMatch(1, 4, 'a b c')])
+        self.assertEqual(matcher.find('b c d a b'.split()), [PhraseMatch(0, 3, 'b c d'), PhraseMatch(3, 5, 'a b')])
+        self.assertEqual(matcher.find(['a', None, 'b', 'c']), [PhraseMatch(2, 4, 'b c')])
+        self.assertEqual(matcher.merge(['lari-lari', 'a', '!']), ['lari-lari a', '!'])
+        self.assertEqual(PhraseMatcher([]).find(['a', 'b']), [])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            phrases = {' '.join(rng.choice('abc') for _ in range(rng.randint(2, 4))) for _ in range(6)}
+            tokens = [rng.choice('abc') for _ in range(rng.randint(0, 30))]
+            self.assertEqual(PhraseMatcher(phrases).find(tokens), self.brute_force(phrases, tokens))
+
+class TestPhraseTokenization(unittest.TestCase):
+    TEXT = "Angin timur a bajak laut datang, angin\ntimur ra. Anak tiri lari-lari!"
+
+    def setUp(self):
+        self.lexicon = Lexicon(['angin timur', 'bajak laut', 'anak tiri', 'laut datang pagi'])
+
+    def test_tokenize_merges_phrases(self):
+        tokenizer = Tokenizer(lexicon=self.lexicon, phrases=True)
+        self.assertEqual(tokenizer.tokenize(self.TEXT),
+                         ['Angin', 'timur', 'a', 'bajak laut', 'datang', ',', 'angin timur', 'ra', '.',
+                          'Anak', 'tiri', 'lari-lari', '!'])
+        self.assertEqual(Tokenizer(lexicon=self.lexicon).tokenize('bajak laut')[0], 'bajak')
+        # Entries added later are matched too.
+        self.lexicon.add_words(['Anak tiri'])
+        self.assertIn('Anak tiri', tokenizer.tokenize(self.TEXT))
+
+    def test_paragog_and_affix_modes(self):
+        tokenizer = Tokenizer(lexicon=self.lexicon, phrases=True, normalize_paragog=True, use_suffix=True)
+        tokens = tokenizer.tokenize("bajak laut ra pagi, bajak laut, angin timur a")
+        # A word that absorbed a paragog particle is kept out of phrases.
+        self.assertEqual(tokens, ['bajak', 'lautra', 'pagi', ',', 'bajak laut', ',', 'angin', 'timu', '_ra'])
+
+    def test_spans_stream_and_profiling_agree(self):
+        for options in ({}, {'normalize_paragog': True}, {'use_suffix': True, 'use_prefix': True}):
+            tokenizer = Tokenizer(lexicon=self.lexicon, phrases=True, **options)
+            text = self.TEXT * 5
+            tokens = tokenizer.tokenize(text)
+            spans = tokenizer.tokenize_spans(text)
+            self.assertEqual(spans.tokens(), tokens)
+            self.assertIn(TOKEN_PHRASE, [kind for _, _, kind in spans.spans()])
+            for size in (1, 3, 7, 40):
+                chunks = [text[i:i + size] for i in range(0, len(text), size)]
+                self.assertEqual(list(tokenizer.tokenize_stream(chunks)), tokens)
+            tokenizer.enable_profiling()
+            self.assertEqual(tokenizer.tokenize(text), tokens)
+            self.assertEqual(tokenizer.profiler.snapshot()['counters']['phrase_merges'], 10)
+            tokenizer.disable_profiling()
+            self.assertEqual(pickle.loads(pickle.dumps(tokenizer)).tokenize(text), tokens)
+
+    def test_phrase_with_reduplication_is_counted_once(self):
+        tokenizer = Tokenizer(lexicon=Lexicon(['anak far-farara']), phrases=True)
+        profiler = tokenizer.enable_profiling()
+        self.assertEqual(tokenizer.tokenize('anak far-farara, far-farara'), ['anak far-farara', ',', 'far-farara'])
+        counters = profiler.snapshot()['counters']
+        self.assertEqual((counters['phrase_merges'], counters['reduplications']), (1, 1))
+
+    def test_cache_and_session(self):
+        tokenizer = Tokenizer(lexicon=self.lexicon, phrases=True)
+        with tempfile.TemporaryDirectory() as directory:
+            with CachedTokenizer(os.path.join(directory, 'cache.db'), tokenizer) as cached:
+                self.assertNotEqual(cached.fingerprint, CachedTokenizer(cached.cache).fingerprint)
+                expected = tokenizer.tokenize(self.TEXT)
+                self.assertEqual(cached.tokenize(self.TEXT), expected)
+                self.assertEqual(cached.tokenize(self.TEXT), expected)
+                self.assertEqual(cached.cache.hits, 1)
+        with self.assertRaises(ValueError):
+            TokenizationSession(self.TEXT, tokenizer)
+
+if __name__ == '__main__':
+    unittest.main()
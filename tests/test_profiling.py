@@ -0,0 +1,91 @@
+import os
+import pickle
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import Tokenizer
+from seram_tokenizer.profiling import COUNTERS, STAGES
+
+class TestPipelineProfiler(unittest.TestCase):
+    TEXT = "aku fas anggur a tura fudicastelara. Si dafakaleus, lari-lari a!"
+
+    def test_disabled_by_default(self):
+        tokenizer = Tokenizer(use_suffix=True)
+        self.assertIsNone(tokenizer.profiler)
+        tokenizer.tokenize(self.TEXT)
+
+    def test_profiling_keeps_tokens(self):
+        for options in ({}, {'use_suffix': True, 'use_prefix': True},
+                        {'use_suffix': True, 'normalize_paragog': True}):
+            plain = Tokenizer(**options)
+            profiled = Tokenizer(**options)
+            profiled.enable_profiling()
+            self.assertEqual(profiled.tokenize(self.TEXT), plain.tokenize(self.TEXT))
+            self.assertEqual(list(profiled.tokenize_stream([self.TEXT[:20], self.TEXT[20:]])),
+                             plain.tokenize(self.TEXT))
+
+    def test_stage_timings_and_counters(self):
+        tokenizer = Tokenizer(use_suffix=True, use_prefix=True, normalize_paragog=True)
+        profiler = tokenizer.enable_profiling()
+        tokens = tokenizer.tokenize_batch([self.TEXT, self.TEXT])
+        snapshot = profiler.snapshot()
+
+        self.assertEqual(sorted(snapshot['stages']), sorted(STAGES))
+        self.assertEqual(sorted(snapshot['counters']), sorted(COUNTERS))
+        self.assertEqual(snapshot['stages']['scan']['calls'], 2)
+        self.assertEqual(snapshot['stages']['affix']['calls'], 2)
+        self.assertGreater(snapshot['stages']['scan']['seconds'], 0)
+        self.assertEqual(snapshot['stages']['affix']['tokens'], sum(map(len, tokens)))
+
+        counters = snapshot['counters']
+        self.assertEqual(counters['texts'], 2)
+        self.assertEqual(counters['tokens'], sum(map(len, tokens)))
+        self.assertEqual(counters['reduplications'], 2)
+        self.assertEqual(counters['paragog_merges'], 2)
+        self.assertEqual(counters['suffix_splits'],
+                         sum(token.startswith('_') for row in tokens for token in row))
+        self.assertEqual(counters['prefix_splits'],
+                         sum(token.endswith('_') for row in tokens for token in row))
+        self.assertGreater(counters['prefix_splits'], 0)
+        self.assertGreater(snapshot['cache']['hits'], 0)
+
+    def test_spans_stage(self):
+        tokenizer = Tokenizer(use_suffix=True)
+        profiler = tokenizer.enable_profiling()
+        spans = tokenizer.tokenize_spans(self.TEXT)
+        stage = profiler.snapshot()['stages']['spans']
+        self.assertEqual((stage['calls'], stage['tokens']), (1, len(spans)))
+
+    def test_reset(self):
+        tokenizer = Tokenizer(use_suffix=True)
+        profiler = tokenizer.enable_profiling()
+        tokenizer.tokenize(self.TEXT)
+        profiler.reset()
+        snapshot = profiler.snapshot()
+        self.assertEqual(snapshot['counters'], dict.fromkeys(COUNTERS, 0))
+        self.assertEqual(snapshot['stages']['scan']['calls'], 0)
+        self.assertEqual(snapshot['cache']['misses'], 0)
+        self.assertGreater(snapshot['cache']['size'], 0)
+
+        tokenizer.tokenize(self.TEXT)
+        tokenizer.clear_cache()
+        self.assertEqual(profiler.snapshot()['cache']['hits'], 0)
+
+    def test_callback(self):
+        events = []
+        tokenizer = Tokenizer(use_suffix=True)
+        tokenizer.enable_profiling(callback=lambda stage, seconds, tokens: events.append((stage, tokens)))
+        tokens = tokenizer.tokenize(self.TEXT)
+        self.assertEqual([stage for stage, _ in events], ['scan', 'affix'])
+        self.assertEqual(events[-1][1], len(tokens))
+
+    def test_disable_and_pickle(self):
+        tokenizer = Tokenizer(use_suffix=True)
+        tokenizer.enable_profiling(callback=lambda *args: None)
+        copy = pickle.loads(pickle.dumps(tokenizer))
+        self.assertIsNone(copy.profiler)
+        tokenizer.disable_profiling()
+        self.assertIsNone(tokenizer.profiler)
+
+if __name__ == '__main__':
+    unittest.main()
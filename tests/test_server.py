@@ -0,0 +1,123 @@
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import Tokenizer
+from seram_tokenizer.server import HTTPError, TokenizationClient, TokenizationServer
+
+class TestTokenizationServer(unittest.TestCase):
+    TEXTS = ["aku fas anggura tura fudicastelara.", "Si dafakaleus ayaira", "", "lari-lari!"]
+
+    def run_with_server(self, test, **options):
+        options.setdefault('executor', 'thread')
+        options.setdefault('workers', 2)
+
+        async def run():
+            async with TokenizationServer(use_suffix=True, use_prefix=True, **options) as server:
+                await test(server, TokenizationClient.for_server(server))
+        asyncio.run(run())
+
+    def test_tokenize_matches_tokenizer(self):
+        expected = Tokenizer(use_suffix=True, use_prefix=True).tokenize_batch(self.TEXTS)
+
+        async def test(server, client):
+            self.assertEqual(await client.tokenize(self.TEXTS[0]), expected[0])
+            self.assertEqual(await client.tokenize_batch(self.TEXTS), expected)
+            self.assertEqual(await client.tokenize(self.TEXTS[1], language='geser'), expected[1])
+        self.run_with_server(test)
+
+    def test_process_pool(self):
+        expected = Tokenizer(use_suffix=True, use_prefix=True).tokenize_batch(self.TEXTS)
+
+        async def test(server, client):
+            results = await asyncio.gather(*(client.tokenize(text) for text in self.TEXTS))
+            self.assertEqual(results, expected)
+        self.run_with_server(test, executor='process', workers=1)
+
+    def test_concurrent_requests_are_batched(self):
+        async def test(server, client):
+            results = await asyncio.gather(*(server.tokenize(f"aku {index}") for index in range(50)))
+            self.assertEqual(results[7], ['aku', '7'])
+            await client.tokenize_batch(["aku", "nugu"])
+            stats = await client.stats()
+            self.assertEqual(stats['requests'], 1)
+            self.assertEqual(stats['texts'], 52)
+            self.assertLess(stats['batches'], 50)
+            self.assertLessEqual(stats['mean_batch_size'], 16)
+            self.assertGreater(stats['latency_p99_ms'], 0)
+            self.assertEqual(stats['queue_depth'], 0)
+        self.run_with_server(test, max_batch_size=16, max_wait=0.05)
+
+    def test_backpressure(self):
+        async def test(server, client):
+            results = await asyncio.gather(*(server.tokenize("aku") for _ in range(20)),
+                                           return_exceptions=True)
+            rejected = [result for result in results if isinstance(result, HTTPError)]
+            self.assertTrue(rejected)
+            self.assertEqual(rejected[0].status, 503)
+            self.assertEqual(server.stats.rejected, len(rejected))
+            self.assertLessEqual(server.stats.max_queue_depth, 2)
+            self.assertIn(['aku'], results)
+        self.run_with_server(test, queue_size=2, max_batch_size=1, workers=1)
+
+    def test_errors(self):
+        async def test(server, client):
+            self.assertEqual((await client.request('GET', '/missing'))[0], 404)
+            self.assertEqual((await client.request('GET', '/tokenize'))[0], 405)
+            self.assertEqual((await client.request('POST', '/tokenize', {'text': 1}))[0], 400)
+            self.assertEqual((await client.request('POST', '/tokenize', [1]))[0], 400)
+            status, response = await client.request('POST', '/tokenize',
+                                                    {'text': 'aku', 'language': 'klingon'})
+            self.assertEqual(status, 400)
+            self.assertIn('klingon', response['error'])
+            with self.assertRaises(HTTPError):
+                await client.tokenize_batch(['aku', 2])
+        self.run_with_server(test)
+
+    def test_malformed_requests_get_a_response(self):
+        async def send(server, raw):
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            try:
+                writer.write(raw)
+                await writer.drain()
+                status = int((await reader.readline()).split()[1])
+                # The connection is closed after the response.
+                while await reader.read(1024):
+                    pass
+                return status
+            finally:
+                writer.close()
+
+        async def test(server, client):
+            head = b"POST /tokenize HTTP/1.1\r\nContent-Length: "
+            self.assertEqual(await send(server, head + b"abc\r\n\r\n"), 400)
+            self.assertEqual(await send(server, head + b"-5\r\n\r\n"), 400)
+            self.assertEqual(await send(server, head + b"999999999999\r\n\r\n"), 413)
+            self.assertEqual(await send(server, b"GET /" + b"a" * 70000 + b" HTTP/1.1\r\n\r\n"), 400)
+            self.assertEqual(await send(server, b"nonsense\r\n\r\n"), 400)
+            fields = b"".join(b"X-Field: %d\r\n" % index for index in range(101))
+            self.assertEqual(await send(server, b"GET /stats HTTP/1.1\r\n" + fields + b"\r\n"), 431)
+            # The server keeps serving.
+            self.assertEqual(await client.tokenize("aku"), ['aku'])
+        self.run_with_server(test)
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix sockets are not available")
+    def test_unix_socket(self):
+        with tempfile.TemporaryDirectory() as directory:
+            async def test(server, client):
+                self.assertEqual(await client.tokenize("lari-lari!"), ['lari-lari', '!'])
+            self.run_with_server(test, unix_path=os.path.join(directory, 'tokenizer.sock'))
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            TokenizationServer(max_batch_size=0)
+        with self.assertRaises(ValueError):
+            TokenizationServer(max_wait=-1)
+        with self.assertRaises(ValueError):
+            TokenizationServer(executor='fiber')
+
+if __name__ == '__main__':
+    unittest.main()
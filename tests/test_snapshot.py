@@ -0,0 +1,100 @@
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from unittest import mock
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import Tokenizer
+from seram_tokenizer.lexicon import Lexicon, get_lexicon
+from seram_tokenizer.parallel import ParallelTokenizer
+from seram_tokenizer.snapshot import build_snapshot, main, open_snapshot
+
+SECTIONS = ('words', 'single_words', 'multi_words', 'lemma_with_ra', 'lemma_with_a',
+            'lemma_with_na', 'lemma_with_da', 'vowels', 'consonants', 'pronouns')
+
+class TestLexiconSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'geser.lexbin')
+        build_snapshot(get_lexicon(), self.path)
+        self.snapshot = open_snapshot(self.path)
+
+    def tearDown(self):
+        self.snapshot.close()
+        self.tmp.cleanup()
+
+    def test_sections_match_source_lexicon(self):
+        source = get_lexicon()
+        for name in SECTIONS:
+            mapped = getattr(self.snapshot, name)
+            self.assertEqual(len(mapped), len(getattr(source, name)), name)
+            self.assertEqual(set(mapped), set(getattr(source, name)), name)
+        self.assertIn('abi-abis', self.snapshot.words)
+        self.assertNotIn('abi-abi', self.snapshot.words)
+        self.assertNotIn(None, self.snapshot.words)
+
+    def test_tokenizer_on_snapshot(self):
+        text = "aku fas anggura tura fudicastelara. Si dafakaleus ayaira"
+        expected = Tokenizer(use_suffix=True, use_prefix=True).tokenize(text)
+        tokenizer = Tokenizer(use_suffix=True, use_prefix=True, lexicon=self.snapshot)
+        self.assertEqual(tokenizer.tokenize(text), expected)
+
+    def test_pickle_reopens_snapshot(self):
+        copy = pickle.loads(pickle.dumps(self.snapshot))
+        self.assertEqual(set(copy.lemma_with_ra), set(self.snapshot.lemma_with_ra))
+        copy.close()
+
+    def test_parallel_workers_share_snapshot(self):
+        texts = ["aku fas anggura tura fudicastelara.", "Si dafakaleus ayaira"] * 5
+        parallel = ParallelTokenizer(workers=2, chunk_size=2, use_suffix=True, lexicon=self.snapshot)
+        self.assertEqual(list(parallel.tokenize_corpus(texts)),
+                         Tokenizer(use_suffix=True).tokenize_batch(texts))
+
+    def test_read_only_and_invalid_file(self):
+        with self.assertRaises(TypeError):
+            self.snapshot.add_words(['baru'])
+        bogus = os.path.join(self.tmp.name, 'bogus.bin')
+        with open(bogus, 'wb') as file:
+            file.write(b'NOTALEXICON' * 4)
+        with self.assertRaises(ValueError):
+            open_snapshot(bogus)
+
+    def test_truncated_files_are_rejected_and_unmapped(self):
+        with open(self.path, 'rb') as file:
+            data = file.read()
+        truncated = os.path.join(self.tmp.name, 'truncated.lexbin')
+        buffers = []
+
+        def mapped(*args, **kwargs):
+            buffers.append(real_mmap(*args, **kwargs))
+            return buffers[-1]
+
+        real_mmap = mmap.mmap
+        for size in (2, 40, len(data) // 2):
+            with open(truncated, 'wb') as file:
+                file.write(data[:size])
+            with mock.patch('seram_tokenizer.snapshot.mmap.mmap', mapped), self.assertRaises(ValueError):
+                open_snapshot(truncated)
+        with open(truncated, 'wb') as file:
+            file.write(b'NOTALEXICON' * 4)
+        with mock.patch('seram_tokenizer.snapshot.mmap.mmap', mapped), self.assertRaises(ValueError):
+            open_snapshot(truncated)
+        self.assertEqual(len(buffers), 4)
+        self.assertTrue(all(buffer.closed for buffer in buffers))
+
+    def test_custom_lexicon_and_command_line(self):
+        path = os.path.join(self.tmp.name, 'custom.lexbin')
+        build_snapshot(Lexicon(['kata', 'ada baru', 'nasi'], vowels='aiueo', consonants='bcdt'), path)
+        custom = open_snapshot(path)
+        self.assertEqual(set(custom.multi_words), {'ada baru'})
+        self.assertEqual(set(custom.lemma_with_na), {'nasi'})
+        custom.close()
+        self.assertEqual(main([path]), 0)
+        rebuilt = open_snapshot(path)
+        self.assertEqual(len(rebuilt.words), len(get_lexicon().words))
+        rebuilt.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import Tokenizer
+from seram_tokenizer.lexicon import Lexicon
+from seram_tokenizer.spans import (TOKEN_PREFIX, TOKEN_PUNCTUATION, TOKEN_REDUPLICATION,
+                                   TOKEN_SUFFIX, TOKEN_WORD)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TestTokenSpans(unittest.TestCase):
+    TEXT = "aku fas anggur a tura fudicastelara. Si dafakaleus ayaira, lari-lari a!"
+
+    def test_tokens_match_tokenize_in_every_mode(self):
+        for use_suffix in (False, True):
+            for use_prefix in (False, True):
+                for normalize in (False, True):
+                    tokenizer = Tokenizer(use_suffix=use_suffix, use_prefix=use_prefix,
+                                          normalize_paragog=normalize)
+                    self.assertEqual(tokenizer.tokenize_spans(self.TEXT).tokens(),
+                                     tokenizer.tokenize(self.TEXT))
+
+    def test_offsets_and_kinds(self):
+        text = "Si dafakaleus, fudicastelara lari-lari"
+        spans = Tokenizer(use_suffix=True, use_prefix=True).tokenize_spans(text)
+        self.assertEqual([(text[start:end], kind) for start, end, kind in spans.spans()], [
+            ("Si", TOKEN_WORD),
+            ("da", TOKEN_PREFIX),
+            ("fakaleus", TOKEN_WORD),
+            (",", TOKEN_PUNCTUATION),
+            ("fudicastela", TOKEN_WORD),
+            ("ra", TOKEN_SUFFIX),
+            ("lari-lari", TOKEN_REDUPLICATION),
+        ])
+        self.assertEqual(spans.starts.typecode, 'i')
+
+    def test_paragog_merge_spans_the_particle(self):
+        text = "anggur a tura"
+        spans = Tokenizer(use_suffix=True, normalize_paragog=True).tokenize_spans(text)
+        self.assertEqual(list(spans.spans()), [(0, 5, TOKEN_WORD), (5, 8, TOKEN_SUFFIX), (9, 13, TOKEN_WORD)])
+        self.assertEqual(spans[1], "_ra")
+
+    def test_empty_base(self):
+        lexicon = Lexicon(["kata"], vowels="aiueo", consonants="bcdfgklmnprstw")
+        spans = Tokenizer(use_prefix=True, lexicon=lexicon).tokenize_spans("na")
+        self.assertEqual(list(spans.spans()), [(0, 2, TOKEN_PREFIX), (2, 2, TOKEN_WORD)])
+        self.assertEqual(spans.tokens(), ["na_", ""])
+
+    def test_empty_text_and_invalid_input(self):
+        self.assertEqual(len(Tokenizer().tokenize_spans("")), 0)
+        with self.assertRaises(TypeError):
+            Tokenizer().tokenize_spans(None)
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_to_numpy(self):
+        spans = Tokenizer().tokenize_spans("aku nugu.")
+        starts, ends, kinds = spans.to_numpy()
+        self.assertEqual(starts.tolist(), [0, 4, 8])
+        self.assertEqual(ends.tolist(), [3, 8, 9])
+        self.assertEqual(kinds.tolist(), [TOKEN_WORD, TOKEN_WORD, TOKEN_PUNCTUATION])
+
+if __name__ == '__main__':
+    unittest.main()
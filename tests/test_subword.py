@@ -0,0 +1,126 @@
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from collections import Counter
+from contextlib import redirect_stderr
+from io import StringIO
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import Lexicon, SeramTokenizer, Tokenizer
+from seram_tokenizer.cache import tokenizer_fingerprint
+from seram_tokenizer.subword import SubwordModel, _learn_merges, _merge, main
+
+DATASET = os.path.join(os.path.dirname(__file__), '..', 'dataset_seram_geser.csv')
+
+class TestSubwordModel(unittest.TestCase):
+    TEXTS = ["habiba nafakaleus habiba", "dafakaleus fudicastelara habiba", "fakaleus anggurara"] * 3
+
+    def setUp(self):
+        self.lexicon = Lexicon(['anggur', 'fakaleus'])
+        self.model = SubwordModel.train(self.TEXTS, vocab_size=40, lexicon=self.lexicon, include_lexicon=False)
+
+    def test_seeding_with_lexicon_and_affixes(self):
+        # Lemmas are never split, and frequent words are learned whole.
+        self.assertEqual(self.model.split('fakaleus'), ('fakaleus',))
+        self.assertEqual(self.model.split('habiba'), ('habiba',))
+        # Affixes the rules split off start as one unit and keep their markers.
+        self.assertEqual(self.model.split('dafakaleus'), ('da_', 'fakaleus'))
+        self.assertEqual(self.model.split('nafakaleus'), ('na_', 'fakaleus'))
+        self.assertEqual(self.model.split('tagira')[-1], '_ra')
+        # Words outside the rules' scope are left alone.
+        self.assertEqual(self.model.split('Habiba'), ('Habiba',))
+        self.assertEqual(self.model.split('x'), ('x',))
+        pieces = self.model.split('habibra')
+        self.assertEqual(''.join(piece.strip('_') for piece in pieces), 'habibra')
+        self.assertTrue(all(piece.startswith('_') for piece in pieces[1:]))
+
+    def test_incremental_training_matches_recounting(self):
+        self.model.splitter()
+        counts = Counter(word for text in self.TEXTS for word in text.split())
+        words = [self.model._seed(word)[0] for word in counts]
+        frequencies = list(counts.values())
+
+        expected = []
+        symbols = [list(word) for word in words]
+        while True:
+            pairs = Counter()
+            for word, frequency in zip(symbols, frequencies):
+                for pair in zip(word, word[1:]):
+                    pairs[pair] += frequency
+            if not pairs:
+                break
+            best = min(pairs, key=lambda pair: (-pairs[pair], pair))
+            if pairs[best] < 2:
+                break
+            expected.append(best)
+            symbols = [_merge(word, best) for word in symbols]
+
+        self.assertEqual(_learn_merges([list(word) for word in words], frequencies, 1000, 2), expected)
+
+    def test_vocab_size_and_lexicon_change(self):
+        small = SubwordModel.train(self.TEXTS, vocab_size=5, lexicon=self.lexicon)
+        self.assertEqual(len(small), 0)
+        with self.assertRaises(ValueError):
+            SubwordModel.train(self.TEXTS, vocab_size=0)
+
+        self.assertNotEqual(self.model.split('fudicastelara'), ('fudicastelara',))
+        self.lexicon.add_words(['fudicastelara'])
+        self.assertEqual(self.model.split('fudicastelara'), ('fudicastelara',))
+
+    def test_tokenizer_integration(self):
+        tokenizer = Tokenizer(subword=self.model, normalize_paragog=True)
+        text = "Si dafakaleus habiba a, lari-lari fudicastelara!"
+        tokens = tokenizer.tokenize(text)
+        self.assertEqual(tokens[:4], ['Si', 'da_', 'fakaleus', 'habiba'])
+        self.assertEqual(tokenizer.tokenize_spans(text).tokens(), tokens)
+        self.assertEqual(list(tokenizer.tokenize_stream([text[:20], text[20:]])), tokens)
+        self.assertEqual(SeramTokenizer(text, subword=self.model, normalize_paragog=True).tokenize(), tokens)
+        self.assertEqual(pickle.loads(pickle.dumps(tokenizer)).tokenize(text), tokens)
+        self.assertNotEqual(tokenizer_fingerprint(tokenizer),
+                            tokenizer_fingerprint(Tokenizer(normalize_paragog=True)))
+        with self.assertRaises(ValueError):
+            Tokenizer(use_suffix=True, subword=self.model)
+
+    def test_cache_info_reports_the_subword_cache(self):
+        tokenizer = Tokenizer(subword=self.model)
+        tokenizer.clear_cache()
+        profiler = tokenizer.enable_profiling()
+        tokenizer.tokenize_batch(self.TEXTS)
+        info = tokenizer.cache_info()
+        self.assertEqual(info, self.model.cache_info())
+        # 24 words, 6 of them distinct.
+        self.assertEqual((info['size'], info['hits'], info['misses']), (6, 18, 6))
+        self.assertEqual(profiler.snapshot()['cache']['hits'], 18)
+        # Learned pieces count as subword splits, not affix splits.
+        counters = profiler.snapshot()['counters']
+        self.assertEqual((counters['suffix_splits'], counters['prefix_splits']), (0, 0))
+        # 'nafakaleus', 'dafakaleus' and 'fudicastelara', three times each.
+        self.assertEqual(counters['subword_splits'], 9)
+
+        self.lexicon.add_words(['habiba'])
+        tokenizer.tokenize('habiba')
+        info = tokenizer.cache_info()
+        self.assertEqual((info['size'], info['hits'], info['invalidations']), (1, 18, 1))
+
+    def test_save_load_and_command_line(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'model.json')
+            self.model.save(path)
+            loaded = SubwordModel.load(path, lexicon=self.lexicon)
+            self.assertEqual(loaded.merges, self.model.merges)
+            self.assertEqual(loaded.split('dafakaleus'), self.model.split('dafakaleus'))
+
+            with redirect_stderr(StringIO()):
+                self.assertEqual(main([DATASET, path, '--csv-column', '1', '--vocab-size', '300']), 0)
+            model = SubwordModel.load(path)
+            self.assertGreater(len(model), 0)
+            self.assertEqual(Tokenizer(subword=model).tokenize('aku tagi'), ['aku', 'tagi'])
+
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write('[]')
+            with self.assertRaises(ValueError):
+                SubwordModel.load(path)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,11 @@
 import unittest
 import os
+import pickle
 import sys
+import tempfile
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from seram_tokenizer import SeramTokenizer
+from seram_tokenizer import SeramTokenizer, Tokenizer
+from seram_tokenizer.lexicon import Lexicon
 from seram_tokenizer.find_words import find_unmatched_words
 from seram_tokenizer.find_words import DICTIONARY_WORDS
 
@@ -47,6 +50,127 @@ class TestGeserTokenizer(unittest.TestCase):
         expected_subset = {"Dia", "suka", "lari-lari", "di", "pagi", "hari", "dan", "makan-makan", "yang", "enak"}
         self.assertTrue(expected_subset.issubset(set(tokens)))
 
+    def test_reduplication_heavy_text_is_scanned_once(self):
+        class CountingPattern:
+            def __init__(self, pattern):
+                self.pattern = pattern
+                self.calls = 0
+
+            def findall(self, text):
+                self.calls += 1
+                return self.pattern.findall(text)
+
+        unit = "dia lari-lari{0} ke pasar, makan-makan{0} di sana. "
+        large = "".join(unit.format(i) for i in range(16000))
+        tokenizer = Tokenizer()
+        pattern = tokenizer.token_pattern = CountingPattern(tokenizer.token_pattern)
+        self.assertEqual(tokenizer.tokenize(large), SeramTokenizer(large).tokenize())
+        self.assertEqual(len(tokenizer.tokenize(large)), 16000 * 9)
+        # One scan per text, however many distinct reduplications it holds; the
+        # old placeholder loop rewrote the text once per reduplication.
+        self.assertEqual(pattern.calls, 2)
+
+class TestReusableTokenizer(unittest.TestCase):
+    def test_reuse_across_texts(self):
+        tokenizer = Tokenizer()
+        self.assertEqual(tokenizer.tokenize("aku nugu, lari-lari."), ["aku", "nugu", ",", "lari-lari", "."])
+        self.assertEqual(tokenizer.tokenize(""), [])
+        self.assertEqual(tokenizer.tokenize("Si dafakaleus"), ["Si", "dafakaleus"])
+
+    def test_matches_compatibility_wrapper(self):
+        texts = ["aku fas anggura tura fudicastelara.", "Si dafakaleus ayaira", "", "nasi-nasi 123 ."]
+        tokenizer = Tokenizer(use_suffix=True, use_prefix=True)
+        for text in texts:
+            self.assertEqual(tokenizer.tokenize(text),
+                             SeramTokenizer(text, use_suffix=True, use_prefix=True).tokenize())
+
+    def test_tokenize_batch(self):
+        texts = ["fudicastelara ayaira", "ayaira dafakaleus", ""]
+        tokenizer = Tokenizer(use_suffix=True, use_prefix=True)
+        self.assertEqual(tokenizer.tokenize_batch(iter(texts)),
+                         [tokenizer.tokenize(text) for text in texts])
+
+    def test_custom_lexicon(self):
+        # 'dafakaleus' is a lemma in this lexicon, so the prefix stays attached.
+        tokenizer = Tokenizer(use_prefix=True, lexicon={"dafakaleus", "ayai ra"})
+        self.assertEqual(tokenizer.tokenize("dafakaleus dasi"), ["dafakaleus", "da_", "si"])
+
+    def test_invalid_input_type(self):
+        tokenizer = Tokenizer()
+        with self.assertRaises(TypeError):
+            tokenizer.tokenize(None)
+        with self.assertRaises(TypeError):
+            tokenizer.tokenize_batch("not a list")
+        with self.assertRaises(TypeError):
+            tokenizer.tokenize_batch(["ok", 1])
+
+class TestAffixCache(unittest.TestCase):
+    def test_repeated_words_hit_the_cache(self):
+        tokenizer = Tokenizer(use_suffix=True, use_prefix=True)
+        tokenizer.tokenize_batch(["ayaira fudicastelara ayaira", "ayaira dafakaleus"])
+        info = tokenizer.cache_info()
+        self.assertEqual(info['misses'], 3)
+        self.assertEqual(info['hits'], 2)
+        self.assertEqual(info['size'], 3)
+
+    def test_capacity_and_evictions(self):
+        tokenizer = Tokenizer(use_suffix=True, cache_size=2)
+        self.assertEqual(tokenizer.tokenize("satu dua tiga satu"), ["satu", "dua", "tig", "_a", "satu"])
+        info = tokenizer.cache_info()
+        self.assertEqual((info['capacity'], info['size'], info['evictions']), (2, 2, 2))
+        tokenizer.clear_cache()
+        self.assertEqual(tokenizer.cache_info()['misses'], 0)
+        with self.assertRaises(ValueError):
+            Tokenizer(cache_size=-1)
+
+    def test_lexicon_change_invalidates_cache(self):
+        lexicon = Lexicon(["kata"], vowels="aiueo", consonants="bcdfgklmnprstw")
+        tokenizer = Tokenizer(use_suffix=True, lexicon=lexicon)
+        self.assertEqual(tokenizer.tokenize("ayaira"), ["ayai", "_ra"])
+        lexicon.add_words(["ayaira"])
+        self.assertEqual(tokenizer.tokenize("ayaira"), ["ayaira"])
+        self.assertEqual(tokenizer.cache_info()['invalidations'], 1)
+        self.assertEqual(tokenizer.cache_info()['misses'], 2)
+
+    def test_disabled_cache_and_pickling(self):
+        text = "aku fas anggura tura fudicastelara. Si dafakaleus ayaira"
+        expected = Tokenizer(use_suffix=True, use_prefix=True).tokenize(text)
+        self.assertEqual(Tokenizer(use_suffix=True, use_prefix=True, cache_size=0).tokenize(text), expected)
+        copy = pickle.loads(pickle.dumps(Tokenizer(use_suffix=True, use_prefix=True)))
+        self.assertEqual(copy.tokenize(text), expected)
+
+class TestStreamingTokenizer(unittest.TestCase):
+    TEXT = "Dia suka lari-lari di pagi hari, makan-makan... Si dafakaleus ayaira!\n(tutup) 123 abi-abis."
+
+    def chunked(self, text, size):
+        return (text[i:i + size] for i in range(0, len(text), size))
+
+    def test_chunk_boundaries_match_whole_text(self):
+        tokenizer = Tokenizer(use_suffix=True, use_prefix=True)
+        expected = tokenizer.tokenize(self.TEXT)
+        for size in range(1, 12):
+            self.assertEqual(list(tokenizer.tokenize_stream(self.chunked(self.TEXT, size))), expected)
+
+    def test_stream_is_lazy(self):
+        tokenizer = Tokenizer()
+        tokens = tokenizer.tokenize_stream(iter(["aku nugu ", "ngasana"]))
+        self.assertEqual(next(tokens), "aku")
+
+    def test_tokenize_file(self):
+        tokenizer = Tokenizer(use_suffix=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "corpus.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(self.TEXT * 50)
+            self.assertEqual(list(tokenizer.tokenize_file(path, chunk_size=7)),
+                             tokenizer.tokenize(self.TEXT * 50))
+            with self.assertRaises(ValueError):
+                list(tokenizer.tokenize_file(path, chunk_size=0))
+
+    def test_invalid_chunk_type(self):
+        with self.assertRaises(TypeError):
+            list(Tokenizer().tokenize_stream(["ok ", 1]))
+
 class TestFindUnmatchedWords(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -0,0 +1,111 @@
+import os
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from seram_tokenizer import Tokenizer, Vocabulary
+from seram_tokenizer.vocab import DEFAULT_SPECIAL_TOKENS, PAD_TOKEN, UNK_TOKEN
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TestVocabulary(unittest.TestCase):
+    TEXTS = ["aku fas nugu", "aku nugu.", "aku tura fudicastelara"]
+
+    def setUp(self):
+        self.tokenizer = Tokenizer(use_suffix=True)
+        self.vocab = Vocabulary.build(self.TEXTS, self.tokenizer)
+
+    def test_build_ranks_by_frequency(self):
+        specials = len(DEFAULT_SPECIAL_TOKENS)
+        self.assertEqual(self.vocab.tokens[:specials], list(DEFAULT_SPECIAL_TOKENS))
+        self.assertEqual(self.vocab.tokens[specials:specials + 2], ['aku', 'nugu'])
+        self.assertEqual(self.vocab.pad_id, 0)
+        self.assertEqual(self.vocab.unk_id, 1)
+
+    def test_min_count_and_max_size(self):
+        vocab = Vocabulary.build(self.TEXTS, self.tokenizer, min_count=2)
+        self.assertEqual(vocab.tokens[len(DEFAULT_SPECIAL_TOKENS):], ['aku', 'nugu'])
+        vocab = Vocabulary.build(self.TEXTS, self.tokenizer, max_size=len(DEFAULT_SPECIAL_TOKENS) + 1)
+        self.assertEqual(len(vocab), len(DEFAULT_SPECIAL_TOKENS) + 1)
+
+    def test_invalid_build_options(self):
+        with self.assertRaises(ValueError):
+            Vocabulary.build(self.TEXTS, min_count=0)
+        with self.assertRaises(ValueError):
+            Vocabulary.build(self.TEXTS, max_size=1)
+        with self.assertRaises(ValueError):
+            Vocabulary(['aku'], special_tokens=[UNK_TOKEN])
+        with self.assertRaises(ValueError):
+            Vocabulary(['aku', 'aku'])
+
+    def test_unknown_tokens(self):
+        self.assertEqual(self.vocab.token_to_id('xyz'), self.vocab.unk_id)
+        self.assertEqual(self.vocab.encode(['aku', 'xyz']),
+                         [self.vocab.token_to_id('aku'), self.vocab.unk_id])
+        self.assertNotIn('xyz', self.vocab)
+        self.assertIn(PAD_TOKEN, self.vocab)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'vocab.json')
+            self.vocab.save(path)
+            loaded = Vocabulary.load(path)
+        self.assertEqual(loaded.tokens, self.vocab.tokens)
+        self.assertEqual(loaded.special_tokens, self.vocab.special_tokens)
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestEncodeBatch(unittest.TestCase):
+    TEXTS = ["aku fas nugu", "aku nugu.", "aku tura fudicastelara"]
+
+    def setUp(self):
+        self.tokenizer = Tokenizer(use_suffix=True)
+        self.vocab = Vocabulary.build(self.TEXTS, self.tokenizer)
+        self.rows = self.tokenizer.tokenize_batch(self.TEXTS)
+
+    def test_ragged(self):
+        batch = self.vocab.encode_batch(self.TEXTS, self.tokenizer)
+        self.assertFalse(batch.padded)
+        self.assertEqual(batch.values.dtype, numpy.int32)
+        self.assertEqual(batch.lengths.tolist(), [len(row) for row in self.rows])
+        for index, row in enumerate(self.rows):
+            self.assertEqual(batch.row(index).tolist(), self.vocab.encode(row))
+        self.assertEqual(self.vocab.decode_batch(batch), self.rows)
+
+    def test_padded_to_longest(self):
+        batch = self.vocab.encode_batch(self.TEXTS, self.tokenizer, padding=True)
+        width = max(len(row) for row in self.rows)
+        self.assertEqual(batch.values.shape, (3, width))
+        self.assertEqual(batch.values[0, len(self.rows[0]):].tolist(),
+                         [self.vocab.pad_id] * (width - len(self.rows[0])))
+        self.assertEqual(self.vocab.decode_batch(batch), self.rows)
+
+    def test_padded_to_max_length_with_truncation(self):
+        batch = self.vocab.encode_batch(self.rows, padding='max_length', max_length=3)
+        self.assertEqual(batch.values.shape, (3, 3))
+        self.assertEqual(self.vocab.decode_batch(batch), [row[:3] for row in self.rows])
+        batch = self.vocab.encode_batch(self.rows, max_length=2, truncation='left')
+        self.assertEqual(self.vocab.decode_batch(batch), [row[-2:] for row in self.rows])
+
+    def test_mixed_and_unknown_input(self):
+        batch = self.vocab.encode_batch(["aku xyz", ['nugu', 'xyz']], self.tokenizer)
+        self.assertEqual(batch.values.tolist(), [self.vocab.token_to_id('aku'), self.vocab.unk_id,
+                                                 self.vocab.token_to_id('nugu'), self.vocab.unk_id])
+
+    def test_empty_batch(self):
+        batch = self.vocab.encode_batch([], padding=True)
+        self.assertEqual(batch.values.shape, (0, 0))
+        self.assertEqual(self.vocab.decode_batch(batch), [])
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            self.vocab.encode_batch(self.TEXTS, padding='sideways')
+        with self.assertRaises(ValueError):
+            self.vocab.encode_batch(self.TEXTS, truncation='middle')
+        with self.assertRaises(ValueError):
+            self.vocab.encode_batch(self.TEXTS, padding='max_length')
+
+if __name__ == '__main__':
+    unittest.main()